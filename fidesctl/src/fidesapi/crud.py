@@ -4,14 +4,19 @@ generated programmatically for each resource.
 """
 # pylint: disable=redefined-outer-name,cell-var-from-loop
 
-from typing import List, Dict
+from functools import partial
+from typing import Dict, List, Optional, Union
 
-from fastapi import APIRouter, status
-from sqlalchemy import update as _update
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import literal_column, orm, update as _update
+from sqlalchemy.dialects.postgresql import insert as _insert
+from sqlalchemy.orm import Session
 
 from fidesapi import db_session
 from fidesapi.sql_models import sql_model_map, SqlAlchemyBase
 from fideslang import model_map
+from fideslang.utils import get_resource_hash
 
 
 def get_resource_type(router: APIRouter) -> str:
@@ -20,74 +25,220 @@ def get_resource_type(router: APIRouter) -> str:
 
 
 # CRUD Functions
-def create_resource(sql_resource: SqlAlchemyBase) -> None:
+def create_resource(session: Session, sql_resource: SqlAlchemyBase) -> None:
     """Create a resource in the database."""
-    session = db_session.create_session()
-    try:
-        session.add(sql_resource)
-        session.commit()
-    finally:
-        session.close()
+    session.add(sql_resource)
+    session.commit()
 
 
-def get_resource(sql_model: SqlAlchemyBase, fides_key: str) -> Dict:
+def get_resource(session: Session, sql_model: SqlAlchemyBase, fides_key: str) -> Dict:
     """
     Get a resource from the databse by its FidesKey.
     """
-    session = db_session.create_session()
-    try:
-        sql_resource = (
-            session.query(sql_model).filter(sql_model.fides_key == fides_key).first()
+    return session.query(sql_model).filter(sql_model.fides_key == fides_key).first()
+
+
+def get_resources(
+    session: Session, sql_model: SqlAlchemyBase, fides_keys: List[str]
+) -> List:
+    """
+    Get all of the resources from the database that match one of the
+    FidesKeys, using a single query.
+    """
+    return session.query(sql_model).filter(sql_model.fides_key.in_(fides_keys)).all()
+
+
+def get_list_query(
+    session: Session,
+    sql_model: SqlAlchemyBase,
+    filters: Optional[Dict[str, str]] = None,
+    fides_key_prefix: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+) -> orm.Query:
+    """
+    Build the query for a list of the resources of this type,
+    ordered by their fides_key.
+
+    Only the resources whose columns equal the `filters` and whose fides_key
+    starts with `fides_key_prefix` are listed, starting after the `after`
+    fides_key and up to `limit` of them. With `fields`, only those columns
+    are queried.
+    """
+    columns = [getattr(sql_model, field) for field in fields] if fields else [sql_model]
+    query = session.query(*columns)
+    for column, value in (filters or {}).items():
+        query = query.filter(getattr(sql_model, column) == value)
+    if fides_key_prefix:
+        query = query.filter(
+            sql_model.fides_key.startswith(fides_key_prefix, autoescape=True)
         )
-    finally:
-        session.close()
-    return sql_resource
+    if after is not None:
+        query = query.filter(sql_model.fides_key > after)
+    query = query.order_by(sql_model.fides_key)
+    if limit:
+        query = query.limit(limit)
+    return query
 
 
-def list_resource(sql_model: SqlAlchemyBase) -> List:
+def list_resource(
+    session: Session,
+    sql_model: SqlAlchemyBase,
+    filters: Optional[Dict[str, str]] = None,
+    fides_key_prefix: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+) -> List:
     """
-    Get a list of all of the resources of this type from the database.
+    Get a list of the resources of this type from the database,
+    see `get_list_query`.
+
+    With `fields`, each resource is returned as a dict of only those fields.
     """
-    session = db_session.create_session()
-    try:
-        sql_resource = session.query(sql_model).all()
-    finally:
-        session.close()
-    return sql_resource
+    query = get_list_query(
+        session, sql_model, filters, fides_key_prefix, after, limit, fields
+    )
+    if fields:
+        return [row._asdict() for row in query.all()]
+    return query.all()
 
 
-def update_resource(sql_model: SqlAlchemyBase, resource_dict: Dict, fides_key: str):
-    """Update a resource in the database by its fides_key."""
-    session = db_session.create_session()
-    try:
-        session.execute(
-            _update(sql_model)
-            .where(sql_model.fides_key == fides_key)
-            .values(resource_dict)
+def get_list_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Returns the fields to list without duplicates, starting with the
+    fides_key, or None if whole resources are listed.
+    """
+    if not fields:
+        return None
+    return ["fides_key"] + [
+        field for field in dict.fromkeys(fields) if field != "fides_key"
+    ]
+
+
+def validate_list_columns(
+    sql_model: SqlAlchemyBase, resource_type: str, columns: List[str]
+) -> None:
+    """
+    Raise a 400 error if a list filters by or selects
+    columns that this type of resource doesn't have.
+    """
+    unknown_columns = [
+        column for column in columns if column not in sql_model.__table__.columns
+    ]
+    if unknown_columns:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{resource_type} has no field(s): {', '.join(unknown_columns)}",
         )
-        session.commit()
-    finally:
-        session.close()
 
-    result_sql_resource = get_resource(sql_model, fides_key)
+
+def get_next_page_headers(
+    request: Request,
+    query_result: List,
+    limit: Optional[int],
+    fields: Optional[List[str]],
+) -> Dict[str, str]:
+    """
+    Returns a Link header that points to the next page of a list,
+    if the page is full and there may be more.
+    """
+    if not limit or len(query_result) < limit:
+        return {}
+    last_resource = query_result[-1]
+    last_fides_key = last_resource["fides_key"] if fields else last_resource.fides_key
+    next_url = request.url.include_query_params(after=last_fides_key)
+    return {"Link": f'<{next_url}>; rel="next"'}
+
+
+def get_resource_hashes(
+    session: Session, sql_model: SqlAlchemyBase
+) -> Dict[str, Optional[str]]:
+    """
+    Get the content hash of every resource of this type by its fides_key.
+
+    Hashes are stored when resources are written, and by the migration that
+    added them for older resources. A resource that couldn't be parsed then
+    has a hash of None.
+    """
+    return dict(
+        session.query(sql_model.fides_key, sql_model.content_hash)
+        .order_by(sql_model.fides_key)
+        .all()
+    )
+
+
+def update_resource(
+    session: Session, sql_model: SqlAlchemyBase, resource_dict: Dict, fides_key: str
+):
+    """Update a resource in the database by its fides_key."""
+    session.execute(
+        _update(sql_model).where(sql_model.fides_key == fides_key).values(resource_dict)
+    )
+    result_sql_resource = get_resource(session, sql_model, fides_key)
+    session.commit()
     if not result_sql_resource:
         return {"error": {"message": f"{fides_key} is not an existing fides_key!"}}
 
     return result_sql_resource
 
 
-def delete_resource(sql_model: SqlAlchemyBase, fides_key: str) -> Dict:
+def upsert_resources(
+    session: Session, sql_model: SqlAlchemyBase, resource_dicts: List[Dict]
+) -> List:
+    """
+    Create or update all of the resources in a single transaction,
+    with one `INSERT ... ON CONFLICT (fides_key) DO UPDATE` statement.
+
+    Returns whether each resource was created or updated.
+    """
+    # A single statement can't upsert the same row twice, so the last one wins
+    resource_dicts = list(
+        {
+            resource_dict["fides_key"]: resource_dict
+            for resource_dict in resource_dicts
+        }.values()
+    )
+    if not resource_dicts:
+        return []
+
+    insert_statement = _insert(sql_model.__table__).values(resource_dicts)
+    upsert_statement = insert_statement.on_conflict_do_update(
+        index_elements=["fides_key"],
+        set_={
+            column: insert_statement.excluded[column]
+            for column in resource_dicts[0]
+            if column != "fides_key"
+        },
+    ).returning(
+        sql_model.__table__.c.fides_key,
+        # Rows that were just inserted don't have a deleting transaction id
+        literal_column("xmax = 0").label("created"),
+    )
+
+    upserted_rows = session.execute(upsert_statement).fetchall()
+    session.commit()
+
+    return [
+        {
+            "fides_key": upserted_row.fides_key,
+            "status": "created" if upserted_row.created else "updated",
+        }
+        for upserted_row in upserted_rows
+    ]
+
+
+def delete_resource(
+    session: Session, sql_model: SqlAlchemyBase, fides_key: str
+) -> Dict:
     """Delete a resource by its fides_key."""
-    result_sql_resource = get_resource(sql_model, fides_key)
+    result_sql_resource = get_resource(session, sql_model, fides_key)
     if not result_sql_resource:
         return {"error": {"message": f"{fides_key} is not an existing fides_key!"}}
 
-    session = db_session.create_session()
-    try:
-        session.delete(result_sql_resource)
-        session.commit()
-    finally:
-        session.close()
+    session.delete(result_sql_resource)
+    session.commit()
     return {}
 
 
@@ -106,28 +257,130 @@ for resource_type, resource_model in model_map.items():
     async def create(
         resource: resource_model,
         resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
     ) -> Dict:
         """Create a resource."""
-        sql_resource = sql_model_map[resource_type](**resource.dict())
-        create_resource(sql_resource)
+        sql_resource = sql_model_map[resource_type](
+            **resource.dict(), content_hash=get_resource_hash(resource)
+        )
+        await db_session.run_in_executor(
+            partial(create_resource, session, sql_resource)
+        )
         return sql_resource
 
     @router.get("/", response_model=List[resource_model], name="List")
-    async def ls(  # pylint: disable=invalid-name
+    async def ls(  # pylint: disable=invalid-name,too-many-arguments
+        request: Request,
+        response: Response,
+        fides_key_prefix: Optional[str] = None,
+        parent_key: Optional[str] = None,
+        organization_fides_key: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = Query(None, ge=1),
+        fields: Optional[List[str]] = Query(None),
+        resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
+    ) -> Union[List, Response]:
+        """
+        Get a list of the resources of this type, ordered by fides_key.
+
+        Resources can be filtered by a fides_key prefix, parent_key and
+        organization_fides_key. With a limit, only that many resources after
+        the `after` fides_key are returned, and the Link header points to the
+        next page while there may be more. With fields, only those fields
+        and the fides_key of each resource are returned.
+        """
+        sql_model = sql_model_map[resource_type]
+        filters = {
+            column: value
+            for column, value in [
+                ("parent_key", parent_key),
+                ("organization_fides_key", organization_fides_key),
+            ]
+            if value is not None
+        }
+        fields = get_list_fields(fields)
+        validate_list_columns(sql_model, resource_type, list(filters) + (fields or []))
+
+        query_result = await db_session.run_in_executor(
+            partial(
+                list_resource,
+                session,
+                sql_model,
+                filters=filters,
+                fides_key_prefix=fides_key_prefix,
+                after=after,
+                limit=limit,
+                fields=fields,
+            )
+        )
+
+        headers = get_next_page_headers(request, query_result, limit, fields)
+        if fields:
+            return JSONResponse(query_result, headers=headers)
+        response.headers.update(headers)
+        return query_result
+
+    # Fides keys can't contain a "/", so these never match "/{fides_key}"
+    @router.get("/_batch/hashes", response_model=Dict[str, Optional[str]])
+    async def hashes(
+        resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
+    ) -> Dict:
+        """
+        Get the content hash of every resource of this type by its fides_key,
+        which is the same as the hash of an equal local resource.
+        """
+        sql_model = sql_model_map[resource_type]
+        query_result = await db_session.run_in_executor(
+            partial(get_resource_hashes, session, sql_model)
+        )
+        return query_result
+
+    @router.post("/_batch/get", response_model=List[resource_model])
+    async def batch_get(
+        fides_keys: List[str],
+        resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
+    ) -> List:
+        """Get all of the resources of this type that match the fides_keys."""
+        sql_model = sql_model_map[resource_type]
+        query_result = await db_session.run_in_executor(
+            partial(get_resources, session, sql_model, fides_keys)
+        )
+        return query_result
+
+    @router.post("/_batch/upsert", response_model=List[Dict[str, str]])
+    async def upsert(
+        resources: List[resource_model],
         resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
     ) -> List:
-        """Get a list of all of the resources of this type."""
+        """
+        Create or update many resources at once, returning whether
+        each one was created or updated.
+        """
         sql_model = sql_model_map[resource_type]
-        query_result = list_resource(sql_model)
+        resource_dicts = [
+            {**resource.dict(), "content_hash": get_resource_hash(resource)}
+            for resource in resources
+        ]
+        query_result = await db_session.run_in_executor(
+            partial(upsert_resources, session, sql_model, resource_dicts)
+        )
         return query_result
 
     @router.get("/{fides_key}", response_model=resource_model)
     async def get(
-        fides_key: str, resource_type: str = get_resource_type(router)
+        fides_key: str,
+        resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
     ) -> Dict:
         """Get a resource by its fides_key."""
         sql_model = sql_model_map[resource_type]
-        query_result = get_resource(sql_model, fides_key)
+        query_result = await db_session.run_in_executor(
+            partial(get_resource, session, sql_model, fides_key)
+        )
         return query_result
 
     @router.post("/{fides_key}", response_model=resource_model)
@@ -135,20 +388,27 @@ for resource_type, resource_model in model_map.items():
         fides_key: str,
         resource: resource_model,
         resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
     ) -> Dict:
         """Update a resource by its fides_key."""
         sql_model = sql_model_map[resource_type]
-        resource_dict = resource.dict()
-        query_result = update_resource(sql_model, resource_dict, fides_key)
+        resource_dict = {**resource.dict(), "content_hash": get_resource_hash(resource)}
+        query_result = await db_session.run_in_executor(
+            partial(update_resource, session, sql_model, resource_dict, fides_key)
+        )
         return query_result
 
     @router.delete("/{fides_key}", status_code=status.HTTP_204_NO_CONTENT)
     async def delete(
-        fides_key: str, resource_type: str = get_resource_type(router)
+        fides_key: str,
+        resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
     ) -> Dict:
         """Delete a resource by its fides_key."""
         sql_model = sql_model_map[resource_type]
-        delete_resource(sql_model, fides_key)
+        await db_session.run_in_executor(
+            partial(delete_resource, session, sql_model, fides_key)
+        )
         return {
             "Message": f"Resource with fides_key: {fides_key} deleted successfully!"
         }
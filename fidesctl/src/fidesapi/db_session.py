@@ -2,27 +2,70 @@
 Sets up the database for use within the API.
 """
 
-from typing import Callable, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Optional, TypeVar
 
 import sqlalchemy as sa
 import sqlalchemy.orm as orm
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
+from fidesctl.core.config import APISettings
+
 FACTORY: Optional[Callable[[], Session]] = None
+EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+QueryResult = TypeVar("QueryResult")
+
+# The number of database threads when the engine can open unlimited connections
+UNLIMITED_POOL_WORKERS = 32
 
 
-def global_init(database_url: str) -> None:
+def get_engine(api_settings: APISettings) -> Engine:
+    "Creates an engine with the connection pool settings of the API."
+    return sa.create_engine(
+        api_settings.database_url,
+        echo=False,
+        pool_size=api_settings.database_pool_size,
+        max_overflow=api_settings.database_max_overflow,
+        pool_pre_ping=api_settings.database_pool_pre_ping,
+        pool_recycle=api_settings.database_pool_recycle,
+    )
+
+
+def get_executor_workers(api_settings: APISettings) -> int:
+    """
+    Returns the number of connections the engine can open, which is the
+    number of threads that can usefully wait on the database.
+
+    SQLAlchemy treats a pool_size of 0 and a max_overflow of -1 as unlimited,
+    so a fixed number of threads is used instead.
+    """
+    if api_settings.database_pool_size <= 0 or api_settings.database_max_overflow < 0:
+        return UNLIMITED_POOL_WORKERS
+    return api_settings.database_pool_size + api_settings.database_max_overflow
+
+
+def global_init(api_settings: APISettings) -> None:
     """
     This runs once when the application first starts to
     set up the database connection and session factories.
+
+    Database calls are run in a thread pool with one thread for
+    each connection the engine can open, see `get_executor_workers`.
     """
-    global FACTORY  # pylint: disable=global-statement
+    global FACTORY, EXECUTOR  # pylint: disable=global-statement
 
     if FACTORY:
         return
 
-    engine = sa.create_engine(database_url, echo=False)
+    engine = get_engine(api_settings)
     FACTORY = orm.sessionmaker(bind=engine)
+    EXECUTOR = ThreadPoolExecutor(
+        max_workers=get_executor_workers(api_settings),
+        thread_name_prefix="fidesapi-db",
+    )
 
 
 def create_session() -> Session:
@@ -38,3 +81,27 @@ def create_session() -> Session:
     session.expire_on_commit = False
 
     return session
+
+
+async def run_in_executor(func: Callable[[], QueryResult]) -> QueryResult:
+    """
+    Runs a blocking database call in the database thread pool,
+    so that it doesn't block the event loop while it waits.
+    """
+    if not EXECUTOR:
+        raise Exception("You must call global_init() before using this method.")
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(EXECUTOR, func)
+
+
+async def get_session() -> AsyncIterator[Session]:
+    """
+    A dependency that gives each request a single session, which is closed
+    once the request is done, rolling back anything it didn't commit.
+    """
+    session = create_session()
+    try:
+        yield session
+    finally:
+        await run_in_executor(session.close)
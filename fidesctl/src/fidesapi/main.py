@@ -8,7 +8,7 @@ import uvicorn
 from fastapi import FastAPI
 
 from fidesapi import crud, db_session, visualize
-from fidesctl.core.config import get_config
+from fidesctl.core.config import APISettings, get_config
 
 app = FastAPI(title="fidesctl")
 
@@ -22,9 +22,9 @@ def configure_routes() -> None:
         app.include_router(router)
 
 
-def configure_db(database_url: str) -> None:
+def configure_db(api_settings: APISettings) -> None:
     "Set up the db to be used by the app."
-    db_session.global_init(database_url)
+    db_session.global_init(api_settings)
 
 
 @app.get("/health", tags=["Health"])
@@ -40,4 +40,4 @@ def start_webserver() -> None:
 
 config = get_config()
 configure_routes()
-configure_db(config.api.database_url)
+configure_db(config.api)
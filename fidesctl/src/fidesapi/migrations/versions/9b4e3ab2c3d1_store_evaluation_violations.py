@@ -0,0 +1,70 @@
+"""Store evaluation violations alongside details
+
+Revision ID: 9b4e3ab2c3d1
+Revises: 45c7a349db68
+Create Date: 2026-10-18 04:12:44.108532
+
+"""
+import json
+import re
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "9b4e3ab2c3d1"
+down_revision = "45c7a349db68"
+branch_labels = None
+depends_on = None
+
+# The rendered message of a violation, which only names the last target
+VIOLATION_DETAIL = re.compile(
+    r"^Declaration \((?P<declaration>.*)\) of System \((?P<system>.*)\) "
+    r"failed Rule \((?P<rule>.*)\) from Policy \((?P<policy>.*?)\)"
+    r"(?: for (?P<target_type>\w+) \((?P<target_name>.*)\))?$"
+)
+
+
+def parse_violation(detail):
+    """
+    Returns the violation that a detail was rendered from,
+    or None if it isn't a rendered violation.
+    """
+    match = VIOLATION_DETAIL.match(detail)
+    if match is None:
+        return None
+    violation = match.groupdict()
+    target_name = violation.pop("target_name")
+    violation["target_path"] = [target_name] if target_name else []
+    return violation
+
+
+def upgrade():
+    op.add_column(
+        "evaluations",
+        sa.Column("violations", postgresql.JSONB(), nullable=True),
+    )
+
+    # The details are kept, as they can't all be parsed back into violations
+    connection = op.get_bind()
+    evaluations = connection.execute(
+        sa.text("SELECT fides_key, details FROM evaluations")
+    )
+    for fides_key, details in evaluations.fetchall():
+        violations = [
+            violation
+            for violation in map(parse_violation, details or [])
+            if violation is not None
+        ]
+        connection.execute(
+            sa.text(
+                "UPDATE evaluations SET violations = CAST(:violations AS JSONB) "
+                "WHERE fides_key = :fides_key"
+            ),
+            {"violations": json.dumps(violations), "fides_key": fides_key},
+        )
+
+
+def downgrade():
+    op.drop_column("evaluations", "violations")
@@ -5,6 +5,7 @@ Contains all of the SqlAlchemy models for the Fides resources.
 from typing import Dict
 
 from sqlalchemy import Column, Integer, Text, String, ARRAY, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 import sqlalchemy.ext.declarative
 
 
@@ -14,6 +15,8 @@ class SqlModelBase:
     """
 
     id = Column(Integer, primary_key=True, index=True, unique=True, autoincrement=True)
+    # The hash of the resource's canonical JSON, computed when it's written
+    content_hash = Column(String)
 
 
 class FidesBase(SqlModelBase):
@@ -93,6 +96,10 @@ class Evaluation(SqlAlchemyBase):
 
     fides_key = Column(String, primary_key=True, index=True, unique=True)
     status = Column(String)
+    violations = Column(JSONB)
+    # The rendered violations of evaluations stored before violations were
+    # kept as objects. The migration that added `violations` only backfills
+    # the details it can parse, so the original messages are kept here.
     details = Column(ARRAY(String))
     message = Column(String)
 
@@ -2,11 +2,14 @@
 API endpoints for displaying hierarchical data representations.
 """
 from enum import Enum
+from functools import partial
 from typing import Union
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import HTMLResponse
+from sqlalchemy.orm import Session
 
+from fidesapi import db_session
 from fidesapi.crud import list_resource
 from fidesapi.sql_models import sql_model_map
 from fidesctl.core import visualize
@@ -50,7 +53,9 @@ for resource_type in VISUALIZABLE_RESOURCE_TYPES:
 
     @router.get("/visualize/{figure_type}")
     async def get_chart(
-        figure_type: FigureTypeEnum, resource_type: str = get_resource_type(router)
+        figure_type: FigureTypeEnum,
+        resource_type: str = get_resource_type(router),
+        session: Session = Depends(db_session.get_session),
     ) -> Union[HTMLResponse, HTTPException]:
         """
             Visualize the hierarchy of a supported resource type.
@@ -61,7 +66,9 @@ for resource_type in VISUALIZABLE_RESOURCE_TYPES:
             Html for the requested figure. Response with status code 400 when invalid figure type is provided
         """
         sql_model = sql_model_map[resource_type]
-        resource_object_list = list_resource(sql_model)
+        resource_object_list = await db_session.run_in_executor(
+            partial(list_resource, session, sql_model)
+        )
         resource_list = [resource.__dict__ for resource in resource_object_list]
         if figure_type == "text":
             figure = visualize.nested_categories_to_html_list(
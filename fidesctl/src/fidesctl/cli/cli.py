@@ -1,5 +1,6 @@
 """Contains all of the CLI commands for Fides."""
 import pprint
+from typing import Tuple
 
 import click
 
@@ -14,6 +15,7 @@ from fidesctl.cli.options import (
     verbose_flag,
 )
 from fidesctl.cli.utils import (
+    handle_cli_pages,
     handle_cli_response,
     pretty_echo,
 )
@@ -34,10 +36,28 @@ from fidesctl.core.utils import echo_green, echo_red
 @click.option(
     "--diff",
     is_flag=True,
-    help="Print the diff between the server's old and new states in Python DeepDiff format",
+    help="Print the diff between the server's old and new states, one changed field per line",
+)
+@click.option(
+    "--chunk-size",
+    default=100,
+    type=click.IntRange(min=1),
+    help="The number of resources to send to the server in each request.",
+)
+@click.option(
+    "--cache-dir",
+    default="",
+    help="A directory to cache parsed manifests in, so that only changed manifest files are re-parsed.",
 )
 @manifests_dir_argument
-def apply(ctx: click.Context, dry: bool, diff: bool, manifests_dir: str) -> None:
+def apply(
+    ctx: click.Context,
+    dry: bool,
+    diff: bool,
+    chunk_size: int,
+    cache_dir: str,
+    manifests_dir: str,
+) -> None:
     """
     Update server with your local resources.
 
@@ -45,13 +65,14 @@ def apply(ctx: click.Context, dry: bool, diff: bool, manifests_dir: str) -> None
 
     """
     config = ctx.obj["CONFIG"]
-    taxonomy = _parse.parse(manifests_dir)
+    taxonomy = _parse.parse(manifests_dir, cache_dir=cache_dir)
     _apply.apply(
         url=config.cli.server_url,
         taxonomy=taxonomy,
         headers=config.user.request_headers,
         dry=dry,
         diff=diff,
+        chunk_size=chunk_size,
     )
 
 
@@ -92,14 +113,35 @@ def delete(ctx: click.Context, resource_type: str, fides_key: str) -> None:
 @click.option(
     "-m",
     "--message",
+    default="",
     help="A message that you can supply to describe the purpose of this evaluation.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="The number of processes to load manifests and evaluate systems with in parallel.",
+)
+@click.option(
+    "--cache-dir",
+    default="",
+    help="A directory to cache parsed manifests and evaluation results in, so that only changed files and resources are re-parsed and re-evaluated.",
+)
+@click.option(
+    "--skip-apply",
+    is_flag=True,
+    help="Evaluate without applying the resources to the server first, so that only the resources the evaluation uses are parsed.",
+)
 @dry_flag
 def evaluate(
     ctx: click.Context,
     manifests_dir: str,
     fides_key: str,
     message: str,
+    jobs: int,
+    cache_dir: str,
+    skip_apply: bool,
     dry: bool,
 ) -> None:
     """
@@ -110,13 +152,14 @@ def evaluate(
     """
 
     config = ctx.obj["CONFIG"]
-    taxonomy = _parse.parse(manifests_dir)
-    _apply.apply(
-        url=config.cli.server_url,
-        taxonomy=taxonomy,
-        headers=config.user.request_headers,
-        dry=dry,
-    )
+    local_taxonomy = _parse.parse_lazily(manifests_dir, jobs=jobs, cache_dir=cache_dir)
+    if not skip_apply:
+        _apply.apply(
+            url=config.cli.server_url,
+            taxonomy=local_taxonomy.to_taxonomy(),
+            headers=config.user.request_headers,
+            dry=dry,
+        )
 
     _evaluate.evaluate(
         url=config.cli.server_url,
@@ -125,6 +168,9 @@ def evaluate(
         fides_key=fides_key,
         message=message,
         dry=dry,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        local_taxonomy=local_taxonomy,
     )
 
 
@@ -220,7 +266,41 @@ def init_db(ctx: click.Context) -> None:
 @click.command()
 @click.pass_context
 @resource_type_argument
-def ls(ctx: click.Context, resource_type: str) -> None:  # pylint: disable=invalid-name
+@click.option(
+    "--fides-key-prefix",
+    default=None,
+    help="Only list the resources whose fides_key starts with this prefix.",
+)
+@click.option(
+    "--parent-key",
+    default=None,
+    help="Only list the resources with this parent_key.",
+)
+@click.option(
+    "--organization-fides-key",
+    default=None,
+    help="Only list the resources of this organization.",
+)
+@click.option(
+    "--fields",
+    multiple=True,
+    help="Only print these fields of each resource, along with its fides_key. Can be passed more than once.",
+)
+@click.option(
+    "--page-size",
+    default=_api.PAGE_SIZE,
+    type=click.IntRange(min=1),
+    help="The number of resources to request from the server at a time.",
+)
+def ls(  # pylint: disable=invalid-name,too-many-arguments
+    ctx: click.Context,
+    resource_type: str,
+    fides_key_prefix: str,
+    parent_key: str,
+    organization_fides_key: str,
+    fields: Tuple[str, ...],
+    page_size: int,
+) -> None:
     """
     List resource objects.
 
@@ -231,11 +311,24 @@ def ls(ctx: click.Context, resource_type: str) -> None:  # pylint: disable=inval
         [resource type list] (string): the type of resource from the enumeration that you want to retrieve
     """
     config = ctx.obj["CONFIG"]
-    handle_cli_response(
-        _api.ls(
+    params: _api.ListParams = {
+        name: value
+        for name, value in [
+            ("fides_key_prefix", fides_key_prefix),
+            ("parent_key", parent_key),
+            ("organization_fides_key", organization_fides_key),
+        ]
+        if value is not None
+    }
+    if fields:
+        params["fields"] = list(fields)
+    handle_cli_pages(
+        _api.ls_pages(
             url=config.cli.server_url,
             resource_type=resource_type,
             headers=config.user.request_headers,
+            params=params,
+            page_size=page_size,
         )
     )
 
@@ -243,8 +336,26 @@ def ls(ctx: click.Context, resource_type: str) -> None:  # pylint: disable=inval
 @click.command()
 @click.pass_context
 @manifests_dir_argument
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="The number of processes to load manifests with in parallel.",
+)
+@click.option(
+    "--cache-dir",
+    default="",
+    help="A directory to cache parsed manifests in, so that only changed manifest files are re-parsed.",
+)
 @verbose_flag
-def parse(ctx: click.Context, manifests_dir: str, verbose: bool = False) -> None:
+def parse(
+    ctx: click.Context,
+    manifests_dir: str,
+    jobs: int,
+    cache_dir: str,
+    verbose: bool = False,
+) -> None:
     """
     Validate the taxonomy described by the manifest files.
 
@@ -253,7 +364,7 @@ def parse(ctx: click.Context, manifests_dir: str, verbose: bool = False) -> None
     Note: No resources are applied to your server in this command. Enabling -v will print the taxonomy.
     """
 
-    taxonomy = _parse.parse(manifests_dir)
+    taxonomy = _parse.parse(manifests_dir, jobs=jobs, cache_dir=cache_dir)
     if verbose:
         pprint.pprint(taxonomy)
 
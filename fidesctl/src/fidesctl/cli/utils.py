@@ -1,7 +1,8 @@
 """Contains reusable utils for the CLI commands."""
 import json
 import sys
-from typing import Dict
+import textwrap
+from typing import Dict, Iterable
 import click
 import requests
 
@@ -28,3 +29,23 @@ def handle_cli_response(
         finally:
             sys.exit(1)
     return response
+
+
+def handle_cli_pages(responses: Iterable[requests.Response]) -> None:
+    """
+    Viewable CLI response for a list split across pages, printed
+    as a single JSON array one page at a time.
+    """
+    resource_count = 0
+    click.secho("[", fg="green", nl=False)
+    for response in responses:
+        handle_cli_response(response, verbose=False)
+        for resource in response.json():
+            separator = ",\n" if resource_count else "\n"
+            click.secho(
+                separator + textwrap.indent(json.dumps(resource, indent=2), "  "),
+                fg="green",
+                nl=False,
+            )
+            resource_count += 1
+    click.secho("\n]" if resource_count else "]", fg="green")
@@ -2,13 +2,16 @@
 This script is a utility for interactively annotating data categories in the dataset manifest
 """
 
-from typing import Union, List
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Union
 
 import click
 
+from fidesapi import db_session
 from fidesapi.crud import list_resource
 from fidesapi.sql_models import sql_model_map
-from fidesctl.core import parse as core_parse
 from fidesctl.core import visualize
 from fideslang import manifests
 from fideslang.models import Dataset, DatasetCollection, DatasetField, FidesKey
@@ -83,44 +86,31 @@ def get_data_categories_annotation(
     return user_response
 
 
-def annotate_dataset(
-    dataset_file: str,
-    resource_type: str = "data_category",
+def annotate_datasets(
+    datasets: Iterable[Dict],
+    existing_categories: List[str],
     annotate_all: bool = False,
     validate: bool = True,
-) -> None:
+) -> Iterator[Dict]:
     """
-    Given a dataset.yml-like file, walk the user through an interactive cli to provide data categories
-    for members of the dataset that do not have any specified
+    Walk the user through annotating each dataset in turn, yielding each one
+    as soon as it's annotated
     Args:
-        dataset_file: the file name for the dataset to annotate
-        resource_type: the type of data resource to point to for assistance (via visualization web page)
+        datasets: the raw datasets to annotate
+        existing_categories: a list of the valid data categories
         annotate_all: flag to annotate all members of a dataset (default False: only annotate fields)
         validate: flag to check user inputs for formatting and data category presence
 
     Returns:
-        Write the amended dataset file in place
+        Each annotated dataset, followed by the rest as is once the user quits
     """
-    output_dataset = []
-
-    # Make the user aware of the data_categories visualizer
-    click.secho(
-        f"""For reference, open the data category visualizer at either (localhost if running container):
-        {visualize.get_visualize_url(resource_type, "graphs")}
-        {visualize.get_visualize_url(resource_type, "text")}
-    """,
-        fg="green",
-    )
-
-    datasets = core_parse.ingest_manifests(dataset_file)["dataset"]
-
-    existing_categories = [
-        resource.__dict__["fides_key"]
-        for resource in list_resource(sql_model_map[resource_type])
-    ]
-
+    aborted = False
     for dataset in datasets:
         current_dataset = Dataset(**dataset)
+        if aborted:
+            yield current_dataset.dict()
+            continue
+
         click.secho(f"\n####\nAnnotating Dataset: [{current_dataset.name}]")
 
         if annotate_all and not current_dataset.data_categories:
@@ -132,7 +122,9 @@ def annotate_dataset(
                     validate=validate,
                 )
             except AnnotationAbortError:
-                break
+                aborted = True
+                yield current_dataset.dict()
+                continue
 
         for table in current_dataset.collections:
             click.secho(f"####\nAnnotating Table: [{table.name}]\n")
@@ -165,6 +157,71 @@ def annotate_dataset(
                         field.data_categories = user_categories
                     except AnnotationAbortError:
                         break
-    else:
-        output_dataset.append(current_dataset.dict())
-    manifests.write_manifest(dataset_file, output_dataset, "dataset")
+        yield current_dataset.dict()
+
+
+def annotate_dataset(
+    dataset_file: str,
+    resource_type: str = "data_category",
+    annotate_all: bool = False,
+    validate: bool = True,
+) -> None:
+    """
+    Given a dataset.yml-like file, walk the user through an interactive cli to provide data categories
+    for members of the dataset that do not have any specified
+    Args:
+        dataset_file: the file name for the dataset to annotate
+        resource_type: the type of data resource to point to for assistance (via visualization web page)
+        annotate_all: flag to annotate all members of a dataset (default False: only annotate fields)
+        validate: flag to check user inputs for formatting and data category presence
+
+    Returns:
+        Write the amended dataset file in place
+    """
+
+    # Make the user aware of the data_categories visualizer
+    click.secho(
+        f"""For reference, open the data category visualizer at either (localhost if running container):
+        {visualize.get_visualize_url(resource_type, "graphs")}
+        {visualize.get_visualize_url(resource_type, "text")}
+    """,
+        fg="green",
+    )
+
+    session = db_session.create_session()
+    try:
+        existing_categories = [
+            resource.__dict__["fides_key"]
+            for resource in list_resource(session, sql_model_map[resource_type])
+        ]
+    finally:
+        session.close()
+
+    # Datasets are read and written one at a time, so the annotated
+    # datasets are written next to the file before replacing it
+    datasets = (
+        dataset
+        for dataset_type, dataset in manifests.iter_manifest_resources(dataset_file)
+        if dataset_type == "dataset"
+    )
+    output_file, output_path = tempfile.mkstemp(
+        suffix=".yml", dir=os.path.dirname(os.path.abspath(dataset_file))
+    )
+    os.close(output_file)
+    try:
+        manifests.write_manifest_resources(
+            output_path,
+            annotate_datasets(
+                datasets=datasets,
+                existing_categories=existing_categories,
+                annotate_all=annotate_all,
+                validate=validate,
+            ),
+            "dataset",
+        )
+        # mkstemp creates the file readable only by its owner
+        shutil.copymode(dataset_file, output_path)
+        os.replace(output_path, dataset_file)
+    finally:
+        if os.path.exists(output_path):
+            os.remove(output_path)
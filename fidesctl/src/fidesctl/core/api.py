@@ -1,7 +1,54 @@
 """A wrapper to make calling the API consistent across Fidesctl."""
-from typing import Dict
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# The seconds to wait to connect to the server, and then for each response
+REQUEST_TIMEOUT: Tuple[float, float] = (5, 60)
+# The number of connections to each host that are kept alive
+POOL_SIZE = 10
+# The number of times a failed connection or gateway error is retried
+MAX_RETRIES = 3
+# The number of resources requested in each page of a list
+PAGE_SIZE = 100
+
+# The query parameters of a list, by name
+ListParams = Dict[str, Union[str, int, List[str]]]
+
+
+def create_session() -> requests.Session:
+    """
+    Create a session that keeps a pool of connections alive between requests,
+    and retries failed connections and gateway errors with backoff.
+
+    Only idempotent requests are retried. Every request made with the session
+    should pass REQUEST_TIMEOUT, since sessions don't have a default timeout.
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """
+    Get the session shared by every API call, creating it on first use.
+    """
+    return create_session()
 
 
 def generate_resource_url(
@@ -20,24 +67,58 @@ def get(
     Get an resource by its id.
     """
     resource_url = generate_resource_url(url, resource_type, resource_id)
-    return requests.get(resource_url, headers=headers)
+    return get_session().get(resource_url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+
+def batch_get(
+    url: str, resource_type: str, resource_ids: List[str], headers: Dict[str, str]
+) -> requests.Response:
+    """
+    Get all of the resources that match the ids, in a single request.
+    """
+    resource_url = generate_resource_url(url, resource_type, "_batch/get")
+    return get_session().post(
+        resource_url,
+        headers=headers,
+        data=json.dumps(list(resource_ids)),
+        timeout=REQUEST_TIMEOUT,
+    )
 
 
 def create(
-    url: str, resource_type: str, json_resource: str, headers: Dict[str, str]
+    url: str,
+    resource_type: str,
+    json_resource: Union[str, Iterable[bytes]],
+    headers: Dict[str, str],
 ) -> requests.Response:
     """
     Create a new resource.
+
+    The JSON can also be passed as an iterable of chunks to stream it.
     """
     resource_url = generate_resource_url(url, resource_type)
-    return requests.post(resource_url, headers=headers, data=json_resource)
+    return get_session().post(
+        resource_url, headers=headers, data=json_resource, timeout=REQUEST_TIMEOUT
+    )
+
+
+def upsert(
+    url: str, resource_type: str, json_resources: str, headers: Dict[str, str]
+) -> requests.Response:
+    """
+    Create or update many resources at once.
+    """
+    resource_url = generate_resource_url(url, resource_type, "_batch/upsert")
+    return get_session().post(
+        resource_url, headers=headers, data=json_resources, timeout=REQUEST_TIMEOUT
+    )
 
 
 def ping(url: str) -> requests.Response:
     """
     Pings the Server on the base url to make sure it's available.
     """
-    return requests.get(url)
+    return get_session().get(url, timeout=REQUEST_TIMEOUT)
 
 
 def delete(
@@ -47,17 +128,53 @@ def delete(
     Delete an resource by its id.
     """
     resource_url = generate_resource_url(url, resource_type, resource_id)
-    return requests.delete(resource_url, headers=headers)
+    return get_session().delete(resource_url, headers=headers, timeout=REQUEST_TIMEOUT)
 
 
 def ls(  # pylint: disable=invalid-name
-    url: str, resource_type: str, headers: Dict[str, str]
+    url: str,
+    resource_type: str,
+    headers: Dict[str, str],
+    params: Optional[ListParams] = None,
 ) -> requests.Response:
     """
     Get a list of all of the resources of a certain type.
+
+    The params can filter the resources, limit them to a page
+    starting after a fides_key, and select the fields returned.
     """
     resource_url = generate_resource_url(url, resource_type)
-    return requests.get(resource_url, headers=headers)
+    return get_session().get(
+        resource_url, headers=headers, params=params, timeout=REQUEST_TIMEOUT
+    )
+
+
+def ls_pages(
+    url: str,
+    resource_type: str,
+    headers: Dict[str, str],
+    params: Optional[ListParams] = None,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[requests.Response]:
+    """
+    Get a list of the resources of a certain type one page at a time,
+    following the link to the next page until the last one or an error.
+    """
+    response = ls(url, resource_type, headers, {**(params or {}), "limit": page_size})
+    yield response
+    while response.ok and "next" in response.links:
+        response = get_session().get(
+            response.links["next"]["url"], headers=headers, timeout=REQUEST_TIMEOUT
+        )
+        yield response
+
+
+def hashes(url: str, resource_type: str, headers: Dict[str, str]) -> requests.Response:
+    """
+    Get the content hash of every resource of a certain type by its fides_key.
+    """
+    resource_url = generate_resource_url(url, resource_type, "_batch/hashes")
+    return get_session().get(resource_url, headers=headers, timeout=REQUEST_TIMEOUT)
 
 
 def update(
@@ -71,7 +188,9 @@ def update(
     Update an existing resource.
     """
     resource_url = generate_resource_url(url, resource_type, resource_id)
-    return requests.post(resource_url, headers=headers, data=json_resource)
+    return get_session().post(
+        resource_url, headers=headers, data=json_resource, timeout=REQUEST_TIMEOUT
+    )
 
 
 def dry_evaluate(
@@ -82,7 +201,9 @@ def dry_evaluate(
     """
     resource_url = generate_resource_url(url, resource_type)
     url = f"{resource_url}evaluate/dry-run"
-    return requests.post(url, headers=headers, data=json_resource)
+    return get_session().post(
+        url, headers=headers, data=json_resource, timeout=REQUEST_TIMEOUT
+    )
 
 
 def evaluate(
@@ -98,4 +219,9 @@ def evaluate(
     """
     resource_url = generate_resource_url(url, resource_type)
     url = f"{resource_url}evaluate/{fides_key}"
-    return requests.get(url, headers=headers, params={"tag": tag, "message": message})
+    return get_session().get(
+        url,
+        headers=headers,
+        params={"tag": tag, "message": message},
+        timeout=REQUEST_TIMEOUT,
+    )
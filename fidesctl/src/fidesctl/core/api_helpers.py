@@ -2,13 +2,42 @@
 Reusable utilities meant to make repetitive api-related tasks easier.
 """
 
-from typing import List, Dict, Optional
+import asyncio
+from typing import Callable, Dict, List, Optional, TypeVar
 
+from fidesctl.cli.utils import handle_cli_response
 from fidesctl.core import api
 from fideslang import FidesModel
 from fideslang.validation import FidesKey
 from fideslang.parse import parse_dict
 
+# The maximum number of requests sent to the server at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+def _gather_in_executor(
+    func: Callable[[Item], Result], items: List[Item], concurrency: int
+) -> List[Result]:
+    """
+    Calls a blocking function with each item in the default thread pool,
+    at most `concurrency` at a time, and returns the results in order.
+    """
+
+    async def call_in_executor(item: Item, semaphore: asyncio.Semaphore) -> Result:
+        async with semaphore:
+            return await asyncio.get_running_loop().run_in_executor(None, func, item)
+
+    async def gather() -> List[Result]:
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *[call_in_executor(item, semaphore) for item in items]
+        )
+
+    return asyncio.run(gather())
+
 
 def get_server_resources(
     url: str,
@@ -19,26 +48,102 @@ def get_server_resources(
     """
     Get a list of resources from the server that match the provided keys.
 
+    All of the resources are fetched with a single request, and returned in
+    the same order as the keys.
+
     If the resource does not exist on the server, an error will _not_ be thrown.
-    Instead, an empty object will be stored and then filtered out.
+    Instead, it will be left out of the returned list. A failed request
+    is echoed before exiting.
     """
-    server_resources: List[FidesModel] = list(
-        filter(
-            None,
-            [
-                get_server_resource(
-                    url=url,
-                    resource_type=resource_type,
-                    resource_key=key,
-                    headers=headers,
-                )
-                for key in existing_keys
-            ],
+    if not existing_keys:
+        return []
+
+    raw_server_response: List[Dict] = handle_cli_response(
+        api.batch_get(
+            url=url,
+            resource_type=resource_type,
+            resource_ids=existing_keys,
+            headers=headers,
+        ),
+        verbose=False,
+    ).json()
+
+    server_resources_by_key: Dict[FidesKey, FidesModel] = {}
+    for raw_server_resource in raw_server_response:
+        server_resource = parse_dict(
+            resource_type=resource_type,
+            resource=raw_server_resource,
+            from_server=True,
         )
-    )
+        server_resources_by_key[server_resource.fides_key] = server_resource
+
+    server_resources: List[FidesModel] = [
+        server_resources_by_key[key]
+        for key in existing_keys
+        if key in server_resources_by_key
+    ]
     return server_resources
 
 
+def get_server_resources_concurrently(
+    url: str,
+    resource_keys: Dict[str, List[FidesKey]],
+    headers: Dict[str, str],
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+) -> Dict[str, List[FidesModel]]:
+    """
+    Get the resources of every resource type from the server at the same time,
+    each with its own request, returned by resource type.
+    """
+    server_resource_lists = _gather_in_executor(
+        lambda resource_type: get_server_resources(
+            url=url,
+            resource_type=resource_type,
+            existing_keys=resource_keys[resource_type],
+            headers=headers,
+        ),
+        list(resource_keys),
+        max_concurrent_requests,
+    )
+    return dict(zip(resource_keys, server_resource_lists))
+
+
+def get_server_resource_hashes(
+    url: str, resource_type: str, headers: Dict[str, str]
+) -> Optional[Dict[FidesKey, Optional[str]]]:
+    """
+    Get the content hash of every resource of a type on the server by its fides_key.
+
+    Returns None if the server doesn't list hashes, like servers from
+    before they were stored.
+    """
+    response = api.hashes(url=url, resource_type=resource_type, headers=headers)
+    if not response.ok:
+        return None
+    resource_hashes = response.json()
+    return resource_hashes if isinstance(resource_hashes, dict) else None
+
+
+def get_server_resource_hashes_concurrently(
+    url: str,
+    resource_types: List[str],
+    headers: Dict[str, str],
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+) -> Dict[str, Optional[Dict[FidesKey, Optional[str]]]]:
+    """
+    Get the content hashes of every resource type from the server at the same
+    time, each with its own request, returned by resource type.
+    """
+    resource_hash_dicts = _gather_in_executor(
+        lambda resource_type: get_server_resource_hashes(
+            url=url, resource_type=resource_type, headers=headers
+        ),
+        resource_types,
+        max_concurrent_requests,
+    )
+    return dict(zip(resource_types, resource_hash_dicts))
+
+
 def get_server_resource(
     url: str,
     resource_type: str,
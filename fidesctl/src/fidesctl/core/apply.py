@@ -2,13 +2,19 @@
 from pprint import pprint
 from typing import Dict, List, Tuple, Optional
 
-from deepdiff import DeepDiff
-
 from fidesctl.cli.utils import handle_cli_response
 from fidesctl.core import api
-from fidesctl.core.api_helpers import get_server_resources
+from fidesctl.core.api_helpers import (
+    get_server_resource_hashes_concurrently,
+    get_server_resources_concurrently,
+)
 from fidesctl.core.utils import echo_green
 from fideslang import FidesModel, Taxonomy
+from fideslang.diff import diff_resources
+from fideslang.utils import get_resource_hash
+
+# The default number of resources sent to the server in each upsert request
+APPLY_CHUNK_SIZE = 100
 
 
 def sort_create_update_unchanged(
@@ -32,31 +38,63 @@ def sort_create_update_unchanged(
     update_list = []
     unchanged_list = []
     for manifest_resource in manifest_resource_list:
-        resource_key = manifest_resource.fides_key
-
-        # Check if the resource's fides_key matches one from the server
-        if resource_key in server_resource_dict.keys():
-            server_resource = server_resource_dict[resource_key]
-
-            if manifest_resource == server_resource:
-                unchanged_list.append(manifest_resource)
-            else:
-                if diff:
-                    print(
-                        f"\nUpdated resource with fides_key: {manifest_resource.fides_key}"
-                    )
-                    pprint(DeepDiff(server_resource, manifest_resource))
-                update_list.append(manifest_resource)
-
-        else:
-            if diff:
-                print(f"\nNew resource with fides_key: {manifest_resource.fides_key}")
-                pprint(manifest_resource)
+        server_resource = server_resource_dict.get(manifest_resource.fides_key)
+        if manifest_resource == server_resource:
+            unchanged_list.append(manifest_resource)
+            continue
+
+        if diff:
+            echo_diff(manifest_resource, server_resource)
+        if server_resource is None:
             create_list.append(manifest_resource)
+        else:
+            update_list.append(manifest_resource)
 
     return create_list, update_list, unchanged_list
 
 
+def echo_diff(
+    manifest_resource: FidesModel, server_resource: Optional[FidesModel]
+) -> None:
+    """
+    Print out the differences between a local resource and the server's
+    version of it, or the whole resource if it's new.
+    """
+    if server_resource is None:
+        print(f"\nNew resource with fides_key: {manifest_resource.fides_key}")
+        pprint(manifest_resource)
+        return
+
+    print(f"\nUpdated resource with fides_key: {manifest_resource.fides_key}")
+    for change in diff_resources(server_resource, manifest_resource):
+        print(f"  {change.render()}")
+
+
+def sort_unchanged_by_hash(
+    manifest_resource_list: List[FidesModel],
+    server_resource_hashes: Optional[Dict[str, Optional[str]]],
+) -> Tuple[List[FidesModel], List[FidesModel]]:
+    """
+    Split the resources into those whose content hash matches the one on the
+    server, which are unchanged, and the rest, which have to be compared
+    with the server's resources.
+
+    Without the server's hashes, every resource has to be compared.
+    """
+    if server_resource_hashes is None:
+        return [], list(manifest_resource_list)
+
+    unchanged_list = []
+    compare_list = []
+    for manifest_resource in manifest_resource_list:
+        server_resource_hash = server_resource_hashes.get(manifest_resource.fides_key)
+        if server_resource_hash == get_resource_hash(manifest_resource):
+            unchanged_list.append(manifest_resource)
+        else:
+            compare_list.append(manifest_resource)
+    return unchanged_list, compare_list
+
+
 def execute_create_update_unchanged(
     url: str,
     headers: Dict[str, str],
@@ -64,34 +102,81 @@ def execute_create_update_unchanged(
     create_list: Optional[List[FidesModel]] = None,
     update_list: Optional[List[FidesModel]] = None,
     unchanged_list: Optional[List[FidesModel]] = None,
+    chunk_size: int = APPLY_CHUNK_SIZE,
 ) -> None:
     """
     Create, update, or just log resources based on which list they're in.
+
+    Created and updated resources are upserted together, with one request
+    for each chunk of resources.
     """
-    create_list = create_list or []
-    update_list = update_list or []
+    upsert_list = (create_list or []) + (update_list or [])
 
-    for create_resource in create_list:
+    for chunk_start in range(0, len(upsert_list), chunk_size):
+        upsert_chunk = upsert_list[chunk_start : chunk_start + chunk_size]
         handle_cli_response(
-            api.create(
+            api.upsert(
                 url=url,
                 headers=headers,
                 resource_type=resource_type,
-                json_resource=create_resource.json(exclude_none=True),
+                json_resources="[{}]".format(
+                    ", ".join(
+                        resource.json(exclude_none=True) for resource in upsert_chunk
+                    )
+                ),
             ),
             verbose=False,
         )
-    for update_resource in update_list:
-        handle_cli_response(
-            api.update(
-                url=url,
-                headers=headers,
-                resource_type=resource_type,
-                resource_id=update_resource.fides_key,
-                json_resource=update_resource.json(exclude_none=True),
-            ),
-            verbose=False,
+
+
+def get_existing_keys(
+    resource_list: List[FidesModel],
+    server_resource_hashes: Optional[Dict[str, Optional[str]]],
+) -> List[str]:
+    """
+    Returns the keys of the resources that exist on the server,
+    which could be any of them without the server's hashes.
+    """
+    return [
+        resource.fides_key
+        for resource in resource_list
+        if server_resource_hashes is None
+        or resource.fides_key in server_resource_hashes
+    ]
+
+
+def sort_and_fetch_by_hash(
+    url: str, taxonomy: Taxonomy, resource_types: List[str], headers: Dict[str, str]
+) -> Tuple[
+    Dict[str, Tuple[List[FidesModel], List[FidesModel]]], Dict[str, List[FidesModel]]
+]:
+    """
+    Split the resources of each type by whether their content hash matches
+    the server's, and get the existing resources that have to be compared.
+
+    The hashes and the resources of every type are fetched at the same time.
+    """
+    server_resource_hashes = get_server_resource_hashes_concurrently(
+        url=url, resource_types=resource_types, headers=headers
+    )
+    hash_sorted_lists = {
+        resource_type: sort_unchanged_by_hash(
+            getattr(taxonomy, resource_type), server_resource_hashes[resource_type]
         )
+        for resource_type in resource_types
+    }
+    server_resource_lists = get_server_resources_concurrently(
+        url=url,
+        resource_keys={
+            resource_type: get_existing_keys(
+                hash_sorted_lists[resource_type][1],
+                server_resource_hashes[resource_type],
+            )
+            for resource_type in resource_types
+        },
+        headers=headers,
+    )
+    return hash_sorted_lists, server_resource_lists
 
 
 def echo_results(action: str, resource_type: str, resource_list: List) -> None:
@@ -107,26 +192,30 @@ def apply(
     headers: Dict[str, str],
     dry: bool = False,
     diff: bool = False,
+    chunk_size: int = APPLY_CHUNK_SIZE,
 ) -> None:
     """
     Apply the current manifest file state to the server.
     Excludes systems and registries.
+
+    Resources are sent to the server in chunks of `chunk_size`.
     """
-    for resource_type in taxonomy.__fields_set__:
+    resource_types = list(taxonomy.__fields_set__)
+    hash_sorted_lists, server_resource_lists = sort_and_fetch_by_hash(
+        url, taxonomy, resource_types, headers
+    )
+
+    for resource_type in resource_types:
         # Doing some echos here to make a pretty output
         print("-" * 10)
         echo_green(f"Processing {resource_type} resources...")
-        resource_list = getattr(taxonomy, resource_type)
-
-        existing_keys = [resource.fides_key for resource in resource_list]
-        server_resource_list = get_server_resources(
-            url, resource_type, existing_keys, headers
-        )
+        hash_unchanged_list, compare_list = hash_sorted_lists[resource_type]
 
         # Determine which resources should be created, updated, or are unchanged
         create_list, update_list, unchanged_list = sort_create_update_unchanged(
-            resource_list, server_resource_list, diff
+            compare_list, server_resource_lists[resource_type], diff
         )
+        unchanged_list = hash_unchanged_list + unchanged_list
 
         if dry:
             echo_results("would create", resource_type, create_list)
@@ -140,6 +229,7 @@ def apply(
                 create_list,
                 update_list,
                 unchanged_list,
+                chunk_size=chunk_size,
             )
 
             echo_results("created", resource_type, create_list)
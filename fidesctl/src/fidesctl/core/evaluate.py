@@ -1,33 +1,71 @@
 """Module for evaluating policies."""
-from typing import Dict, List, Optional, Callable, cast
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    cast,
+)
 
+import json
 import uuid
 import time
+
+import click
 from pydantic import AnyHttpUrl
 
-from fidesctl.cli.utils import handle_cli_response, pretty_echo
+from fidesctl.cli.utils import handle_cli_response
 from fidesctl.core import api
 from fidesctl.core.api_helpers import get_server_resources, get_server_resource
-from fidesctl.core.parse import parse
+from fidesctl.core.evaluate_compiled import (
+    compile_evaluation_context,
+    evaluate_systems,
+    execute_parallel_evaluation,
+    get_dataset_targets,
+)
+from fidesctl.core.parse import parse_lazily
 from fidesctl.core.utils import echo_green, echo_red
 from fideslang.models import (
     ActionEnum,
     Evaluation,
+    EvaluationViolation,
     Dataset,
     StatusEnum,
-    InclusionEnum,
     Policy,
-    PolicyRule,
-    PrivacyDeclaration,
     System,
     Taxonomy,
 )
 from fideslang.validation import FidesKey
-from fideslang.relationships import (
-    get_referenced_missing_keys,
-    hydrate_missing_resources,
-)
-from fideslang.utils import get_resource_by_fides_key
+from fideslang.parse import LazyTaxonomy
+from fideslang.relationships import hydrate_referenced_resources
+
+
+class EvaluationKeys(NamedTuple):
+    """
+    The keys of each privacy data type that an evaluation uses.
+    """
+
+    data_categories: Set[str]
+    data_subjects: Set[str]
+    data_qualifiers: Set[str]
+    data_uses: Set[str]
+
+
+class EvaluationSummary(NamedTuple):
+    """
+    The key and final status of an evaluation whose violations were
+    streamed instead of being held in memory.
+    """
+
+    fides_key: str
+    status: StatusEnum
+
+
+# The number of violations sent to the server in each chunk of an evaluation
+EVALUATION_CHUNK_SIZE = 1000
 
 
 def get_evaluation_policies(
@@ -42,12 +80,9 @@ def get_evaluation_policies(
     all policies.
     """
     if evaluate_fides_key:
-        local_policy_found = next(
-            filter(
-                lambda policy: policy.fides_key == evaluate_fides_key, local_policies
-            ),
-            None,
-        )
+        local_policy_found = {
+            policy.fides_key: policy for policy in reversed(local_policies)
+        }.get(evaluate_fides_key)
         if local_policy_found:
             return [local_policy_found]
 
@@ -78,12 +113,15 @@ def get_all_server_policies(
     """
 
     exclude = exclude if exclude else []
-    ls_response = handle_cli_response(
-        api.ls(url=url, resource_type="policy", headers=headers), verbose=False
-    )
     policy_keys = [
         resource["fides_key"]
-        for resource in ls_response.json()
+        for ls_response in api.ls_pages(
+            url=url,
+            resource_type="policy",
+            headers=headers,
+            params={"fields": "fides_key"},
+        )
+        for resource in handle_cli_response(ls_response, verbose=False).json()
         if resource["fides_key"] not in exclude
     ]
     policy_list = get_server_resources(
@@ -123,102 +161,31 @@ def validate_supported_policy_rules(policies: List[Policy]) -> None:
                 raise SystemExit(1)
 
 
-def get_fides_key_parent_hierarchy(
-    taxonomy: Taxonomy, fides_key: str
-) -> List[FidesKey]:
-    """
-    Traverses a hierarchy of parents for a given fides key and returns
-    the hierarchy starting with the given fides key.
-    """
-    current_key = fides_key
-    fides_key_parent_hierarchy = []
-    while True:
-        fides_key_parent_hierarchy.append(current_key)
-        found_resource_map = get_resource_by_fides_key(
-            taxonomy=taxonomy, fides_key=current_key
-        )
-        if found_resource_map:
-            found_resource = list(found_resource_map.values())[-1]
-            if found_resource and "parent_key" in found_resource.__fields_set__:
-                current_key = getattr(found_resource, "parent_key")
-                if not current_key:
-                    break
-            else:
-                break
-        else:
-            echo_red(
-                "Found missing key ({}) referenced in taxonomy".format(current_key)
-            )
-            raise SystemExit(1)
-    return fides_key_parent_hierarchy
-
-
-def compare_rule_to_declaration(
-    rule_types: List[FidesKey],
-    declaration_type_hierarchies: List[List[FidesKey]],
-    rule_inclusion: InclusionEnum,
-) -> bool:
-    """
-    Compare the list of fides_keys within the rule against the list
-    of fides_keys hierarchies from the declaration and uses the rule's inclusion
-    field to determine whether the rule is triggered or not.
-    """
-    inclusion_map: Dict[InclusionEnum, Callable] = {
-        InclusionEnum.ANY: any,
-        InclusionEnum.ALL: all,
-        InclusionEnum.NONE: lambda x: not any(x),
-    }
-
-    matching_data_categories = [
-        bool(len(set(data_category_hierarchy).intersection(set(rule_types))) > 0)
-        for data_category_hierarchy in declaration_type_hierarchies
-    ]
-    result = inclusion_map[rule_inclusion](matching_data_categories)
-    return result
-
-
-def validate_fides_keys_exist_for_evaluation(
+def validate_fides_keys_exist(
     taxonomy: Taxonomy,
-    policy_rule: PolicyRule,
-    data_subjects: List[str],
-    data_categories: List[str],
-    data_qualifier: str,
-    data_use: str,
+    data_categories: Set[str],
+    data_subjects: Set[str],
+    data_qualifiers: Set[str],
+    data_uses: Set[str],
 ) -> None:
     """
-    Validates that keys used in evaluations are valid in the taxonomy
+    Validates that each of the given keys exists in the taxonomy as a
+    resource of the expected type, reporting all of the missing keys at once.
     """
     missing_key_errors = []
-
-    categories_keys = [category.fides_key for category in taxonomy.data_category]
-    for missing_data_category in set(
-        data_categories + policy_rule.data_categories.values
-    ) - set(categories_keys):
-        missing_key_errors.append(
-            "Missing DataCategory ({})".format(missing_data_category)
-        )
-
-    subject_keys = [subject.fides_key for subject in taxonomy.data_subject]
-    for missing_data_subject in set(
-        data_subjects + policy_rule.data_subjects.values
-    ) - set(subject_keys):
-        missing_key_errors.append(
-            "Missing DataSubject ({})".format(missing_data_subject)
-        )
-
-    qualifiers_keys = [qualifier.fides_key for qualifier in taxonomy.data_qualifier]
-    for missing_data_qualifier in set(
-        [data_qualifier, policy_rule.data_qualifier]
-    ) - set(qualifiers_keys):
-        missing_key_errors.append(
-            "Missing DataQualifier ({})".format(missing_data_qualifier)
-        )
-
-    data_use_keys = [data_use.fides_key for data_use in taxonomy.data_use]
-    for missing_data_use in set([data_use] + policy_rule.data_uses.values) - set(
-        data_use_keys
-    ):
-        missing_key_errors.append("Missing DataUse ({})".format(missing_data_use))
+    for resource_type, resource_name, fides_keys in [
+        ("data_category", "DataCategory", data_categories),
+        ("data_subject", "DataSubject", data_subjects),
+        ("data_qualifier", "DataQualifier", data_qualifiers),
+        ("data_use", "DataUse", data_uses),
+    ]:
+        existing_keys = {
+            resource.fides_key for resource in getattr(taxonomy, resource_type)
+        }
+        missing_key_errors += [
+            "Missing {} ({})".format(resource_name, missing_key)
+            for missing_key in sorted(fides_keys - existing_keys)
+        ]
 
     if missing_key_errors:
         echo_red(
@@ -229,275 +196,214 @@ def validate_fides_keys_exist_for_evaluation(
         raise SystemExit(1)
 
 
-def evaluate_policy_rule(
-    taxonomy: Taxonomy,
-    policy_rule: PolicyRule,
-    data_subjects: List[str],
-    data_categories: List[str],
-    data_qualifier: str,
-    data_use: str,
-) -> bool:
-    """
-    Given data subjects, data categories, data qualifier and data use,
-    builds hierarchies of applicable types and evaluates the result of a
-    policy rule
-    """
-    validate_fides_keys_exist_for_evaluation(
-        taxonomy=taxonomy,
-        policy_rule=policy_rule,
-        data_subjects=data_subjects,
-        data_categories=data_categories,
-        data_qualifier=data_qualifier,
-        data_use=data_use,
-    )
+def collect_policy_keys(policies: List[Policy], keys: EvaluationKeys) -> None:
+    """
+    Adds the keys used by the rules of each policy to the evaluation keys.
+    """
+    for policy in policies:
+        for rule in policy.rules:
+            keys.data_categories.update(rule.data_categories.values)
+            keys.data_subjects.update(rule.data_subjects.values)
+            keys.data_qualifiers.add(rule.data_qualifier)
+            keys.data_uses.update(rule.data_uses.values)
 
-    category_hierarchies = [
-        get_fides_key_parent_hierarchy(
-            taxonomy=taxonomy, fides_key=declaration_category
-        )
-        for declaration_category in data_categories
-    ]
-    data_category_result = compare_rule_to_declaration(
-        rule_types=policy_rule.data_categories.values,
-        declaration_type_hierarchies=category_hierarchies,
-        rule_inclusion=policy_rule.data_categories.inclusion,
-    )
 
-    # A declaration only has one data use, so its hierarchy gets put in a list
-    data_use_hierarchies = [
-        get_fides_key_parent_hierarchy(taxonomy=taxonomy, fides_key=data_use)
-    ]
-    data_use_result = compare_rule_to_declaration(
-        rule_types=policy_rule.data_uses.values,
-        declaration_type_hierarchies=data_use_hierarchies,
-        rule_inclusion=policy_rule.data_uses.inclusion,
-    )
+def collect_declaration_keys(systems: List[System], keys: EvaluationKeys) -> Set[str]:
+    """
+    Adds the keys used by the privacy declarations of each system to the
+    evaluation keys, and returns the datasets they reference.
+    """
+    dataset_references: Set[str] = set()
+    for system in systems:
+        for declaration in system.privacy_declarations:
+            keys.data_categories.update(declaration.data_categories)
+            keys.data_subjects.update(declaration.data_subjects)
+            keys.data_qualifiers.add(declaration.data_qualifier)
+            keys.data_uses.add(declaration.data_use)
+            dataset_references.update(declaration.dataset_references or [])
+    return dataset_references
+
+
+def collect_dataset_keys(
+    datasets: List[Dataset], dataset_references: Set[str], keys: EvaluationKeys
+) -> None:
+    """
+    Adds the keys used by each referenced dataset and its collections and
+    fields to the evaluation keys.
+    """
+    for dataset in datasets:
+        if dataset.fides_key in dataset_references:
+            for target in get_dataset_targets(dataset):
+                keys.data_categories.update(
+                    cast(List[str], target.member.data_categories)
+                )
+                keys.data_qualifiers.add(target.member.data_qualifier)
 
-    # A data subject does not have a hierarchical structure
-    data_subject_result = compare_rule_to_declaration(
-        rule_types=policy_rule.data_subjects.values,
-        declaration_type_hierarchies=[[data_subject] for data_subject in data_subjects],
-        rule_inclusion=policy_rule.data_subjects.inclusion,
-    )
 
-    data_qualifier_result = (
-        policy_rule.data_qualifier
-        in get_fides_key_parent_hierarchy(taxonomy=taxonomy, fides_key=data_qualifier)
-    )
+def validate_taxonomy_keys_exist_for_evaluation(taxonomy: Taxonomy) -> None:
+    """
+    Validates that every key used by the evaluation of the taxonomy is valid,
+    in a single pass over all of the policy rules, privacy declarations
+    and referenced datasets.
 
-    evaluation_result = all(
-        [
-            data_category_result,
-            data_subject_result,
-            data_use_result,
-            data_qualifier_result,
-        ]
+    This lets the evaluation itself run without checking keys for every
+    declaration, collection and field it evaluates.
+    """
+    keys = EvaluationKeys(set(), set(), set(), set())
+    collect_policy_keys(taxonomy.policy, keys)
+    dataset_references = collect_declaration_keys(taxonomy.system, keys)
+    collect_dataset_keys(taxonomy.dataset, dataset_references, keys)
+    validate_fides_keys_exist(
+        taxonomy=taxonomy,
+        data_categories=keys.data_categories,
+        data_subjects=keys.data_subjects,
+        data_qualifiers=keys.data_qualifiers,
+        data_uses=keys.data_uses,
     )
-    return evaluation_result
 
 
-def get_dataset_by_fides_key(taxonomy: Taxonomy, fides_key: str) -> Optional[Dataset]:
-    """
-    Returns a dataset within the taxonomy for a given fides key
+def iter_evaluation_violations(
+    taxonomy: Taxonomy, jobs: int = 1, cache_dir: Optional[str] = None
+) -> Iterator[EvaluationViolation]:
     """
-    dataset = next(
-        iter(
-            [dataset for dataset in taxonomy.dataset if dataset.fides_key == fides_key]
-        ),
-        None,
-    )
-    return cast(Dataset, dataset)
-
+    Check the stated constraints of each Privacy Policy's rules against
+    each system's privacy declarations, yielding each violation as it is found.
 
-def evaluate_dataset_reference(
-    taxonomy: Taxonomy,
-    policy: Policy,
-    system: System,
-    policy_rule: PolicyRule,
-    privacy_declaration: PrivacyDeclaration,
-    dataset: Dataset,
-) -> List[str]:
-    """
-    Evaluates the contraints of a given rule and dataset that was referenced
-    from a given privacy declaration
-    """
-    evaluation_detail_list = []
-    if dataset.data_categories:
-        dataset_result = evaluate_policy_rule(
-            taxonomy=taxonomy,
-            policy_rule=policy_rule,
-            data_subjects=privacy_declaration.data_subjects,
-            data_categories=dataset.data_categories,
-            data_qualifier=dataset.data_qualifier,
-            data_use=privacy_declaration.data_use,
+    If more than one job is requested, the systems are evaluated across
+    a pool of that many processes. If a cache directory is passed, only
+    the inputs that changed since the last cached evaluation are evaluated.
+    """
+    validate_taxonomy_keys_exist_for_evaluation(taxonomy)
+    evaluation_context = compile_evaluation_context(taxonomy, cache_dir=cache_dir)
+    if jobs > 1 and taxonomy.system:
+        yield from execute_parallel_evaluation(
+            evaluation_context=evaluation_context, jobs=jobs
         )
-
-        if dataset_result:
-            evaluation_detail_list += [
-                "Declaration ({}) of System ({}) failed Rule ({}) from Policy ({}) for Dataset ({})".format(
-                    privacy_declaration.name,
-                    system.fides_key,
-                    policy_rule.name,
-                    policy.fides_key,
-                    dataset.fides_key,
+    else:
+        for policy_index, policy in enumerate(taxonomy.policy):
+            for rule_index in range(len(policy.rules)):
+                yield from evaluate_systems(
+                    evaluation_context=evaluation_context,
+                    policy_index=policy_index,
+                    rule_index=rule_index,
+                    systems=taxonomy.system,
                 )
-            ]
-    for collection in dataset.collections:
-        if collection.data_categories:
-            dataset_collection_result = evaluate_policy_rule(
-                taxonomy=taxonomy,
-                policy_rule=policy_rule,
-                data_subjects=privacy_declaration.data_subjects,
-                data_categories=collection.data_categories,
-                data_qualifier=collection.data_qualifier,
-                data_use=privacy_declaration.data_use,
-            )
 
-            if dataset_collection_result:
-                evaluation_detail_list += [
-                    "Declaration ({}) of System ({}) failed Rule ({}) from Policy ({}) for DatasetCollection ({})".format(
-                        privacy_declaration.name,
-                        system.fides_key,
-                        policy_rule.name,
-                        policy.fides_key,
-                        collection.name,
-                    )
-                ]
-
-        for field in collection.fields:
-            if field.data_categories:
-                field_result = evaluate_policy_rule(
-                    taxonomy=taxonomy,
-                    policy_rule=policy_rule,
-                    data_subjects=privacy_declaration.data_subjects,
-                    data_categories=field.data_categories,
-                    data_qualifier=field.data_qualifier,
-                    data_use=privacy_declaration.data_use,
-                )
+    evaluation_cache = evaluation_context.evaluation_cache
+    if evaluation_cache:
+        evaluation_cache.save()
+        echo_green(
+            "Evaluation cache: {} hits, {} misses".format(
+                evaluation_cache.hits, evaluation_cache.misses
+            ),
+            err=True,
+        )
 
-                if field_result:
-                    evaluation_detail_list += [
-                        "Declaration ({}) of System ({}) failed Rule ({}) from Policy ({}) for DatasetField ({})".format(
-                            privacy_declaration.name,
-                            system.fides_key,
-                            policy_rule.name,
-                            policy.fides_key,
-                            field.name,
-                        )
-                    ]
-    return evaluation_detail_list
 
+def generate_evaluation_key() -> str:
+    """
+    Generates a unique fides_key for a new evaluation.
+    """
+    new_uuid = str(uuid.uuid4()).replace("-", "_")
+    timestamp = str(time.time()).split(".")[0]
+    return f"{new_uuid}_{timestamp}"
 
-def evaluate_privacy_declaration(
-    taxonomy: Taxonomy,
-    policy: Policy,
-    system: System,
-    policy_rule: PolicyRule,
-    privacy_declaration: PrivacyDeclaration,
-) -> List[str]:
+
+def execute_evaluation(
+    taxonomy: Taxonomy, jobs: int = 1, cache_dir: Optional[str] = None
+) -> Evaluation:
     """
-    Evaluates the contraints of a given rule and privacy declaration. This
-    includes additional data set references
+    Evaluates the taxonomy and collects all of its violations into an Evaluation.
     """
-    evaluation_detail_list = []
-    declaration_result = evaluate_policy_rule(
-        taxonomy=taxonomy,
-        policy_rule=policy_rule,
-        data_subjects=privacy_declaration.data_subjects,
-        data_categories=privacy_declaration.data_categories,
-        data_qualifier=privacy_declaration.data_qualifier,
-        data_use=privacy_declaration.data_use,
+    violations = list(
+        iter_evaluation_violations(taxonomy, jobs=jobs, cache_dir=cache_dir)
+    )
+    status_enum = StatusEnum.FAIL if len(violations) > 0 else StatusEnum.PASS
+    evaluation = Evaluation(
+        fides_key=generate_evaluation_key(),
+        status=status_enum,
+        violations=violations,
     )
+    return evaluation
 
-    if declaration_result:
-        evaluation_detail_list += [
-            "Declaration ({}) of System ({}) failed Rule ({}) from Policy ({})".format(
-                privacy_declaration.name,
-                system.fides_key,
-                policy_rule.name,
-                policy.fides_key,
-            )
-        ]
 
-    for dataset_reference in privacy_declaration.dataset_references or []:
-        dataset = get_dataset_by_fides_key(
-            taxonomy=taxonomy, fides_key=dataset_reference
-        )
-        if dataset:
-            evaluation_detail_list += evaluate_dataset_reference(
-                taxonomy=taxonomy,
-                policy=policy,
-                system=system,
-                policy_rule=policy_rule,
-                privacy_declaration=privacy_declaration,
-                dataset=dataset,
-            )
-        else:
-            echo_red(
-                "Dataset ({}) referenced in Declaration ({}) could not be found in taxonomy".format(
-                    dataset_reference, privacy_declaration.name
-                )
-            )
-            raise SystemExit(1)
-    return evaluation_detail_list
+def echo_violations(
+    violations: Iterable[EvaluationViolation],
+) -> Iterator[EvaluationViolation]:
+    """
+    Echoes each violation as a line of JSON as it passes through.
+    """
+    for violation in violations:
+        echo_red(json.dumps(violation._asdict()))
+        yield violation
 
 
-def execute_evaluation(taxonomy: Taxonomy) -> Evaluation:
+def generate_evaluation_chunks(
+    evaluation: Evaluation,
+    violations: Iterable[EvaluationViolation],
+    chunk_size: int = EVALUATION_CHUNK_SIZE,
+) -> Iterator[bytes]:
     """
-    Check the stated constraints of each Privacy Policy's rules against
-    each system's privacy declarations.
+    Generates the JSON body of an evaluation in chunks of violations, so it can
+    be sent to the server without holding all of its violations in memory.
+
+    The status is written last and set on the evaluation once every
+    violation has been consumed.
     """
-    evaluation_detail_list = []
-    for policy in taxonomy.policy:
-        for rule in policy.rules:
-            for system in taxonomy.system:
-                for declaration in system.privacy_declarations:
-
-                    evaluation_detail_list += evaluate_privacy_declaration(
-                        taxonomy=taxonomy,
-                        policy=policy,
-                        system=system,
-                        policy_rule=rule,
-                        privacy_declaration=declaration,
-                    )
-    status_enum = (
-        StatusEnum.FAIL if len(evaluation_detail_list) > 0 else StatusEnum.PASS
+    evaluation_json = evaluation.json(
+        exclude={"violations", "status"}, exclude_none=True
     )
-    new_uuid = str(uuid.uuid4()).replace("-", "_")
-    timestamp = str(time.time()).split(".")[0]
-    generated_key = f"{new_uuid}_{timestamp}"
-    evaluation = Evaluation(
-        fides_key=generated_key,
-        status=status_enum,
-        details=evaluation_detail_list,
+    yield (evaluation_json[:-1] + ', "violations": [').encode("utf-8")
+
+    separator = ""
+    chunk: List[str] = []
+    for violation in violations:
+        chunk.append(json.dumps(violation._asdict()))
+        if len(chunk) == chunk_size:
+            yield (separator + ", ".join(chunk)).encode("utf-8")
+            separator = ", "
+            chunk = []
+    if chunk:
+        yield (separator + ", ".join(chunk)).encode("utf-8")
+        separator = ", "
+
+    evaluation.status = StatusEnum.FAIL if separator else StatusEnum.PASS
+    yield '], "status": {}}}'.format(json.dumps(evaluation.status.value)).encode(
+        "utf-8"
     )
-    return evaluation
 
 
 def populate_referenced_keys(
     taxonomy: Taxonomy,
     url: AnyHttpUrl,
     headers: Dict[str, str],
-    last_keys: List[FidesKey],
+    local_taxonomy: Optional[LazyTaxonomy] = None,
 ) -> Taxonomy:
     """
     Takes in a taxonomy with potentially missing references to fides keys.
-    Populates any missing fides_keys recursively and returns the populated taxonomy.
+    Populates any missing fides_keys and returns the populated taxonomy.
 
-    Recursively calls itself after every hydration to make sure there are no new missing keys.
+    Keeps fetching the keys referenced by newly populated resources until
+    there are no new missing keys, from the local taxonomy if one is
+    passed and otherwise from the server.
     """
-    missing_resource_keys = get_referenced_missing_keys(taxonomy)
-    if missing_resource_keys and set(missing_resource_keys) != set(last_keys):
-        taxonomy = hydrate_missing_resources(
-            url=url,
-            headers=headers,
-            missing_resource_keys=missing_resource_keys,
-            dehydrated_taxonomy=taxonomy,
-        )
-        return populate_referenced_keys(
-            taxonomy=taxonomy, url=url, headers=headers, last_keys=missing_resource_keys
-        )
-    return taxonomy
+    return hydrate_referenced_resources(
+        url=url,
+        headers=headers,
+        dehydrated_taxonomy=taxonomy,
+        local_taxonomy=local_taxonomy,
+    )
+
+
+def get_local_policies(local_taxonomy: LazyTaxonomy, fides_key: str) -> List[Policy]:
+    """
+    Returns the local policy with the fides_key, or every local
+    policy if no fides_key is provided.
+    """
+    if not fides_key:
+        return local_taxonomy.get_resources("policy")
+    local_policy = local_taxonomy.get_resource("policy", fides_key)
+    return [local_policy] if local_policy else []
 
 
 def evaluate(
@@ -507,19 +413,34 @@ def evaluate(
     headers: Dict[str, str],
     message: str,
     dry: bool,
-) -> Evaluation:
+    jobs: int = 1,
+    cache_dir: Optional[str] = None,
+    local_taxonomy: Optional[LazyTaxonomy] = None,
+) -> EvaluationSummary:
     """
     Perform evaluation for a given Policy. If a policy key is not
     provided, perform an evaluation for all of the Policies in an organzation
 
     Local Policy definition files will be used as opposed to their
     server-definitions if available.
+
+    Violations are echoed as JSON Lines and streamed to the server
+    as they are found, so only the key and status of the evaluation
+    are returned.
+
+    Local resources are only parsed if they're evaluated or referenced.
+    If the manifests were already loaded, like for `apply`, their
+    `local_taxonomy` can be passed so they aren't loaded again.
     """
-    taxonomy = parse(manifests_dir)
+    if local_taxonomy is None:
+        local_taxonomy = parse_lazily(
+            manifests_dir, jobs=jobs, cache_dir=cache_dir or ""
+        )
+    taxonomy = Taxonomy(system=local_taxonomy.get_resources("system"))
 
     # Populate all of the policies to evaluate
     taxonomy.policy = get_evaluation_policies(
-        local_policies=taxonomy.policy,
+        local_policies=get_local_policies(local_taxonomy, fides_key),
         evaluate_fides_key=fides_key,
         url=url,
         headers=headers,
@@ -530,29 +451,45 @@ def evaluate(
     echo_green(
         "Evaluating the following policies:\n{}".format(
             "\n".join([key.fides_key for key in taxonomy.policy])
-        )
+        ),
+        err=True,
     )
-    print("-" * 10)
+    click.echo("-" * 10, err=True)
 
-    echo_green("Checking for missing resources...")
-    populate_referenced_keys(taxonomy=taxonomy, url=url, headers=headers, last_keys=[])
+    echo_green("Checking for missing resources...", err=True)
+    populate_referenced_keys(
+        taxonomy=taxonomy, url=url, headers=headers, local_taxonomy=local_taxonomy
+    )
 
-    echo_green("Executing evaluations...")
-    evaluation = execute_evaluation(taxonomy)
-    evaluation.message = message
-    if not dry:
-        echo_green("Sending the evaluation results to the server...")
+    echo_green("Executing evaluations...", err=True)
+    evaluation = Evaluation(
+        fides_key=generate_evaluation_key(),
+        status=StatusEnum.PASS,
+        violations=[],
+        message=message,
+    )
+    evaluation_chunks = generate_evaluation_chunks(
+        evaluation=evaluation,
+        violations=echo_violations(
+            iter_evaluation_violations(taxonomy, jobs=jobs, cache_dir=cache_dir)
+        ),
+    )
+    if dry:
+        for _ in evaluation_chunks:
+            pass
+    else:
+        echo_green("Streaming the evaluation results to the server...", err=True)
         response = api.create(
             url=url,
             resource_type="evaluation",
-            json_resource=evaluation.json(exclude_none=True),
+            json_resource=evaluation_chunks,
             headers=headers,
         )
         handle_cli_response(response, verbose=False)
 
-    if evaluation.status == "FAIL":
-        pretty_echo(evaluation.dict(), color="red")
+    if evaluation.status == StatusEnum.FAIL:
+        echo_red("Evaluation failed!", err=True)
         raise SystemExit(1)
-    echo_green("Evaluation passed!")
+    echo_green("Evaluation passed!", err=True)
 
-    return evaluation
+    return EvaluationSummary(fides_key=evaluation.fides_key, status=evaluation.status)
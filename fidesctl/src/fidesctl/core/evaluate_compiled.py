@@ -0,0 +1,837 @@
+"""
+Module for evaluating policies against a compiled taxonomy.
+
+The taxonomy is indexed, and its policy rules and referenced datasets are
+compiled into bitsets and matrices. The systems are then evaluated against
+them, optionally across a pool of processes.
+"""
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from fidesctl.core.evaluation_cache import (
+    EvaluationCache,
+    EvaluationCacheUpdate,
+    get_content_hash,
+)
+from fidesctl.core.utils import echo_red
+from fideslang.models import (
+    Dataset,
+    DatasetCollection,
+    DatasetField,
+    EvaluationViolation,
+    InclusionEnum,
+    Policy,
+    PolicyRule,
+    PrivacyDeclaration,
+    System,
+    Taxonomy,
+)
+from fideslang.utils import IndexedTaxonomy
+from fideslang.validation import FidesKey
+
+
+class TaxonomyIndexEntry(NamedTuple):
+    """
+    The resource type and the parent hierarchy of an indexed fides_key.
+
+    The hierarchy starts with the fides_key itself. Every indexed key is
+    assigned a unique bit position, and `hierarchy_bits` has the bits of
+    each key in the hierarchy set.
+    """
+
+    resource_type: str
+    hierarchy: List[FidesKey]
+    position: int
+    hierarchy_bits: int
+
+
+class CompiledPrivacyRule(NamedTuple):
+    """
+    A PrivacyRule with its values compiled into a bitset of index positions.
+    """
+
+    inclusion: InclusionEnum
+    bits: int
+
+
+class CompiledPolicyRule(NamedTuple):
+    """
+    A PolicyRule with each PrivacyRule and its data qualifier compiled
+    into bitsets of index positions.
+    """
+
+    data_categories: CompiledPrivacyRule
+    data_uses: CompiledPrivacyRule
+    data_subjects: CompiledPrivacyRule
+    data_qualifier_bits: int
+
+
+class DatasetTarget(NamedTuple):
+    """
+    A dataset, collection or field that can fail a policy rule, along with
+    its type and its path within the dataset.
+    """
+
+    member: Union[Dataset, DatasetCollection, DatasetField]
+    target_type: str
+    target_path: Tuple[str, ...]
+
+
+class CompiledDataset(NamedTuple):
+    """
+    Every Dataset, DatasetCollection and DatasetField with data categories,
+    encoded as boolean matrices over the taxonomy nodes they reference.
+
+    `category_matrix` has a row per target data category, closed over the
+    category's hierarchy, and `category_offsets` holds the first row of each
+    target. `qualifier_matrix` has a row per target for its data qualifier.
+    """
+
+    target_types: List[str]
+    target_paths: List[Tuple[str, ...]]
+    category_offsets: NDArray[np.intp]
+    category_matrix: NDArray[np.bool_]
+    category_positions: List[int]
+    qualifier_matrix: NDArray[np.bool_]
+    qualifier_positions: List[int]
+
+
+class EvaluationContext(NamedTuple):
+    """
+    Everything compiled from a taxonomy that is shared by all of its evaluations.
+
+    `compiled_rules` mirrors the rules of each policy in the taxonomy, and
+    `compiled_datasets` is filled in as datasets are first referenced.
+    """
+
+    taxonomy: Taxonomy
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry]
+    compiled_rules: List[List[CompiledPolicyRule]]
+    datasets: Dict[FidesKey, Dataset]
+    compiled_datasets: Dict[FidesKey, CompiledDataset]
+    evaluation_cache: Optional[EvaluationCache]
+
+
+# The privacy data types whose hierarchies affect evaluation results
+PRIVACY_RESOURCE_TYPES = ["data_category", "data_qualifier", "data_subject", "data_use"]
+
+# Set in each process of the pool by `init_evaluation_worker`
+WORKER_CONTEXT: Optional[EvaluationContext] = None
+
+
+def get_parent_keys(
+    taxonomy: Taxonomy,
+) -> Tuple[Dict[FidesKey, str], Dict[FidesKey, Optional[FidesKey]]]:
+    """
+    Returns the resource type and the parent key of every fides_key in the taxonomy.
+    """
+    resource_types: Dict[FidesKey, str] = {}
+    parent_keys: Dict[FidesKey, Optional[FidesKey]] = {}
+    for resource_type in taxonomy.__fields_set__:
+        for resource in getattr(taxonomy, resource_type):
+            resource_types[resource.fides_key] = resource_type
+            parent_keys[resource.fides_key] = getattr(resource, "parent_key", None)
+    return resource_types, parent_keys
+
+
+def get_parent_chain(
+    fides_key: FidesKey,
+    parent_keys: Dict[FidesKey, Optional[FidesKey]],
+    hierarchies: Dict[FidesKey, List[FidesKey]],
+) -> Tuple[List[FidesKey], List[FidesKey]]:
+    """
+    Walks up the parents of a fides_key until reaching a top-level, missing
+    or already indexed key.
+
+    Returns the keys that were walked and the known hierarchy above them.
+    """
+    parent_chain: List[FidesKey] = []
+    current_key: Optional[FidesKey] = fides_key
+    while current_key and current_key not in hierarchies:
+        parent_chain.append(current_key)
+        if current_key not in parent_keys:
+            break
+        current_key = parent_keys[current_key]
+    return parent_chain, hierarchies.get(current_key, []) if current_key else []
+
+
+def build_hierarchies(
+    parent_keys: Dict[FidesKey, Optional[FidesKey]]
+) -> Dict[FidesKey, List[FidesKey]]:
+    """
+    Returns the full parent hierarchy of every fides_key, walking each
+    parent only once. If a parent is missing, the hierarchy ends with it.
+    """
+    hierarchies: Dict[FidesKey, List[FidesKey]] = {}
+    for fides_key in parent_keys:
+        parent_chain, known_hierarchy = get_parent_chain(
+            fides_key, parent_keys, hierarchies
+        )
+        for position, chain_key in enumerate(parent_chain):
+            if chain_key in parent_keys:
+                hierarchies[chain_key] = parent_chain[position:] + known_hierarchy
+    return hierarchies
+
+
+def build_taxonomy_index(taxonomy: Taxonomy) -> Dict[FidesKey, TaxonomyIndexEntry]:
+    """
+    Builds an index of every fides_key in the taxonomy to its resource type
+    and its full parent hierarchy, so that evaluations don't need to scan
+    the taxonomy for every key they look up.
+
+    If a parent is missing from the taxonomy, the hierarchy ends with
+    the missing key.
+    """
+    resource_types, parent_keys = get_parent_keys(taxonomy)
+    hierarchies = build_hierarchies(parent_keys)
+    positions = {fides_key: position for position, fides_key in enumerate(hierarchies)}
+    return {
+        fides_key: TaxonomyIndexEntry(
+            resource_type=resource_types[fides_key],
+            hierarchy=hierarchy,
+            position=positions[fides_key],
+            hierarchy_bits=sum(
+                1 << positions[hierarchy_key]
+                for hierarchy_key in hierarchy
+                if hierarchy_key in positions
+            ),
+        )
+        for fides_key, hierarchy in hierarchies.items()
+    }
+
+
+def get_taxonomy_index_entry(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry], fides_key: str
+) -> TaxonomyIndexEntry:
+    """
+    Returns the index entry for a given fides key, making sure that the
+    key and every parent in its hierarchy exist in the taxonomy.
+    """
+    missing_key = None
+    if fides_key not in taxonomy_index:
+        missing_key = fides_key
+    elif taxonomy_index[fides_key].hierarchy[-1] not in taxonomy_index:
+        missing_key = taxonomy_index[fides_key].hierarchy[-1]
+
+    if missing_key:
+        echo_red("Found missing key ({}) referenced in taxonomy".format(missing_key))
+        raise SystemExit(1)
+    return taxonomy_index[fides_key]
+
+
+def get_indexed_fides_key_hierarchy(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry], fides_key: str
+) -> List[FidesKey]:
+    """
+    Returns the hierarchy of parents for a given fides key from a
+    taxonomy index, starting with the given fides key.
+    """
+    return get_taxonomy_index_entry(
+        taxonomy_index=taxonomy_index, fides_key=fides_key
+    ).hierarchy
+
+
+def get_fides_key_bits(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry], fides_keys: List[FidesKey]
+) -> int:
+    """
+    Returns a bitset with the index position of each of the given fides keys set.
+
+    Keys that aren't in the index can never match, so they are left out.
+    """
+    return sum(
+        {
+            1 << taxonomy_index[fides_key].position
+            for fides_key in fides_keys
+            if fides_key in taxonomy_index
+        }
+    )
+
+
+def compile_policy_rule(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry], policy_rule: PolicyRule
+) -> CompiledPolicyRule:
+    """
+    Compiles the values of a policy rule into bitsets over the taxonomy index,
+    so it only needs to be done once per rule instead of once per comparison.
+    """
+    return CompiledPolicyRule(
+        data_categories=CompiledPrivacyRule(
+            inclusion=policy_rule.data_categories.inclusion,
+            bits=get_fides_key_bits(taxonomy_index, policy_rule.data_categories.values),
+        ),
+        data_uses=CompiledPrivacyRule(
+            inclusion=policy_rule.data_uses.inclusion,
+            bits=get_fides_key_bits(taxonomy_index, policy_rule.data_uses.values),
+        ),
+        data_subjects=CompiledPrivacyRule(
+            inclusion=policy_rule.data_subjects.inclusion,
+            bits=get_fides_key_bits(taxonomy_index, policy_rule.data_subjects.values),
+        ),
+        data_qualifier_bits=get_fides_key_bits(
+            taxonomy_index, [policy_rule.data_qualifier]
+        ),
+    )
+
+
+def compare_compiled_rule_to_declaration(
+    compiled_privacy_rule: CompiledPrivacyRule,
+    declaration_hierarchy_bits: List[int],
+) -> bool:
+    """
+    Compare the compiled bits of a rule against the hierarchy bits of each
+    of the declaration's types, and use the rule's inclusion to determine
+    whether the rule is triggered or not.
+
+    Each declaration type hierarchy matches when it shares a bit with the rule.
+    """
+    inclusion_map: Dict[InclusionEnum, Callable] = {
+        InclusionEnum.ANY: any,
+        InclusionEnum.ALL: all,
+        InclusionEnum.NONE: lambda x: not any(x),
+    }
+
+    matching_hierarchies = (
+        hierarchy_bits & compiled_privacy_rule.bits
+        for hierarchy_bits in declaration_hierarchy_bits
+    )
+    return inclusion_map[compiled_privacy_rule.inclusion](matching_hierarchies)
+
+
+def evaluate_data_use_and_subjects(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry],
+    compiled_policy_rule: CompiledPolicyRule,
+    data_subjects: List[str],
+    data_use: str,
+) -> bool:
+    """
+    Evaluates the data use and data subjects of a compiled policy rule,
+    which only depend on the privacy declaration.
+    """
+    # A declaration only has one data use, so its hierarchy gets put in a list
+    data_use_hierarchy_bits = [
+        get_taxonomy_index_entry(
+            taxonomy_index=taxonomy_index, fides_key=data_use
+        ).hierarchy_bits
+    ]
+    data_use_result = compare_compiled_rule_to_declaration(
+        compiled_privacy_rule=compiled_policy_rule.data_uses,
+        declaration_hierarchy_bits=data_use_hierarchy_bits,
+    )
+
+    # A data subject does not have a hierarchical structure
+    data_subject_result = compare_compiled_rule_to_declaration(
+        compiled_privacy_rule=compiled_policy_rule.data_subjects,
+        declaration_hierarchy_bits=[
+            get_fides_key_bits(taxonomy_index, [data_subject])
+            for data_subject in data_subjects
+        ],
+    )
+
+    return data_use_result and data_subject_result
+
+
+def evaluate_policy_rule(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry],
+    compiled_policy_rule: CompiledPolicyRule,
+    data_subjects: List[str],
+    data_categories: List[str],
+    data_qualifier: str,
+    data_use: str,
+) -> bool:
+    """
+    Given data subjects, data categories, data qualifier and data use,
+    looks up the hierarchies of applicable types and evaluates the result
+    of a compiled policy rule
+    """
+    category_hierarchy_bits = [
+        get_taxonomy_index_entry(
+            taxonomy_index=taxonomy_index, fides_key=declaration_category
+        ).hierarchy_bits
+        for declaration_category in data_categories
+    ]
+    data_category_result = compare_compiled_rule_to_declaration(
+        compiled_privacy_rule=compiled_policy_rule.data_categories,
+        declaration_hierarchy_bits=category_hierarchy_bits,
+    )
+
+    data_use_and_subject_result = evaluate_data_use_and_subjects(
+        taxonomy_index=taxonomy_index,
+        compiled_policy_rule=compiled_policy_rule,
+        data_subjects=data_subjects,
+        data_use=data_use,
+    )
+
+    data_qualifier_result = bool(
+        compiled_policy_rule.data_qualifier_bits
+        & get_taxonomy_index_entry(
+            taxonomy_index=taxonomy_index, fides_key=data_qualifier
+        ).hierarchy_bits
+    )
+
+    evaluation_result = all(
+        [
+            data_category_result,
+            data_use_and_subject_result,
+            data_qualifier_result,
+        ]
+    )
+    return evaluation_result
+
+
+def build_hierarchy_matrix(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry], fides_keys: List[str]
+) -> Tuple[NDArray[np.bool_], List[int]]:
+    """
+    Builds a boolean matrix with a row per fides_key and a column per taxonomy
+    node in any of their hierarchies, where each row is set for every node in
+    its key's hierarchy.
+
+    Returns the matrix and the index position of each column.
+    """
+    columns: Dict[FidesKey, int] = {}
+    row_numbers: List[int] = []
+    column_numbers: List[int] = []
+    for row_number, fides_key in enumerate(fides_keys):
+        hierarchy = get_taxonomy_index_entry(
+            taxonomy_index=taxonomy_index, fides_key=fides_key
+        ).hierarchy
+        for hierarchy_key in hierarchy:
+            row_numbers.append(row_number)
+            column_numbers.append(columns.setdefault(hierarchy_key, len(columns)))
+
+    matrix = np.zeros((len(fides_keys), len(columns)), dtype=bool)
+    matrix[row_numbers, column_numbers] = True
+    positions = [taxonomy_index[fides_key].position for fides_key in columns]
+    return matrix, positions
+
+
+def get_dataset_targets(dataset: Dataset) -> List[DatasetTarget]:
+    """
+    Returns the dataset and each of its collections and fields that have
+    data categories, in order, along with their type and path.
+    """
+    targets = [DatasetTarget(dataset, "Dataset", (dataset.fides_key,))]
+    for collection in dataset.collections:
+        collection_path = (dataset.fides_key, collection.name)
+        targets.append(DatasetTarget(collection, "DatasetCollection", collection_path))
+        targets += [
+            DatasetTarget(field, "DatasetField", collection_path + (field.name,))
+            for field in collection.fields
+        ]
+    return [target for target in targets if target.member.data_categories]
+
+
+def compile_dataset(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry], dataset: Dataset
+) -> CompiledDataset:
+    """
+    Encodes all of the dataset, collection and field data categories and
+    data qualifiers of a dataset into matrices, so every policy rule can be
+    evaluated against the whole dataset at once.
+    """
+    targets = get_dataset_targets(dataset)
+    category_lists = [
+        cast(List[str], target.member.data_categories) for target in targets
+    ]
+    category_matrix, category_positions = build_hierarchy_matrix(
+        taxonomy_index=taxonomy_index,
+        fides_keys=list(chain.from_iterable(category_lists)),
+    )
+    qualifier_matrix, qualifier_positions = build_hierarchy_matrix(
+        taxonomy_index=taxonomy_index,
+        fides_keys=[target.member.data_qualifier for target in targets],
+    )
+    return CompiledDataset(
+        target_types=[target.target_type for target in targets],
+        target_paths=[target.target_path for target in targets],
+        category_offsets=np.cumsum(
+            [0] + list(map(len, category_lists[:-1])), dtype=np.intp
+        ),
+        category_matrix=category_matrix,
+        category_positions=category_positions,
+        qualifier_matrix=qualifier_matrix,
+        qualifier_positions=qualifier_positions,
+    )
+
+
+def get_matching_columns(positions: List[int], bits: int) -> List[int]:
+    """
+    Returns the matrix columns whose index position is set in the bitset.
+    """
+    return [column for column, position in enumerate(positions) if bits >> position & 1]
+
+
+def evaluate_dataset_reference(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry],
+    policy: Policy,
+    system: System,
+    policy_rule: PolicyRule,
+    compiled_policy_rule: CompiledPolicyRule,
+    privacy_declaration: PrivacyDeclaration,
+    compiled_dataset: CompiledDataset,
+) -> List[EvaluationViolation]:
+    """
+    Evaluates the contraints of a given rule and dataset that was referenced
+    from a given privacy declaration
+
+    The dataset, all of its collections and all of their fields are evaluated
+    at once against the compiled dataset matrices.
+    """
+    if not compiled_dataset.target_paths or not evaluate_data_use_and_subjects(
+        taxonomy_index=taxonomy_index,
+        compiled_policy_rule=compiled_policy_rule,
+        data_subjects=privacy_declaration.data_subjects,
+        data_use=privacy_declaration.data_use,
+    ):
+        return []
+
+    inclusion_map: Dict[InclusionEnum, Callable] = {
+        InclusionEnum.ANY: np.logical_or.reduceat,
+        InclusionEnum.ALL: np.logical_and.reduceat,
+        InclusionEnum.NONE: lambda x, y: ~np.logical_or.reduceat(x, y),
+    }
+
+    category_columns = get_matching_columns(
+        compiled_dataset.category_positions,
+        compiled_policy_rule.data_categories.bits,
+    )
+    matching_categories = compiled_dataset.category_matrix[:, category_columns].any(
+        axis=1
+    )
+    data_category_results = inclusion_map[
+        compiled_policy_rule.data_categories.inclusion
+    ](matching_categories, compiled_dataset.category_offsets)
+
+    qualifier_columns = get_matching_columns(
+        compiled_dataset.qualifier_positions,
+        compiled_policy_rule.data_qualifier_bits,
+    )
+    data_qualifier_results = compiled_dataset.qualifier_matrix[
+        :, qualifier_columns
+    ].any(axis=1)
+
+    return [
+        EvaluationViolation(
+            policy=policy.fides_key,
+            rule=policy_rule.name,
+            system=system.fides_key,
+            declaration=privacy_declaration.name,
+            target_type=compiled_dataset.target_types[target],
+            target_path=compiled_dataset.target_paths[target],
+        )
+        for target in np.flatnonzero(data_category_results & data_qualifier_results)
+    ]
+
+
+def load_violation(violation: Sequence) -> EvaluationViolation:
+    """
+    Loads a violation from a cache entry, where its target path is a list.
+    """
+    *violation_fields, target_path = violation
+    return EvaluationViolation(*violation_fields, tuple(target_path))
+
+
+def get_cached_violations(
+    evaluation_cache: Optional[EvaluationCache],
+    cache_key_parts: List[Union[str, BaseModel]],
+    evaluate_violations: Callable[[], List[EvaluationViolation]],
+) -> List[EvaluationViolation]:
+    """
+    Returns the cached violations for the given inputs, only running
+    the evaluation if there is no cache or it doesn't have them yet.
+    """
+    if not evaluation_cache:
+        return evaluate_violations()
+
+    cache_key = evaluation_cache.get_key(*cache_key_parts)
+    cached_violations = evaluation_cache.get(cache_key)
+    if cached_violations is None:
+        violations = evaluate_violations()
+        evaluation_cache.add(cache_key, violations)
+        return violations
+    return [load_violation(violation) for violation in cached_violations]
+
+
+def evaluate_declaration(
+    taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry],
+    policy: Policy,
+    system: System,
+    policy_rule: PolicyRule,
+    compiled_policy_rule: CompiledPolicyRule,
+    privacy_declaration: PrivacyDeclaration,
+) -> List[EvaluationViolation]:
+    """
+    Evaluates the contraints of a given rule and privacy declaration,
+    without its data set references
+    """
+    declaration_result = evaluate_policy_rule(
+        taxonomy_index=taxonomy_index,
+        compiled_policy_rule=compiled_policy_rule,
+        data_subjects=privacy_declaration.data_subjects,
+        data_categories=privacy_declaration.data_categories,
+        data_qualifier=privacy_declaration.data_qualifier,
+        data_use=privacy_declaration.data_use,
+    )
+
+    if declaration_result:
+        return [
+            EvaluationViolation(
+                policy=policy.fides_key,
+                rule=policy_rule.name,
+                system=system.fides_key,
+                declaration=privacy_declaration.name,
+            )
+        ]
+    return []
+
+
+def evaluate_dataset(
+    evaluation_context: EvaluationContext,
+    policy: Policy,
+    system: System,
+    policy_rule: PolicyRule,
+    compiled_policy_rule: CompiledPolicyRule,
+    privacy_declaration: PrivacyDeclaration,
+    dataset: Dataset,
+) -> List[EvaluationViolation]:
+    """
+    Evaluates a dataset referenced by a privacy declaration.
+
+    Datasets are compiled the first time they are evaluated and stored
+    in the evaluation context to be reused by the following rules.
+    """
+    compiled_datasets = evaluation_context.compiled_datasets
+    if dataset.fides_key not in compiled_datasets:
+        compiled_datasets[dataset.fides_key] = compile_dataset(
+            taxonomy_index=evaluation_context.taxonomy_index, dataset=dataset
+        )
+
+    return evaluate_dataset_reference(
+        taxonomy_index=evaluation_context.taxonomy_index,
+        policy=policy,
+        system=system,
+        policy_rule=policy_rule,
+        compiled_policy_rule=compiled_policy_rule,
+        privacy_declaration=privacy_declaration,
+        compiled_dataset=compiled_datasets[dataset.fides_key],
+    )
+
+
+def evaluate_privacy_declaration(
+    evaluation_context: EvaluationContext,
+    policy: Policy,
+    system: System,
+    policy_rule: PolicyRule,
+    compiled_policy_rule: CompiledPolicyRule,
+    privacy_declaration: PrivacyDeclaration,
+) -> Iterator[EvaluationViolation]:
+    """
+    Evaluates the contraints of a given rule and privacy declaration. This
+    includes additional data set references
+
+    If the evaluation context has a cache, the declaration and each
+    referenced dataset are only evaluated when their inputs have changed.
+    """
+    evaluation_cache = evaluation_context.evaluation_cache
+    yield from get_cached_violations(
+        evaluation_cache=evaluation_cache,
+        cache_key_parts=[
+            policy.fides_key,
+            policy_rule,
+            system.fides_key,
+            privacy_declaration,
+        ],
+        evaluate_violations=partial(
+            evaluate_declaration,
+            taxonomy_index=evaluation_context.taxonomy_index,
+            policy=policy,
+            system=system,
+            policy_rule=policy_rule,
+            compiled_policy_rule=compiled_policy_rule,
+            privacy_declaration=privacy_declaration,
+        ),
+    )
+
+    for dataset_reference in privacy_declaration.dataset_references or []:
+        dataset = evaluation_context.datasets.get(dataset_reference)
+        if not dataset:
+            echo_red(
+                "Dataset ({}) referenced in Declaration ({}) could not be found in taxonomy".format(
+                    dataset_reference, privacy_declaration.name
+                )
+            )
+            raise SystemExit(1)
+
+        yield from get_cached_violations(
+            evaluation_cache=evaluation_cache,
+            cache_key_parts=[
+                policy.fides_key,
+                policy_rule,
+                system.fides_key,
+                privacy_declaration,
+                dataset,
+            ],
+            evaluate_violations=partial(
+                evaluate_dataset,
+                evaluation_context=evaluation_context,
+                policy=policy,
+                system=system,
+                policy_rule=policy_rule,
+                compiled_policy_rule=compiled_policy_rule,
+                privacy_declaration=privacy_declaration,
+                dataset=dataset,
+            ),
+        )
+
+
+def get_taxonomy_version(taxonomy_index: Dict[FidesKey, TaxonomyIndexEntry]) -> str:
+    """
+    Returns a hash of the hierarchy of every privacy data type in the index,
+    which changes whenever any of their ancestries change.
+    """
+    hierarchies = sorted(
+        (fides_key, entry.resource_type, entry.hierarchy)
+        for fides_key, entry in taxonomy_index.items()
+        if entry.resource_type in PRIVACY_RESOURCE_TYPES
+    )
+    return get_content_hash(json.dumps(hierarchies))
+
+
+def compile_evaluation_context(
+    taxonomy: Taxonomy, cache_dir: Optional[str] = None
+) -> EvaluationContext:
+    """
+    Indexes the taxonomy and compiles all of its policy rules.
+
+    If a cache directory is passed, the evaluation cache stored there is loaded.
+    """
+    taxonomy_index = build_taxonomy_index(taxonomy)
+    indexed_taxonomy = IndexedTaxonomy(taxonomy)
+    evaluation_cache = (
+        EvaluationCache.load(
+            cache_dir=cache_dir, taxonomy_version=get_taxonomy_version(taxonomy_index)
+        )
+        if cache_dir
+        else None
+    )
+    return EvaluationContext(
+        taxonomy=taxonomy,
+        taxonomy_index=taxonomy_index,
+        compiled_rules=[
+            [compile_policy_rule(taxonomy_index, rule) for rule in policy.rules]
+            for policy in taxonomy.policy
+        ],
+        datasets=cast(Dict[FidesKey, Dataset], indexed_taxonomy.resources["dataset"]),
+        compiled_datasets={},
+        evaluation_cache=evaluation_cache,
+    )
+
+
+def evaluate_systems(
+    evaluation_context: EvaluationContext,
+    policy_index: int,
+    rule_index: int,
+    systems: List[System],
+) -> Iterator[EvaluationViolation]:
+    """
+    Evaluates a single rule of a policy against each privacy declaration
+    of the given systems.
+    """
+    policy = evaluation_context.taxonomy.policy[policy_index]
+    for system in systems:
+        for declaration in system.privacy_declarations:
+            yield from evaluate_privacy_declaration(
+                evaluation_context=evaluation_context,
+                policy=policy,
+                system=system,
+                policy_rule=policy.rules[rule_index],
+                compiled_policy_rule=evaluation_context.compiled_rules[policy_index][
+                    rule_index
+                ],
+                privacy_declaration=declaration,
+            )
+
+
+def init_evaluation_worker(evaluation_context: EvaluationContext) -> None:
+    """
+    Stores the evaluation context in a worker process, so it only needs
+    to be sent to each worker once.
+    """
+    global WORKER_CONTEXT  # pylint: disable=global-statement
+    WORKER_CONTEXT = evaluation_context
+
+
+def evaluate_systems_in_worker(
+    policy_index: int, rule_index: int, system_start: int, system_end: int
+) -> Tuple[List[EvaluationViolation], Optional[EvaluationCacheUpdate]]:
+    """
+    Evaluates a rule against a slice of the taxonomy's systems, using the
+    evaluation context of the current worker process.
+
+    Also returns the changes to the worker's copy of the evaluation cache.
+    """
+    evaluation_context = cast(EvaluationContext, WORKER_CONTEXT)
+    violations = list(
+        evaluate_systems(
+            evaluation_context=evaluation_context,
+            policy_index=policy_index,
+            rule_index=rule_index,
+            systems=evaluation_context.taxonomy.system[system_start:system_end],
+        )
+    )
+    evaluation_cache = evaluation_context.evaluation_cache
+    return (
+        violations,
+        evaluation_cache.pop_update() if evaluation_cache else None,
+    )
+
+
+def execute_parallel_evaluation(
+    evaluation_context: EvaluationContext, jobs: int
+) -> Iterator[EvaluationViolation]:
+    """
+    Shards the systems of each policy rule across a pool of worker processes.
+
+    Results are yielded in the same policy, rule and system order
+    as a sequential evaluation, as soon as each shard is done.
+    """
+    system_count = len(evaluation_context.taxonomy.system)
+    chunk_size = max(1, math.ceil(system_count / (jobs * 4)))
+    tasks = [
+        (policy_index, rule_index, system_start, system_start + chunk_size)
+        for policy_index, policy in enumerate(evaluation_context.taxonomy.policy)
+        for rule_index in range(len(policy.rules))
+        for system_start in range(0, system_count, chunk_size)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_evaluation_worker,
+        initargs=(evaluation_context,),
+    ) as executor:
+        for violations, cache_update in executor.map(
+            evaluate_systems_in_worker, *zip(*tasks)
+        ):
+            if evaluation_context.evaluation_cache and cache_update:
+                evaluation_context.evaluation_cache.apply_update(cache_update)
+            yield from violations
@@ -0,0 +1,164 @@
+"""
+A persistent, on-disk cache of evaluation results keyed by content hashes,
+so that only the inputs that changed since the last evaluation are re-evaluated.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from pydantic import BaseModel
+
+CACHE_FILE_NAME = "evaluation_cache.json"
+
+# The cached violations of an evaluation, as sequences of their fields
+CacheEntry = List[Sequence[Union[None, str, Sequence[str]]]]
+
+
+class EvaluationCacheUpdate(NamedTuple):
+    """
+    The new entries, used keys, hits and misses of a cache since its last update.
+    """
+
+    new_entries: Dict[str, CacheEntry]
+    used_keys: Set[str]
+    hits: int
+    misses: int
+
+
+class EvaluationCacheLocation(NamedTuple):
+    """
+    The directory a cache is stored in and the taxonomy version its keys
+    are built with.
+    """
+
+    cache_dir: str
+    taxonomy_version: str
+
+
+def get_content_hash(content: str) -> str:
+    "Returns a stable hash of a string."
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """
+    Stores the violations of each evaluated combination of inputs.
+
+    Keys are hashed from the content of every model that goes into an
+    evaluation along with the taxonomy version, which is a hash of the
+    hierarchy of every privacy data type, so any change to an input or to an
+    ancestry creates a new key instead of invalidating entries in place.
+    """
+
+    def __init__(
+        self, cache_dir: str, taxonomy_version: str, entries: Dict[str, CacheEntry]
+    ) -> None:
+        self.location = EvaluationCacheLocation(cache_dir, taxonomy_version)
+        self.entries = entries
+        self.new_entries: Dict[str, CacheEntry] = {}
+        self.used_keys: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        # The model is kept along with its hash so that its id can't be reused
+        self.model_hashes: Dict[int, Tuple[BaseModel, str]] = {}
+
+    def __getstate__(self) -> Dict:
+        # Model ids aren't stable across processes, so hashes are recomputed
+        state = self.__dict__.copy()
+        state["model_hashes"] = {}
+        return state
+
+    @classmethod
+    def load(cls, cache_dir: str, taxonomy_version: str) -> "EvaluationCache":
+        """
+        Loads the cache stored in a directory, starting with an empty cache
+        if there isn't one yet or it can't be read.
+        """
+        entries: Dict[str, CacheEntry] = {}
+        cache_path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as cache_file:
+                    entries = json.load(cache_file)
+            except (IOError, ValueError):
+                entries = {}
+        return cls(cache_dir, taxonomy_version, entries)
+
+    def save(self) -> None:
+        """
+        Writes the entries used by this evaluation to the cache directory,
+        dropping any entries that are no longer reachable.
+        """
+        os.makedirs(self.location.cache_dir, exist_ok=True)
+        used_entries = {
+            cache_key: self.entries[cache_key]
+            for cache_key in sorted(self.used_keys)
+            if cache_key in self.entries
+        }
+        with open(
+            os.path.join(self.location.cache_dir, CACHE_FILE_NAME),
+            "w",
+            encoding="utf-8",
+        ) as cache_file:
+            json.dump(used_entries, cache_file)
+
+    def get_model_hash(self, model: BaseModel) -> str:
+        """
+        Returns the content hash of a model, computing it only once per model.
+        """
+        if id(model) not in self.model_hashes:
+            self.model_hashes[id(model)] = (
+                model,
+                get_content_hash(model.json(sort_keys=True)),
+            )
+        return self.model_hashes[id(model)][1]
+
+    def get_key(self, *key_parts: Union[str, BaseModel]) -> str:
+        """
+        Builds a cache key from fides_keys and the content of models.
+        """
+        part_hashes = [self.location.taxonomy_version] + [
+            part if isinstance(part, str) else self.get_model_hash(part)
+            for part in key_parts
+        ]
+        return get_content_hash(json.dumps(part_hashes))
+
+    def get(self, cache_key: str) -> Optional[CacheEntry]:
+        "Returns the cached violations for a key, counting the hit or miss."
+        self.used_keys.add(cache_key)
+        if cache_key in self.entries:
+            self.hits += 1
+            return self.entries[cache_key]
+        self.misses += 1
+        return None
+
+    def add(self, cache_key: str, violations: CacheEntry) -> None:
+        "Stores the evaluated violations for a key."
+        self.entries[cache_key] = violations
+        self.new_entries[cache_key] = violations
+
+    def pop_update(self) -> EvaluationCacheUpdate:
+        """
+        Returns everything that changed since the last update and resets it,
+        so copies of the cache in other processes can report back.
+        """
+        update = EvaluationCacheUpdate(
+            new_entries=self.new_entries,
+            used_keys=self.used_keys,
+            hits=self.hits,
+            misses=self.misses,
+        )
+        self.new_entries = {}
+        self.used_keys = set()
+        self.hits = 0
+        self.misses = 0
+        return update
+
+    def apply_update(self, update: EvaluationCacheUpdate) -> None:
+        "Merges an update from a copy of the cache into this one."
+        self.entries.update(update.new_entries)
+        self.new_entries.update(update.new_entries)
+        self.used_keys.update(update.used_keys)
+        self.hits += update.hits
+        self.misses += update.misses
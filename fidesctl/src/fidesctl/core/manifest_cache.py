@@ -0,0 +1,131 @@
+"""
+A persistent, on-disk cache of parsed and validated manifest files, so that
+only the files that changed since the last run are parsed again.
+"""
+import hashlib
+import os
+import pickle
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from fideslang import FidesModel
+from fidesctl import __version__
+from fidesctl.core.utils import echo_red
+
+CACHE_FILE_NAME = "manifest_cache.pickle"
+
+
+class ManifestCacheEntry(NamedTuple):
+    """
+    The stat and content hash of a manifest file along with its parsed resources.
+    """
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    resources: Dict[str, List[FidesModel]]
+
+
+class ManifestCache:
+    """
+    Stores the parsed resources of each manifest file by its path.
+
+    A file whose modification time and size haven't changed is trusted
+    without being read. Otherwise its content hash decides whether the
+    cached resources can still be used.
+
+    Entries are pickled, so the cache is only ever loaded when it was
+    written by the same version of fidesctl.
+    """
+
+    def __init__(self, cache_dir: str, entries: Dict[str, ManifestCacheEntry]) -> None:
+        self.cache_dir = cache_dir
+        self.entries = entries
+        self.used_paths: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, cache_dir: str) -> "ManifestCache":
+        """
+        Loads the cache stored in a directory, starting with an empty cache
+        if there isn't one yet, it can't be read or it's from another version.
+
+        Unpickling can fail with almost any error, for example when a pickled
+        class has changed, so any failure is treated as a cache miss.
+        """
+        entries: Dict[str, ManifestCacheEntry] = {}
+        cache_path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "rb") as cache_file:
+                    version, entries = pickle.load(cache_file)
+                if version != __version__:
+                    entries = {}
+            except Exception as err:  # pylint: disable=broad-except
+                echo_red(
+                    f"Ignoring the manifest cache, which can't be loaded: {err}",
+                    err=True,
+                )
+                entries = {}
+        return cls(cache_dir, entries)
+
+    def save(self) -> None:
+        """
+        Writes the entries of the files used in this run to the cache directory,
+        dropping the entries of any files that weren't.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        used_entries = {
+            file_path: self.entries[file_path]
+            for file_path in sorted(self.used_paths)
+            if file_path in self.entries
+        }
+        with open(os.path.join(self.cache_dir, CACHE_FILE_NAME), "wb") as cache_file:
+            pickle.dump(
+                (__version__, used_entries), cache_file, pickle.HIGHEST_PROTOCOL
+            )
+
+    def get(
+        self, file_path: str
+    ) -> Tuple[Optional[Dict[str, List[FidesModel]]], ManifestCacheEntry]:
+        """
+        Returns the cached resources of a file, or None if it changed,
+        along with the current stat and content hash of the file.
+        """
+        self.used_paths.add(file_path)
+        file_stat = os.stat(file_path)
+        cached_entry = self.entries.get(file_path)
+        if (
+            cached_entry
+            and cached_entry.mtime_ns == file_stat.st_mtime_ns
+            and cached_entry.size == file_stat.st_size
+        ):
+            self.hits += 1
+            return cached_entry.resources, cached_entry
+
+        with open(file_path, "rb") as manifest_file:
+            content_hash = hashlib.sha256(manifest_file.read()).hexdigest()
+        file_entry = ManifestCacheEntry(
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+            content_hash=content_hash,
+            resources={},
+        )
+        if cached_entry and cached_entry.content_hash == content_hash:
+            self.hits += 1
+            self.entries[file_path] = file_entry._replace(
+                resources=cached_entry.resources
+            )
+            return cached_entry.resources, file_entry
+
+        self.misses += 1
+        return None, file_entry
+
+    def add(
+        self,
+        file_path: str,
+        file_entry: ManifestCacheEntry,
+        resources: Dict[str, List[FidesModel]],
+    ) -> None:
+        "Stores the parsed resources of a file."
+        self.entries[file_path] = file_entry._replace(resources=resources)
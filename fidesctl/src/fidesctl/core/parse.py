@@ -1,17 +1,98 @@
 """This module is responsible for parsing and verifying file, either with or without a server being available."""
+from typing import Dict, List
+
+from fidesctl.core.manifest_cache import ManifestCache, ManifestCacheEntry
 from fidesctl.core.utils import echo_green
-from fideslang import Taxonomy
-from fideslang.manifests import ingest_manifests
-from fideslang.parse import load_manifests_into_taxonomy
+from fideslang import FidesModel, Taxonomy
+from fideslang.manifests import (
+    get_manifest_files,
+    ingest_manifests,
+    load_manifest_files,
+    union_manifests,
+)
+from fideslang.parse import LazyTaxonomy, parse_manifest_file
 
 
-def parse(manifests_dir: str) -> Taxonomy:
+def parse(manifests_dir: str, jobs: int = 1, cache_dir: str = "") -> Taxonomy:
     """
     Parse local manifest file(s) into a Taxonomy.
+
+    Each file is streamed into its models one resource at a time. If a cache
+    directory is passed, only the files that changed since they were cached
+    are parsed.
     """
 
     echo_green(f"Loading resource manifests from: {manifests_dir}")
-    ingested_manifests = ingest_manifests(manifests_dir)
-    taxonomy = load_manifests_into_taxonomy(ingested_manifests)
+    if cache_dir:
+        parsed_manifests = load_cached_manifests(
+            manifests_dir=manifests_dir, jobs=jobs, cache_dir=cache_dir
+        )
+    else:
+        parsed_manifests = union_manifests(
+            load_manifest_files(
+                parse_manifest_file, get_manifest_files(manifests_dir), jobs=jobs
+            )
+        )
+    taxonomy = Taxonomy.parse_obj(parsed_manifests)
     echo_green("Taxonomy successfully created.")
     return taxonomy
+
+
+def parse_lazily(
+    manifests_dir: str, jobs: int = 1, cache_dir: str = ""
+) -> LazyTaxonomy:
+    """
+    Load local manifest file(s) into a LazyTaxonomy, which only parses
+    their resources as they're used.
+
+    If a cache directory is passed, the files are parsed up front by
+    `load_cached_manifests` instead.
+    """
+
+    echo_green(f"Loading resource manifests from: {manifests_dir}", err=True)
+    if cache_dir:
+        return LazyTaxonomy(
+            load_cached_manifests(
+                manifests_dir=manifests_dir, jobs=jobs, cache_dir=cache_dir
+            )
+        )
+    return LazyTaxonomy(ingest_manifests(manifests_dir, jobs=jobs))
+
+
+def load_cached_manifests(
+    manifests_dir: str, jobs: int, cache_dir: str
+) -> Dict[str, List[FidesModel]]:
+    """
+    Parse the resources of the manifest file(s), using the cached resources of
+    any file that hasn't changed and updating the cache with the rest.
+    """
+    file_paths = get_manifest_files(manifests_dir)
+    manifest_cache = ManifestCache.load(cache_dir)
+    file_resources: Dict[str, Dict[str, List[FidesModel]]] = {}
+    changed_files: List[ManifestCacheEntry] = []
+    changed_paths: List[str] = []
+    for file_path in file_paths:
+        cached_resources, file_entry = manifest_cache.get(file_path)
+        if cached_resources is None:
+            changed_paths.append(file_path)
+            changed_files.append(file_entry)
+        else:
+            file_resources[file_path] = cached_resources
+
+    parsed_manifests = load_manifest_files(
+        parse_manifest_file, changed_paths, jobs=jobs
+    )
+    for file_path, file_entry, parsed_manifest in zip(
+        changed_paths, changed_files, parsed_manifests
+    ):
+        file_resources[file_path] = parsed_manifest
+        manifest_cache.add(file_path, file_entry, file_resources[file_path])
+
+    manifest_cache.save()
+    echo_green(
+        "Manifest cache: {} hits, {} misses".format(
+            manifest_cache.hits, manifest_cache.misses
+        ),
+        err=True,
+    )
+    return union_manifests(file_resources[file_path] for file_path in file_paths)
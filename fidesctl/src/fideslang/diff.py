@@ -0,0 +1,165 @@
+"""
+A structural diff between two versions of a resource, which matches named list
+items like dataset collections and fields by their name instead of position.
+"""
+import json
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from fideslang import FidesModel
+
+# Any value of a resource's canonical JSON
+DiffValue = Union[None, bool, int, float, str, List, Dict]
+
+
+class ResourceChange(NamedTuple):
+    """
+    A value that was changed, added or removed between two versions of a resource.
+
+    The path joins field names with dots, followed by the name of each named
+    list item or the index of any other list item in brackets.
+    """
+
+    path: str
+    change_type: str
+    old_value: DiffValue = None
+    new_value: DiffValue = None
+
+    def render(self) -> str:
+        "Renders the change as a single line."
+        if self.change_type == "changed":
+            return "{}: {} -> {}".format(
+                self.path, json.dumps(self.old_value), json.dumps(self.new_value)
+            )
+        return f"{self.path}: {self.change_type}"
+
+
+def get_path(parent_path: str, key: Union[str, int], list_item: bool) -> str:
+    "Appends a field name or list item to a path."
+    if list_item:
+        return f"{parent_path}[{key}]"
+    return f"{parent_path}.{key}" if parent_path else str(key)
+
+
+def get_items_by_name(items: List) -> Optional[Dict[str, Dict]]:
+    """
+    Returns the items of a list by their name, or None unless every item
+    is an object with a unique name.
+    """
+    items_by_name = {
+        item["name"]: item
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get("name"), str)
+    }
+    return items_by_name if len(items_by_name) == len(items) else None
+
+
+def is_reordered(
+    old_items_by_name: Dict[str, Dict], new_items_by_name: Dict[str, Dict]
+) -> bool:
+    "Returns whether the items found in both lists are in a different order."
+    return [name for name in old_items_by_name if name in new_items_by_name] != [
+        name for name in new_items_by_name if name in old_items_by_name
+    ]
+
+
+def diff_named_items(
+    old_items_by_name: Dict[str, Dict], new_items_by_name: Dict[str, Dict], path: str
+) -> List[ResourceChange]:
+    """
+    Diffs the items of two lists by their name, including
+    whether the items in both lists were reordered.
+    """
+    changes = []
+    for name, old_item in old_items_by_name.items():
+        item_path = get_path(path, name, list_item=True)
+        if name in new_items_by_name:
+            changes += diff_values(old_item, new_items_by_name[name], item_path)
+        else:
+            changes.append(ResourceChange(item_path, "removed"))
+    changes += [
+        ResourceChange(get_path(path, name, list_item=True), "added")
+        for name in new_items_by_name
+        if name not in old_items_by_name
+    ]
+    if is_reordered(old_items_by_name, new_items_by_name):
+        changes.append(ResourceChange(path, "reordered"))
+    return changes
+
+
+def diff_positional_items(
+    old_list: List, new_list: List, path: str
+) -> List[ResourceChange]:
+    """
+    Diffs the items of two lists by their position.
+    """
+    changes = []
+    for index, (old_item, new_item) in enumerate(zip(old_list, new_list)):
+        changes += diff_values(
+            old_item, new_item, get_path(path, index, list_item=True)
+        )
+    changes += [
+        ResourceChange(get_path(path, index, list_item=True), "removed")
+        for index in range(len(new_list), len(old_list))
+    ]
+    changes += [
+        ResourceChange(get_path(path, index, list_item=True), "added")
+        for index in range(len(old_list), len(new_list))
+    ]
+    return changes
+
+
+def diff_lists(old_list: List, new_list: List, path: str) -> List[ResourceChange]:
+    """
+    Diffs the items of two lists, matching objects by their name when every
+    object has a unique one and by their position otherwise.
+
+    Lists of anything other than objects are compared as a single value.
+    """
+    old_items_by_name = get_items_by_name(old_list)
+    new_items_by_name = get_items_by_name(new_list)
+    if old_items_by_name is not None and new_items_by_name is not None:
+        return diff_named_items(old_items_by_name, new_items_by_name, path)
+
+    if not all(isinstance(item, dict) for item in old_list + new_list):
+        return [ResourceChange(path, "changed", old_list, new_list)]
+
+    return diff_positional_items(old_list, new_list, path)
+
+
+def diff_values(
+    old_value: DiffValue, new_value: DiffValue, path: str = ""
+) -> List[ResourceChange]:
+    """
+    Recursively diffs two values of a resource's canonical JSON,
+    skipping any equal values without walking them.
+    """
+    if old_value == new_value:
+        return []
+
+    if isinstance(old_value, dict) and isinstance(new_value, dict):
+        changes = []
+        for key, old_item in old_value.items():
+            changes += diff_values(
+                old_item, new_value.get(key), get_path(path, key, list_item=False)
+            )
+        for key, new_item in new_value.items():
+            if key not in old_value:
+                changes += diff_values(
+                    None, new_item, get_path(path, key, list_item=False)
+                )
+        return changes
+
+    if isinstance(old_value, list) and isinstance(new_value, list):
+        return diff_lists(old_value, new_value, path)
+
+    return [ResourceChange(path, "changed", old_value, new_value)]
+
+
+def diff_resources(
+    old_resource: FidesModel, new_resource: FidesModel
+) -> List[ResourceChange]:
+    """
+    Returns every change between two versions of a resource, comparing their
+    canonical JSON so that equal values always compare the same way.
+    """
+    return diff_values(json.loads(old_resource.json()), json.loads(new_resource.json()))
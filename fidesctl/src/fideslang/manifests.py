@@ -1,9 +1,55 @@
 """This module handles anything related to working with raw manifest files."""
 import glob
-from functools import reduce
-from typing import Dict, List, Set, Union
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+# Use the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml._yaml import CParser
+
+    class StreamingLoader(CParser, Composer, SafeConstructor, Resolver):
+        """
+        A safe loader that parses events with libyaml, so that it can compose
+        and construct one node of a stream at a time.
+        """
+
+        def __init__(self, stream: TextIO) -> None:
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore
+
+    StreamingLoader = SafeLoader  # type: ignore
+
+LoadedManifest = TypeVar("LoadedManifest")
+ParsedCollection = TypeVar("ParsedCollection")
+
+# Any value that can be constructed from yaml
+YamlValue = Union[None, bool, int, float, str, List, Dict]
+
+YML_ENDINGS = ["yml", "yaml"]
 
 
 def write_manifest(
@@ -17,16 +63,34 @@ def write_manifest(
     else:
         manifest = {resource_type: manifest}
 
-    with open(file_name, "w") as manifest_file:
+    with open(file_name, "w", encoding="utf-8") as manifest_file:
         yaml.dump(manifest, manifest_file, sort_keys=False, indent=2)
 
 
+def write_manifest_resources(
+    file_name: str, resources: Iterable[Dict], resource_type: str
+) -> None:
+    """
+    Write dict representations of resources out to a file one at a time,
+    in the same format as `write_manifest`.
+    """
+    with open(file_name, "w", encoding="utf-8") as manifest_file:
+        resource_count = 0
+        for resource in resources:
+            if not resource_count:
+                manifest_file.write(f"{resource_type}:\n")
+            yaml.dump([resource], manifest_file, sort_keys=False, indent=2)
+            resource_count += 1
+        if not resource_count:
+            yaml.dump({resource_type: []}, manifest_file, sort_keys=False, indent=2)
+
+
 def load_yaml_into_dict(file_path: str) -> Dict:
     """
     This loads yaml files into a dictionary to be used in API calls.
     """
-    with open(file_path, "r") as yaml_file:
-        return yaml.load(yaml_file, Loader=yaml.FullLoader)
+    with open(file_path, "r", encoding="utf-8") as yaml_file:
+        return yaml.load(yaml_file, Loader=SafeLoader)
 
 
 def filter_manifest_by_type(
@@ -36,44 +100,166 @@ def filter_manifest_by_type(
     return {key: value for key, value in manifests.items() if key in filter_types}
 
 
-def union_manifests(manifests: List[Dict]) -> Dict[str, List[Dict]]:
+def union_manifests(manifests: Iterable[Dict[str, List]]) -> Dict[str, List]:
     """
     Combine all of the manifests into a single dictionary,
     appending resource values with the same keys.
     """
 
-    key_lists: List[List[str]] = [list(manifest.keys()) for manifest in manifests]
-    key_set: Set[str] = set(reduce(lambda x, y: [*x, *y], key_lists))
-
     unioned_dict: Dict[str, List] = {}
     for manifest in manifests:
-        for key in key_set:
-            if key in manifest.keys() and key in unioned_dict.keys():
-                unioned_dict[key] += manifest[key]
-            elif key in manifest.keys():
-                unioned_dict[key] = manifest[key]
+        for key, resources in manifest.items():
+            unioned_dict.setdefault(key, []).extend(resources)
     return unioned_dict
 
 
-def ingest_manifests(manifests_dir: str) -> Dict[str, List[Dict]]:
+def find_manifest_files(manifests_dir: str) -> List[str]:
+    """
+    Returns the path of every yaml file in a directory and its subdirectories.
+    """
+    file_paths = glob.glob(f"{manifests_dir}/**/*.*", recursive=True)
+    return [
+        file_path
+        for yml_ending in YML_ENDINGS
+        for file_path in file_paths
+        if file_path.endswith(f".{yml_ending}")
+    ]
+
+
+def get_manifest_files(manifests_dir: str) -> List[str]:
+    """
+    Returns the path of a single yaml file, or of every yaml file
+    in a directory and its subdirectories.
+    """
+    if manifests_dir.split(".")[-1] in YML_ENDINGS:
+        return [manifests_dir]
+    return find_manifest_files(manifests_dir)
+
+
+def load_manifest_files(
+    load_file: Callable[[str], LoadedManifest], file_paths: List[str], jobs: int = 1
+) -> List[LoadedManifest]:
+    """
+    Loads each of the yaml files with `load_file`, in order, across `jobs` processes.
+    """
+    if jobs <= 1 or len(file_paths) <= 1:
+        return [load_file(file_path) for file_path in file_paths]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(
+            executor.map(
+                load_file,
+                file_paths,
+                chunksize=max(1, math.ceil(len(file_paths) / (jobs * 4))),
+            )
+        )
+
+
+def construct_next_node(loader: StreamingLoader) -> YamlValue:
+    "Composes and constructs the next node of a stream on its own."
+    return loader.construct_document(
+        loader.compose_node(None, None)  # type: ignore[arg-type]
+    )
+
+
+def iter_sequence_items(loader: StreamingLoader) -> Iterator[YamlValue]:
+    "Yields each item of the sequence that starts at the next event."
+    loader.get_event()
+    while not loader.check_event(yaml.SequenceEndEvent):
+        yield construct_next_node(loader)
+    loader.get_event()
+
+
+def iter_streamed_datasets(
+    loader: StreamingLoader, parse_collection: Callable[[YamlValue], ParsedCollection]
+) -> Iterator[YamlValue]:
+    """
+    Yields each dataset of the sequence that starts at the next event,
+    with each of its collections passed through `parse_collection` as
+    soon as it's read.
+
+    Every key of a dataset is read before it's yielded, including any
+    keys after its collections.
+    """
+    loader.get_event()
+    while not loader.check_event(yaml.SequenceEndEvent):
+        if not loader.check_event(yaml.MappingStartEvent):
+            yield construct_next_node(loader)
+            continue
+
+        loader.get_event()
+        dataset: Dict = {}
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = construct_next_node(loader)
+            if (
+                key == "collections"
+                and key not in dataset
+                and loader.check_event(yaml.SequenceStartEvent)
+            ):
+                dataset[key] = [
+                    parse_collection(collection)
+                    for collection in iter_sequence_items(loader)
+                ]
+            else:
+                dataset[key] = construct_next_node(loader)
+        loader.get_event()
+        yield dataset
+    loader.get_event()
+
+
+def iter_manifest_resources(
+    file_path: str,
+    parse_collection: Optional[Callable[[YamlValue], ParsedCollection]] = None,
+) -> Iterator[Tuple[str, YamlValue]]:
+    """
+    Yields the resource type and raw resource of each resource in a yaml file,
+    reading one resource at a time instead of loading the whole file.
+
+    With `parse_collection`, the collections of each dataset are read
+    and parsed one at a time as well, see `iter_streamed_datasets`.
+    """
+    with open(file_path, "r", encoding="utf-8") as yaml_file:
+        loader = StreamingLoader(yaml_file)
+        try:
+            loader.get_event()
+            if not loader.check_event(yaml.DocumentStartEvent):
+                return
+            loader.get_event()
+            if not loader.check_event(yaml.MappingStartEvent):
+                return
+            loader.get_event()
+
+            while not loader.check_event(yaml.MappingEndEvent):
+                resource_type = cast(str, construct_next_node(loader))
+                if not loader.check_event(yaml.SequenceStartEvent):
+                    resource = construct_next_node(loader)
+                    if resource is not None:
+                        yield resource_type, resource
+                elif parse_collection and resource_type == "dataset":
+                    for dataset in iter_streamed_datasets(loader, parse_collection):
+                        yield resource_type, dataset
+                else:
+                    for resource in iter_sequence_items(loader):
+                        yield resource_type, resource
+        finally:
+            loader.dispose()
+
+
+def ingest_manifests(manifests_dir: str, jobs: int = 1) -> Dict[str, List[Dict]]:
     """
     Ingest either a single file or all of the manifests available in a
     directory and concatenate them into a single object.
 
-    Directories will be searched recursively.
+    Directories will be searched recursively, and their files are
+    loaded across `jobs` processes.
     """
-    yml_endings = ["yml", "yaml"]
-    if manifests_dir.split(".")[-1] in yml_endings:
+    if manifests_dir.split(".")[-1] in YML_ENDINGS:
         manifests = load_yaml_into_dict(manifests_dir)
 
     else:
-        manifest_list = []
-        for yml_ending in yml_endings:
-            manifest_list += glob.glob(
-                f"{manifests_dir}/**/*.{yml_ending}", recursive=True
-            )
-
         manifests = union_manifests(
-            [load_yaml_into_dict(file) for file in manifest_list]
+            load_manifest_files(
+                load_yaml_into_dict, find_manifest_files(manifests_dir), jobs=jobs
+            )
         )
     return manifests
@@ -2,18 +2,31 @@
 Contains all of the Fides resources modeled as Pydantic models.
 """
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from pydantic import validator, BaseModel, Field
+from pydantic import create_model_from_namedtuple, validator, BaseModel, Field
 
 from fideslang.validation import (
     FidesKey,
     sort_list_objects_by_key,
     sort_list_objects_by_name,
+    load_named_tuple,
     no_self_reference,
     matching_parent_key,
 )
 
+if TYPE_CHECKING:
+    from pydantic.typing import AbstractSetIntStr, DictStrAny, MappingIntStrAny
+
 # Reusable components
 matching_parent_key_validator = validator("parent_key", allow_reuse=True, always=True)(
     matching_parent_key
@@ -138,6 +151,35 @@ class StatusEnum(str, Enum):
     PASS = "PASS"
 
 
+class EvaluationViolation(NamedTuple):
+    """
+    The model for a policy rule that failed during an evaluation.
+
+    Violations only reference the keys and names of the resources involved,
+    and are rendered into text on demand. Violations found in a referenced
+    dataset also hold the type and path of the failing dataset, collection
+    or field.
+    """
+
+    policy: FidesKey
+    rule: Optional[str]
+    system: FidesKey
+    declaration: str
+    target_type: Optional[str] = None
+    target_path: Tuple[str, ...] = ()
+
+    def render(self) -> str:
+        "Renders the violation as a human-readable message."
+        message = (
+            "Declaration ({}) of System ({}) failed Rule ({}) from Policy ({})".format(
+                self.declaration, self.system, self.rule, self.policy
+            )
+        )
+        if self.target_type:
+            message += " for {} ({})".format(self.target_type, self.target_path[-1])
+        return message
+
+
 class Evaluation(BaseModel):
     """
     The Evaluation resource model.
@@ -147,14 +189,90 @@ class Evaluation(BaseModel):
 
     fides_key: FidesKey
     status: StatusEnum
-    details: List[str]
+    violations: List[EvaluationViolation]
     message: str = ""
 
+    _load_violations: classmethod = validator(
+        "violations", allow_reuse=True, pre=True, each_item=True
+    )(load_named_tuple)
+
     class Config:
         "Config for the Evaluation"
         extra = "ignore"
         orm_mode = True
 
+        @staticmethod
+        def schema_extra(schema: Dict, model: type) -> None:
+            "Violations are serialized as objects of their fields."
+            # The config is shared with the model pydantic builds for violations
+            if "violations" not in schema["properties"]:
+                return
+            violation_schema = create_model_from_namedtuple(
+                EvaluationViolation
+            ).schema()
+            # The fields with defaults are the last ones of the NamedTuple
+            defaults = EvaluationViolation.__new__.__defaults__ or ()
+            field_names = EvaluationViolation._fields
+            violation_schema["required"] = list(
+                field_names[: len(field_names) - len(defaults)]
+            )
+            schema["properties"]["violations"]["items"] = violation_schema
+
+    def dict(
+        self,
+        *,
+        include: Optional[Union["AbstractSetIntStr", "MappingIntStrAny"]] = None,
+        exclude: Optional[Union["AbstractSetIntStr", "MappingIntStrAny"]] = None,
+        by_alias: bool = False,
+        skip_defaults: Optional[bool] = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> "DictStrAny":
+        "Serializes each violation as an object of its fields, instead of an array."
+        serialized = super().dict(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            skip_defaults=skip_defaults,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+        if "violations" in serialized:
+            serialized["violations"] = [
+                violation._asdict() for violation in serialized["violations"]
+            ]
+        return serialized
+
+    def json(
+        self,
+        *,
+        include: Optional[Union["AbstractSetIntStr", "MappingIntStrAny"]] = None,
+        exclude: Optional[Union["AbstractSetIntStr", "MappingIntStrAny"]] = None,
+        by_alias: bool = False,
+        skip_defaults: Optional[bool] = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        encoder: Optional[Callable[[object], object]] = None,
+        models_as_dict: bool = True,
+        **dumps_kwargs: object,
+    ) -> str:
+        "Serializes the evaluation as JSON, with the violations from `dict`."
+        serialized = self.dict(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            skip_defaults=skip_defaults,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+        return self.__config__.json_dumps(
+            serialized, default=encoder or self.__json_encoder__, **dumps_kwargs
+        )
+
 
 # Organization
 class Organization(FidesModel):
@@ -2,9 +2,11 @@
 This module handles everything related to parsing resources into Pydantic models,
 either from local files or the server.
 """
-from typing import List, Dict
+from typing import Dict, List, Optional, Union
 
 from fideslang import model_map, FidesModel, Taxonomy
+from fideslang.manifests import iter_manifest_resources
+from fideslang.models import DatasetCollection
 from fidesctl.core.utils import echo_red
 
 
@@ -31,16 +33,129 @@ def parse_dict(
     return parsed_manifest
 
 
+def parse_manifest(raw_manifest: Dict[str, List[Dict]]) -> Dict[str, List[FidesModel]]:
+    """
+    Parse the raw resources of a manifest into their Python models.
+    """
+    return {
+        resource_type: [
+            parse_dict(resource_type, resource) for resource in resource_list
+        ]
+        for resource_type, resource_list in raw_manifest.items()
+    }
+
+
+def parse_dataset_collection(collection: Dict) -> DatasetCollection:
+    """
+    Parse an individual dataset collection into its Python model.
+    """
+    try:
+        parsed_collection = DatasetCollection.parse_obj(collection)
+    except Exception as err:
+        echo_red(
+            "Failed to parse dataset collection from manifest file:\n{}".format(
+                collection
+            )
+        )
+        raise SystemExit(err)
+    return parsed_collection
+
+
+def parse_manifest_file(file_path: str) -> Dict[str, List[FidesModel]]:
+    """
+    Parse the resources of a manifest file into their Python models as they're
+    read, so only a single raw resource, or a single raw collection of a
+    dataset, is held in memory at a time.
+    """
+    parsed_manifest: Dict[str, List[FidesModel]] = {}
+    for resource_type, resource in iter_manifest_resources(
+        file_path, parse_collection=parse_dataset_collection
+    ):
+        parsed_manifest.setdefault(resource_type, []).append(
+            parse_dict(resource_type, resource)
+        )
+    return parsed_manifest
+
+
 def load_manifests_into_taxonomy(raw_manifests: Dict[str, List[Dict]]) -> Taxonomy:
     """
     Parse the raw resource manifests into resource resources.
     """
-    taxonomy = Taxonomy.parse_obj(
-        {
-            resource_type: [
-                parse_dict(resource_type, resource) for resource in resource_list
-            ]
-            for resource_type, resource_list in raw_manifests.items()
-        }
-    )
+    taxonomy = Taxonomy.parse_obj(parse_manifest(raw_manifests))
     return taxonomy
+
+
+class LazyTaxonomy:
+    """
+    Holds the raw resources of a set of manifests and only parses each one
+    into its model the first time it's used, either along with the rest of
+    its resource type or on its own by its fides_key.
+
+    Resources that are already models are used as they are.
+    """
+
+    def __init__(self, raw_manifests: Dict[str, List[Union[Dict, FidesModel]]]) -> None:
+        self.raw_manifests = raw_manifests
+        self.parsed_resources: Dict[str, Dict[int, FidesModel]] = {
+            resource_type: {} for resource_type in raw_manifests
+        }
+        self.raw_indexes: Dict[str, Dict[str, int]] = {}
+
+    def parse_resource(self, resource_type: str, position: int) -> FidesModel:
+        "Returns the model of the resource at a position within its type."
+        parsed_resources = self.parsed_resources[resource_type]
+        if position not in parsed_resources:
+            resource = self.raw_manifests[resource_type][position]
+            parsed_resources[position] = (
+                resource
+                if isinstance(resource, FidesModel)
+                else parse_dict(resource_type, resource)
+            )
+        return parsed_resources[position]
+
+    def get_resources(self, resource_type: str) -> List[FidesModel]:
+        "Returns the models of every resource of a type."
+        return [
+            self.parse_resource(resource_type, position)
+            for position in range(len(self.raw_manifests.get(resource_type, [])))
+        ]
+
+    def get_resource(self, resource_type: str, fides_key: str) -> Optional[FidesModel]:
+        """
+        Returns the model of the first resource of a type with the given
+        fides_key, only parsing that resource.
+        """
+        if resource_type not in self.raw_indexes:
+            raw_index: Dict[str, int] = {}
+            for position, resource in enumerate(
+                self.raw_manifests.get(resource_type, [])
+            ):
+                if isinstance(resource, FidesModel):
+                    raw_index.setdefault(resource.fides_key, position)
+                elif isinstance(resource, dict) and "fides_key" in resource:
+                    raw_index.setdefault(resource["fides_key"], position)
+            self.raw_indexes[resource_type] = raw_index
+
+        resource_position = self.raw_indexes[resource_type].get(fides_key)
+        if resource_position is None:
+            return None
+        return self.parse_resource(resource_type, resource_position)
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: Taxonomy) -> "LazyTaxonomy":
+        "Wraps the resources of an already parsed Taxonomy."
+        return cls(
+            {
+                resource_type: list(getattr(taxonomy, resource_type) or [])
+                for resource_type in Taxonomy.__fields__
+            }
+        )
+
+    def to_taxonomy(self) -> Taxonomy:
+        "Parses every resource into a Taxonomy."
+        return Taxonomy.parse_obj(
+            {
+                resource_type: self.get_resources(resource_type)
+                for resource_type in self.raw_manifests
+            }
+        )
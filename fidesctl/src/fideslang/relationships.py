@@ -3,13 +3,23 @@ This module is responsible for calculating what resources are referenced
 by each other and building a dependency graph of relationships.
 """
 
-import inspect
-from functools import reduce
-from typing import List, Set, Dict
+from collections import defaultdict
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from pydantic import AnyHttpUrl
 
-from fidesctl.core.api_helpers import get_server_resources
+from fidesctl.core.api_helpers import get_server_resources_concurrently
 from fideslang.models import (
     FidesKey,
     Taxonomy,
@@ -20,7 +30,22 @@ from fideslang.models import (
     PrivacyDeclaration,
     BaseModel,
 )
-from fideslang.utils import get_resource_by_fides_key
+from fideslang.parse import LazyTaxonomy
+from fideslang.utils import IndexedTaxonomy
+
+# The resource type referenced by each field that holds fides keys. Fields that
+# aren't listed, like `fides_key` and `parent_key`, reference their own type.
+REFERENCED_RESOURCE_TYPES: Dict[str, str] = {
+    "organization_fides_key": "organization",
+    "data_categories": "data_category",
+    "data_qualifier": "data_qualifier",
+    "data_subjects": "data_subject",
+    "data_use": "data_use",
+    "data_uses": "data_use",
+    "dataset_references": "dataset",
+    "system_dependencies": "system",
+    "rules": "policy_rule",
+}
 
 
 def has_nested_fides_keys(parameter_annotation: str) -> bool:
@@ -53,83 +78,316 @@ def has_nested_fides_keys_list(parameter_annotation: str) -> bool:
     return has_nested_keys_list
 
 
-def find_nested_keys_in_list(parameter_value: List[BaseModel]) -> List[str]:
+class ReferenceExtractionPlan(NamedTuple):
     """
-    Iterates a nested object list and returns any keys nested fides keys
+    The fields of a model that hold fides keys or models with nested fides keys.
     """
-    nested_keys = [
-        nested_key
-        for param_element in parameter_value
-        for nested_key in find_referenced_fides_keys(param_element)
-    ]
-    return nested_keys
+
+    key_fields: Tuple[str, ...]
+    key_list_fields: Tuple[str, ...]
+    nested_fields: Tuple[str, ...]
+    nested_list_fields: Tuple[str, ...]
+
+
+# The reference extraction plan of each model class, built on first use
+REFERENCE_EXTRACTION_PLANS: Dict[Type[BaseModel], ReferenceExtractionPlan] = {}
+
+
+def get_reference_extraction_plan(
+    model_class: Type[BaseModel],
+) -> ReferenceExtractionPlan:
+    """
+    Use the field types of a model to figure out which fields include the
+    FidesKey type or nested models, computing it only once per model class.
+    """
+    if model_class in REFERENCE_EXTRACTION_PLANS:
+        return REFERENCE_EXTRACTION_PLANS[model_class]
+
+    key_fields: List[str] = []
+    key_list_fields: List[str] = []
+    nested_fields: List[str] = []
+    nested_list_fields: List[str] = []
+    for field_name, field in model_class.__fields__.items():
+        if field.outer_type_ == FidesKey:
+            key_fields.append(field_name)
+        elif field.outer_type_ == List[FidesKey]:
+            key_list_fields.append(field_name)
+        elif has_nested_fides_keys(field.outer_type_):
+            nested_fields.append(field_name)
+        elif has_nested_fides_keys_list(field.outer_type_):
+            nested_list_fields.append(field_name)
+    plan = ReferenceExtractionPlan(
+        key_fields=tuple(key_fields),
+        key_list_fields=tuple(key_list_fields),
+        nested_fields=tuple(nested_fields),
+        nested_list_fields=tuple(nested_list_fields),
+    )
+    REFERENCE_EXTRACTION_PLANS[model_class] = plan
+    return plan
+
+
+def find_referenced_fides_keys_by_type(
+    resource: BaseModel, resource_type: str
+) -> Dict[str, Set[FidesKey]]:
+    """
+    Use the reference extraction plan of the resource's model to collect the
+    values of every field that includes the FidesKey type, grouped by
+    the resource type that each field references.
+
+    Note that this finds _all_ fides_keys, including the resource's own fides_key
+    """
+    referenced_fides_keys: DefaultDict[str, Set[FidesKey]] = defaultdict(set)
+    collect_referenced_fides_keys(resource, resource_type, referenced_fides_keys)
+    return dict(referenced_fides_keys)
+
+
+def collect_referenced_fides_keys(
+    resource: BaseModel,
+    resource_type: str,
+    referenced_fides_keys: DefaultDict[str, Set[FidesKey]],
+) -> None:
+    """
+    Add the fides_keys referenced by the resource and its nested
+    models to the referenced keys of each resource type.
+    """
+    plan = get_reference_extraction_plan(type(resource))
+    for field_name in plan.key_fields:
+        field_value = getattr(resource, field_name)
+        if field_value:
+            referenced_type = REFERENCED_RESOURCE_TYPES.get(field_name, resource_type)
+            referenced_fides_keys[referenced_type].add(field_value)
+    for field_name in plan.key_list_fields:
+        field_value = getattr(resource, field_name)
+        if field_value:
+            referenced_type = REFERENCED_RESOURCE_TYPES.get(field_name, resource_type)
+            referenced_fides_keys[referenced_type].update(field_value)
+    for field_name in plan.nested_fields:
+        field_value = getattr(resource, field_name)
+        if field_value:
+            referenced_type = REFERENCED_RESOURCE_TYPES.get(field_name, resource_type)
+            collect_referenced_fides_keys(
+                field_value, referenced_type, referenced_fides_keys
+            )
+    for field_name in plan.nested_list_fields:
+        referenced_type = REFERENCED_RESOURCE_TYPES.get(field_name, resource_type)
+        for nested_resource in getattr(resource, field_name) or []:
+            collect_referenced_fides_keys(
+                nested_resource, referenced_type, referenced_fides_keys
+            )
 
 
-def find_referenced_fides_keys(resource: object) -> Set[FidesKey]:
+def find_referenced_fides_keys(resource: BaseModel) -> Set[FidesKey]:
     """
-    Use type-signature introspection to figure out which fields
-    include the FidesKey type and return all of those values.
+    Return all of the fides_keys referenced by the resource, of any type.
 
     Note that this finds _all_ fides_keys, including the resource's own fides_key
     """
-    referenced_fides_keys: Set[FidesKey] = set()
-    signature = inspect.signature(type(resource), follow_wrapped=True)
-    parameter_values = signature.parameters.values()
-    for parameter in parameter_values:
-        parameter_value = resource.__getattribute__(parameter.name)
-        if parameter.annotation == FidesKey and parameter_value:
-            referenced_fides_keys.add(parameter_value)
-        elif parameter.annotation == List[FidesKey] and parameter_value:
-            referenced_fides_keys.update(resource.__getattribute__(parameter.name))
-        elif parameter_value and has_nested_fides_keys(parameter.annotation):
-            referenced_fides_keys.update(find_referenced_fides_keys(parameter_value))
-        elif parameter_value and has_nested_fides_keys_list(parameter.annotation):
-            nested_keys = find_nested_keys_in_list(parameter_value)
-            referenced_fides_keys.update(nested_keys)
+    referenced_fides_keys: Set[FidesKey] = set().union(
+        *find_referenced_fides_keys_by_type(resource, "").values()
+    )
     return referenced_fides_keys
 
 
+def iter_taxonomy_resources(taxonomy: Taxonomy) -> Iterator[Tuple[str, BaseModel]]:
+    """
+    Yields every resource in the Taxonomy along with its resource type.
+    """
+    for resource_type in taxonomy.__fields_set__:
+        for resource in getattr(taxonomy, resource_type) or []:
+            yield resource_type, resource
+
+
+def collect_resource_references(
+    resources: Iterable[Tuple[str, BaseModel]]
+) -> DefaultDict[str, Set[FidesKey]]:
+    """
+    Returns the fides_keys referenced by each of the resources,
+    grouped by the resource type they reference.
+    """
+    referenced_keys: DefaultDict[str, Set[FidesKey]] = defaultdict(set)
+    for resource_type, resource in resources:
+        collect_referenced_fides_keys(resource, resource_type, referenced_keys)
+    return referenced_keys
+
+
 def get_referenced_missing_keys(taxonomy: Taxonomy) -> List[FidesKey]:
     """
-    Iterate through the Taxonomy and create a set of all of the FidesKeys
-    that are contained within it.
+    Iterate through the Taxonomy and find all of the FidesKeys that it
+    references but doesn't contain, of any type.
     """
-    referenced_keys: List[Set[FidesKey]] = [
-        find_referenced_fides_keys(resource)
-        for resource_type in taxonomy.__fields_set__
-        for resource in getattr(taxonomy, resource_type)
-    ]
-    key_set: Set[FidesKey] = set(
-        reduce(lambda x, y: set().union(x).union(y), referenced_keys)
+    referenced_keys: Set[FidesKey] = set().union(
+        *collect_resource_references(iter_taxonomy_resources(taxonomy)).values()
+    )
+    existing_keys: Set[FidesKey] = set().union(
+        *get_taxonomy_keys_by_type(IndexedTaxonomy(taxonomy)).values()
+    )
+    return list(referenced_keys - existing_keys)
+
+
+def get_taxonomy_keys_by_type(
+    indexed_taxonomy: IndexedTaxonomy,
+) -> Dict[str, Set[FidesKey]]:
+    """
+    Returns the fides_keys of every resource in the Taxonomy, grouped by type.
+    """
+    return {
+        resource_type: set(resources)
+        for resource_type, resources in indexed_taxonomy.resources.items()
+    }
+
+
+def get_unknown_keys_by_type(
+    referenced_keys: Dict[str, Set[FidesKey]], known_keys: Dict[str, Set[FidesKey]]
+) -> Dict[str, List[FidesKey]]:
+    """
+    Returns the referenced keys that aren't known yet, grouped by type,
+    and adds them to the known keys.
+
+    Only resource types that are part of a Taxonomy are included.
+    """
+    unknown_keys: Dict[str, List[FidesKey]] = {}
+    for resource_type, fides_keys in referenced_keys.items():
+        if resource_type not in known_keys:
+            continue
+        new_keys = fides_keys - known_keys[resource_type]
+        if new_keys:
+            unknown_keys[resource_type] = sorted(new_keys)
+            known_keys[resource_type].update(new_keys)
+    return unknown_keys
+
+
+def get_referenced_missing_keys_by_type(
+    taxonomy: Taxonomy,
+) -> Dict[str, List[FidesKey]]:
+    """
+    Iterate through the Taxonomy and find all of the FidesKeys that it
+    references but doesn't contain, grouped by the resource type they reference.
+
+    Only resource types that are part of a Taxonomy are included.
+    """
+    return get_unknown_keys_by_type(
+        collect_resource_references(iter_taxonomy_resources(taxonomy)),
+        get_taxonomy_keys_by_type(IndexedTaxonomy(taxonomy)),
     )
-    keys_not_in_taxonomy = [
-        fides_key
-        for fides_key in key_set
-        if get_resource_by_fides_key(taxonomy, fides_key) is None
-    ]
-    return keys_not_in_taxonomy
 
 
 def hydrate_missing_resources(
     url: AnyHttpUrl,
     headers: Dict[str, str],
-    missing_resource_keys: List[FidesKey],
+    missing_resource_keys: Dict[str, List[FidesKey]],
     dehydrated_taxonomy: Taxonomy,
 ) -> Taxonomy:
     """
     Query the server for all of the missing resource keys and
     hydrate a copy of the dehydrated taxonomy with them.
+
+    Each key is only requested from the resource type that references it,
+    and every resource type is queried at the same time.
     """
 
-    for resource_name in dehydrated_taxonomy.__fields__:
-        server_resources = get_server_resources(
-            url=url,
-            resource_type=resource_name,
-            headers=headers,
-            existing_keys=missing_resource_keys,
+    server_resource_lists = get_server_resources_concurrently(
+        url=url,
+        resource_keys=missing_resource_keys,
+        headers=headers,
+    )
+    add_resource_lists(IndexedTaxonomy(dehydrated_taxonomy), server_resource_lists)
+    return dehydrated_taxonomy
+
+
+def get_local_resources(
+    local_taxonomy: LazyTaxonomy, missing_resource_keys: Dict[str, List[FidesKey]]
+) -> Tuple[Dict[str, List[BaseModel]], Dict[str, List[FidesKey]]]:
+    """
+    Returns the missing resources that can be found in the local taxonomy,
+    along with the keys that are still missing, grouped by type.
+    """
+    local_resource_lists: Dict[str, List[BaseModel]] = {}
+    remaining_resource_keys: Dict[str, List[FidesKey]] = {}
+    for resource_type, fides_keys in missing_resource_keys.items():
+        for fides_key in fides_keys:
+            local_resource = local_taxonomy.get_resource(resource_type, fides_key)
+            if local_resource is None:
+                remaining_resource_keys.setdefault(resource_type, []).append(fides_key)
+            else:
+                local_resource_lists.setdefault(resource_type, []).append(
+                    local_resource
+                )
+    return local_resource_lists, remaining_resource_keys
+
+
+def get_missing_resources(
+    url: AnyHttpUrl,
+    headers: Dict[str, str],
+    missing_resource_keys: Dict[str, List[FidesKey]],
+    local_taxonomy: Optional[LazyTaxonomy] = None,
+) -> List[Dict[str, List[BaseModel]]]:
+    """
+    Returns the missing resources found in the local taxonomy, if one is
+    passed, and the rest from the server, grouped by type.
+    """
+    local_resource_lists: Dict[str, List[BaseModel]] = {}
+    if local_taxonomy:
+        local_resource_lists, missing_resource_keys = get_local_resources(
+            local_taxonomy, missing_resource_keys
         )
-        dehydrated_taxonomy.__setattr__(
-            resource_name,
-            getattr(dehydrated_taxonomy, resource_name) + server_resources,
+    if not missing_resource_keys:
+        return [local_resource_lists]
+
+    server_resource_lists = get_server_resources_concurrently(
+        url=url,
+        resource_keys=missing_resource_keys,
+        headers=headers,
+    )
+    return [local_resource_lists, server_resource_lists]
+
+
+def add_resource_lists(
+    indexed_taxonomy: IndexedTaxonomy, resource_lists: Dict[str, List[BaseModel]]
+) -> List[Tuple[str, BaseModel]]:
+    """
+    Adds the resources of each type to the indexed taxonomy, returning
+    each resource that wasn't already in it along with its type.
+    """
+    added_resources: List[Tuple[str, BaseModel]] = []
+    for resource_type, resources in resource_lists.items():
+        added_resources += [
+            (resource_type, resource)
+            for resource in indexed_taxonomy.add_resources(resource_type, resources)
+        ]
+    return added_resources
+
+
+def hydrate_referenced_resources(
+    url: AnyHttpUrl,
+    headers: Dict[str, str],
+    dehydrated_taxonomy: Taxonomy,
+    local_taxonomy: Optional[LazyTaxonomy] = None,
+) -> Taxonomy:
+    """
+    Hydrate the taxonomy with every resource that it references, directly or
+    through the resources that are fetched for it, until nothing is missing.
+
+    Works through a worklist of newly added resources, so each round only
+    extracts the references of the resources fetched in the previous round.
+    Keys that have been requested once are never requested again, even if
+    the server doesn't have them.
+
+    If a local taxonomy is passed, missing resources are taken from it
+    before the rest are requested from the server.
+    """
+    indexed_taxonomy = IndexedTaxonomy(dehydrated_taxonomy)
+    known_keys = get_taxonomy_keys_by_type(indexed_taxonomy)
+    new_resources = list(iter_taxonomy_resources(dehydrated_taxonomy))
+    while new_resources:
+        missing_resource_keys = get_unknown_keys_by_type(
+            collect_resource_references(new_resources), known_keys
         )
+        if not missing_resource_keys:
+            break
+
+        new_resources = []
+        for resource_lists in get_missing_resources(
+            url, headers, missing_resource_keys, local_taxonomy
+        ):
+            new_resources += add_resource_lists(indexed_taxonomy, resource_lists)
     return dehydrated_taxonomy
@@ -2,7 +2,8 @@
 Utils for use within various fideslang modules.
 """
 
-from typing import Dict, Optional
+import hashlib
+from typing import Dict, Iterable, List, Optional
 
 from fideslang import FidesModel, Taxonomy
 
@@ -11,12 +12,83 @@ def get_resource_by_fides_key(
     taxonomy: Taxonomy, fides_key: str
 ) -> Optional[Dict[str, FidesModel]]:
     """
-    Recurse through a taxonomy to find a specific resource its fides_key.
+    Find the resource of each type with a specific fides_key.
+
+    To look up more than one fides_key, build an `IndexedTaxonomy` once instead.
+    """
+    return IndexedTaxonomy(taxonomy).get_resource_by_fides_key(fides_key)
+
+
+def get_resource_hash(resource: FidesModel) -> str:
+    """
+    Returns a hash of the canonical JSON of a resource, with its keys sorted,
+    which is the same for any two equal resources.
+    """
+    return hashlib.sha256(resource.json(sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class IndexedTaxonomy:
+    """
+    A view of a Taxonomy that indexes the resources of each type by fides_key,
+    along with the resource types that each fides_key belongs to.
+
+    The underlying Taxonomy keeps its lists for serialization, and resources
+    added through the view are appended to it so both stay consistent. The
+    first resource of a type with a given fides_key wins in both.
     """
 
-    return {
-        resource_type: resource
-        for resource_type in taxonomy.__fields_set__
-        for resource in getattr(taxonomy, resource_type)
-        if resource.fides_key == fides_key
-    } or None
+    def __init__(self, taxonomy: Taxonomy) -> None:
+        self.taxonomy = taxonomy
+        self.resources: Dict[str, Dict[str, FidesModel]] = {
+            resource_type: {} for resource_type in Taxonomy.__fields__
+        }
+        self.resource_types: Dict[str, List[str]] = {}
+        for resource_type in Taxonomy.__fields__:
+            self.index_resources(resource_type, getattr(taxonomy, resource_type) or [])
+
+    def index_resources(
+        self, resource_type: str, resources: Iterable[FidesModel]
+    ) -> List[FidesModel]:
+        """
+        Adds resources to the indexes, keeping the first resource for each key,
+        and returns the ones that were added.
+        """
+        type_resources = self.resources[resource_type]
+        indexed_resources = []
+        for resource in resources:
+            if resource.fides_key not in type_resources:
+                type_resources[resource.fides_key] = resource
+                self.resource_types.setdefault(resource.fides_key, []).append(
+                    resource_type
+                )
+                indexed_resources.append(resource)
+        return indexed_resources
+
+    def add_resources(
+        self, resource_type: str, resources: List[FidesModel]
+    ) -> List[FidesModel]:
+        """
+        Indexes resources and appends them to the Taxonomy, skipping any whose
+        fides_key it already has, and returns the ones that were added.
+        """
+        added_resources = self.index_resources(resource_type, resources)
+        if added_resources:
+            setattr(
+                self.taxonomy,
+                resource_type,
+                (getattr(self.taxonomy, resource_type) or []) + added_resources,
+            )
+        return added_resources
+
+    def get(self, resource_type: str, fides_key: str) -> Optional[FidesModel]:
+        "Returns the resource of a type with the given fides_key, if there is one."
+        return self.resources[resource_type].get(fides_key)
+
+    def get_resource_by_fides_key(
+        self, fides_key: str
+    ) -> Optional[Dict[str, FidesModel]]:
+        "Returns the resource of each type with the given fides_key."
+        return {
+            resource_type: self.resources[resource_type][fides_key]
+            for resource_type in self.resource_types.get(fides_key, [])
+        } or None
@@ -6,6 +6,7 @@ import re
 from typing import List, Dict, Pattern
 
 from pydantic import ConstrainedStr
+from pydantic.fields import ModelField
 
 
 class FidesValidationError(Exception):
@@ -82,3 +83,13 @@ def matching_parent_key(value: FidesKey, values: Dict) -> FidesKey:
             )
         )
     return value
+
+
+def load_named_tuple(value: object, field: ModelField) -> object:
+    """
+    Load a NamedTuple field from an object of its fields by name, which is
+    how it's serialized, or from a sequence of them.
+    """
+    if isinstance(value, dict):
+        return field.type_(**value)
+    return value
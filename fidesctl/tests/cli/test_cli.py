@@ -127,6 +127,22 @@ def test_evaluate_demo_resources_pass(
     assert result.exit_code == 0
 
 
+@pytest.mark.integration
+def test_evaluate_skip_apply_pass(test_config_path: str, test_cli_runner: CliRunner):
+    result = test_cli_runner.invoke(
+        cli,
+        [
+            "-f",
+            test_config_path,
+            "evaluate",
+            "tests/data/passing_declaration_taxonomy.yml",
+            "--skip-apply",
+        ],
+    )
+    print(result.output)
+    assert result.exit_code == 0
+
+
 @pytest.mark.integration
 def test_evaluate_with_key_pass(test_config_path: str, test_cli_runner: CliRunner):
     result = test_cli_runner.invoke(
@@ -0,0 +1,27 @@
+import json
+
+import pytest
+import requests
+
+from fidesctl.cli.utils import handle_cli_pages
+
+
+def create_response(resources) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(resources).encode()
+    return response
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "pages",
+    [
+        [[]],
+        [[{"fides_key": "a"}], [{"fides_key": "b", "tags": ["c"]}], []],
+    ],
+)
+def test_handle_cli_pages_prints_one_array(capsys, pages):
+    handle_cli_pages(create_response(page) for page in pages)
+    expected_resources = [resource for page in pages for resource in page]
+    assert capsys.readouterr().out == json.dumps(expected_resources, indent=2) + "\n"
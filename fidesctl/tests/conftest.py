@@ -98,7 +98,7 @@ def resources_dict():
             description="Custom Data Use",
         ),
         "evaluation": models.Evaluation(
-            fides_key="test_evaluation", status="PASS", details=["foo"], message="bar"
+            fides_key="test_evaluation", status="PASS", violations=[], message="bar"
         ),
         "organization": models.Organization(
             fides_key="test_organization",
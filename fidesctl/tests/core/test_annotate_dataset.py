@@ -0,0 +1,60 @@
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from fidesctl.core import annotate_dataset
+from fideslang.models import Dataset
+
+
+@pytest.mark.unit
+def test_annotate_datasets_yields_the_rest_after_quitting():
+    datasets = [
+        {
+            "fides_key": f"dataset_{dataset_number}",
+            "collections": [
+                {
+                    "name": "collection_1",
+                    "fields": [{"name": "field_1"}],
+                }
+            ],
+        }
+        for dataset_number in [1, 2]
+    ]
+    with patch.object(
+        annotate_dataset,
+        "get_data_categories_annotation",
+        side_effect=annotate_dataset.AnnotationAbortError,
+    ) as get_data_categories_annotation:
+        annotated_datasets = list(
+            annotate_dataset.annotate_datasets(
+                datasets=iter(datasets),
+                existing_categories=["data_category_1"],
+                annotate_all=True,
+            )
+        )
+
+    assert get_data_categories_annotation.call_count == 1
+    assert annotated_datasets == [Dataset(**dataset).dict() for dataset in datasets]
+
+
+@pytest.mark.unit
+def test_annotate_dataset_keeps_the_file_mode(tmp_path):
+    dataset_file = tmp_path / "dataset.yml"
+    dataset_file.write_text(
+        "dataset:\n- fides_key: dataset_1\n  collections:\n"
+        "  - name: collection_1\n    fields:\n    - name: field_1\n"
+    )
+    dataset_file.chmod(0o644)
+    with patch.object(annotate_dataset.db_session, "create_session"), patch.object(
+        annotate_dataset, "list_resource", return_value=[]
+    ), patch.object(
+        annotate_dataset,
+        "get_data_categories_annotation",
+        side_effect=annotate_dataset.AnnotationAbortError,
+    ):
+        annotate_dataset.annotate_dataset(str(dataset_file))
+
+    assert stat.S_IMODE(os.stat(dataset_file).st_mode) == 0o644
+    assert "dataset_1" in dataset_file.read_text()
@@ -1,9 +1,14 @@
 """Integration tests for the API module."""
 
+import json
+
 import pytest
+import requests_mock
 
 from fidesctl.core import api as _api
 from fideslang import parse, model_list
+from fideslang.utils import get_resource_hash
+
 
 # Helper Functions
 def get_existing_key(test_config, resource_type: str) -> int:
@@ -38,7 +43,49 @@ def test_generate_resource_urls_with_id(test_config):
     assert expected_url == result_url
 
 
+@pytest.mark.unit
+def test_ls_pages_follows_next_links():
+    with requests_mock.Mocker() as mocker:
+        mocker.get(
+            "http://test/policy/?fields=fides_key&limit=1",
+            complete_qs=True,
+            json=[{"fides_key": "a"}],
+            headers={"Link": '<http://test/policy/?limit=1&after=a>; rel="next"'},
+        )
+        mocker.get(
+            "http://test/policy/?limit=1&after=a",
+            complete_qs=True,
+            json=[],
+        )
+        pages = [
+            response.json()
+            for response in _api.ls_pages(
+                url="http://test",
+                resource_type="policy",
+                headers={},
+                params={"fields": "fides_key"},
+                page_size=1,
+            )
+        ]
+    assert pages == [[{"fides_key": "a"}], []]
+
+
 # Integration Tests
+@pytest.mark.unit
+def test_get_session_is_reused():
+    assert _api.get_session() is _api.get_session()
+
+
+@pytest.mark.unit
+def test_create_session_mounts_pooled_adapter():
+    session = _api.create_session()
+    for prefix in ["http://", "https://"]:
+        adapter = session.get_adapter(f"{prefix}localhost")
+        assert adapter.max_retries.total == _api.MAX_RETRIES
+        assert adapter.max_retries.status_forcelist == (502, 503, 504)
+        assert adapter._pool_maxsize == _api.POOL_SIZE
+
+
 @pytest.mark.integration
 def test_api_ping(test_config):
     assert _api.ping(test_config.cli.server_url + "/health").status_code == 200
@@ -71,6 +118,47 @@ def test_api_ls(test_config, endpoint):
     assert result.status_code == 200
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("endpoint", model_list)
+def test_api_ls_pages(test_config, endpoint):
+    all_keys = [
+        resource["fides_key"]
+        for resource in _api.ls(
+            url=test_config.cli.server_url,
+            resource_type=endpoint,
+            headers=test_config.user.request_headers,
+        ).json()
+    ]
+    paged_resources = [
+        resource
+        for response in _api.ls_pages(
+            url=test_config.cli.server_url,
+            resource_type=endpoint,
+            headers=test_config.user.request_headers,
+            params={"fields": "fides_key"},
+            page_size=2,
+        )
+        for resource in response.json()
+    ]
+    assert paged_resources == [{"fides_key": fides_key} for fides_key in all_keys]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("endpoint", model_list)
+def test_api_hashes(test_config, resources_dict, endpoint):
+    manifest = resources_dict[endpoint]
+    result = _api.hashes(
+        url=test_config.cli.server_url,
+        resource_type=endpoint,
+        headers=test_config.user.request_headers,
+    )
+    print(result.text)
+    assert result.status_code == 200
+    assert result.json()[manifest.fides_key] == get_resource_hash(
+        parse.parse_dict(endpoint, json.loads(manifest.json(exclude_none=True)))
+    )
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("endpoint", model_list)
 def test_api_get(test_config, endpoint):
@@ -85,6 +173,21 @@ def test_api_get(test_config, endpoint):
     assert result.status_code == 200
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("endpoint", model_list)
+def test_api_batch_get(test_config, endpoint):
+    existing_id = get_existing_key(test_config, endpoint)
+    result = _api.batch_get(
+        url=test_config.cli.server_url,
+        headers=test_config.user.request_headers,
+        resource_type=endpoint,
+        resource_ids=[existing_id, "missing_key"],
+    )
+    print(result.text)
+    assert result.status_code == 200
+    assert [resource["fides_key"] for resource in result.json()] == [existing_id]
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("endpoint", model_list)
 def test_sent_is_received(test_config, resources_dict, endpoint):
@@ -112,7 +215,6 @@ def test_sent_is_received(test_config, resources_dict, endpoint):
 @pytest.mark.integration
 @pytest.mark.parametrize("endpoint", model_list)
 def test_api_update(test_config, resources_dict, endpoint):
-
     manifest = resources_dict[endpoint]
 
     update_id = get_existing_key(test_config, endpoint)
@@ -127,6 +229,36 @@ def test_api_update(test_config, resources_dict, endpoint):
     assert result.status_code == 200
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("endpoint", model_list)
+def test_api_upsert(test_config, resources_dict, endpoint):
+    manifest = resources_dict[endpoint]
+    new_manifest = manifest.copy()
+    new_manifest.fides_key = f"{manifest.fides_key}_upserted"
+
+    result = _api.upsert(
+        url=test_config.cli.server_url,
+        headers=test_config.user.request_headers,
+        resource_type=endpoint,
+        json_resources="[{}, {}]".format(
+            manifest.json(exclude_none=True), new_manifest.json(exclude_none=True)
+        ),
+    )
+    print(result.text)
+    assert result.status_code == 200
+    assert result.json() == [
+        {"fides_key": manifest.fides_key, "status": "updated"},
+        {"fides_key": new_manifest.fides_key, "status": "created"},
+    ]
+
+    _api.delete(
+        url=test_config.cli.server_url,
+        resource_type=endpoint,
+        resource_id=new_manifest.fides_key,
+        headers=test_config.user.request_headers,
+    )
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("endpoint", model_list)
 def test_api_delete(test_config, resources_dict, endpoint):
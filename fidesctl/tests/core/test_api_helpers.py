@@ -1,5 +1,8 @@
+import threading
+import time
 import uuid
 from typing import Optional, List
+from unittest.mock import patch, MagicMock
 import pytest
 
 from fidesctl.core import api_helpers as _api_helpers
@@ -14,6 +17,7 @@ PARAM_MODEL_LIST = [
     model for model in model_list if model not in EXCLUDED_RESOURCE_TYPES
 ]
 
+
 # Fixtures
 @pytest.fixture
 def created_resources(test_config, resources_dict, request):
@@ -116,3 +120,92 @@ def test_get_server_resources_missing_resources(test_config, resource_type):
         headers=test_config.user.request_headers,
     )
     assert result == []
+
+
+@pytest.mark.unit
+def test_get_server_resources_keeps_key_order():
+    """
+    Tests that resources are fetched in one request and returned in key order
+    """
+    batch_get_mock = MagicMock()
+    batch_get_mock.return_value.status_code = 200
+    batch_get_mock.return_value.json.return_value = [
+        {"fides_key": "system_2", "system_type": "test", "privacy_declarations": []},
+        {"fides_key": "system_1", "system_type": "test", "privacy_declarations": []},
+    ]
+    with patch("fidesctl.core.api_helpers.api.batch_get", batch_get_mock):
+        result: List[FidesModel] = _api_helpers.get_server_resources(
+            url="http://localhost",
+            resource_type="system",
+            existing_keys=["system_1", "missing_system", "system_2"],
+            headers={},
+        )
+    batch_get_mock.assert_called_once()
+    assert [resource.fides_key for resource in result] == ["system_1", "system_2"]
+
+
+@pytest.mark.unit
+def test_get_server_resources_failed_request():
+    """
+    Tests that a failed request exits instead of parsing the error as resources
+    """
+    batch_get_mock = MagicMock()
+    batch_get_mock.return_value.status_code = 500
+    batch_get_mock.return_value.json.return_value = {"detail": "error"}
+    with patch("fidesctl.core.api_helpers.api.batch_get", batch_get_mock):
+        with pytest.raises(SystemExit):
+            _api_helpers.get_server_resources(
+                url="http://localhost",
+                resource_type="system",
+                existing_keys=["system_1"],
+                headers={},
+            )
+
+
+@pytest.mark.unit
+def test_get_server_resources_no_keys():
+    """
+    Tests that no request is made when there are no keys
+    """
+    batch_get_mock = MagicMock()
+    with patch("fidesctl.core.api_helpers.api.batch_get", batch_get_mock):
+        result = _api_helpers.get_server_resources(
+            url="http://localhost", resource_type="system", existing_keys=[], headers={}
+        )
+    batch_get_mock.assert_not_called()
+    assert result == []
+
+
+@pytest.mark.unit
+def test_get_server_resources_concurrently():
+    """
+    Tests that every resource type is fetched, with a bounded number of
+    requests in flight at once
+    """
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def get_server_resources_mock(url, resource_type, existing_keys, headers):
+        with lock:
+            in_flight.append(resource_type)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(resource_type)
+        return [f"{resource_type}_{key}" for key in existing_keys]
+
+    resource_keys = {f"type_{type_number}": ["key"] for type_number in range(6)}
+    with patch(
+        "fidesctl.core.api_helpers.get_server_resources", get_server_resources_mock
+    ):
+        result = _api_helpers.get_server_resources_concurrently(
+            url="http://localhost",
+            resource_keys=resource_keys,
+            headers={},
+            max_concurrent_requests=2,
+        )
+    assert result == {
+        resource_type: [f"{resource_type}_key"] for resource_type in resource_keys
+    }
+    assert max(max_in_flight) == 2
@@ -0,0 +1,121 @@
+"""Load tests for the API's handling of concurrent requests."""
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+import pytest
+
+from fidesapi import crud, db_session
+from fidesapi.main import app
+
+SLOW_QUERY_SECONDS = 0.05
+CONCURRENT_CLIENTS = 200
+
+
+async def send_request(path: str, sent_at: float) -> Tuple[int, float]:
+    """
+    Sends a GET request straight to the app, returning its status
+    and its latency since all of the clients sent their requests.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    messages: List[Dict] = []
+
+    async def receive() -> Dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"], time.perf_counter() - sent_at
+
+
+def get_percentile(latencies: List[float], percentile: int) -> float:
+    "Returns the latency that the given percent of latencies are within."
+    ordered_latencies = sorted(latencies)
+    return ordered_latencies[
+        min(len(ordered_latencies) - 1, len(ordered_latencies) * percentile // 100)
+    ]
+
+
+def run_clients(
+    monkeypatch, slow_query_seconds: float, blocking: bool = False
+) -> Dict[str, List[float]]:
+    """
+    Half of the clients list resources with a slow, blocking query while the
+    other half check the health endpoint, returning the latencies of each.
+
+    With `blocking`, queries run on the event loop as the handlers used to.
+    """
+
+    def slow_list_resource(session, sql_model, **kwargs):
+        time.sleep(slow_query_seconds)
+        return []
+
+    async def run_blocking(func):
+        return func()
+
+    monkeypatch.setattr(crud, "list_resource", slow_list_resource)
+    if blocking:
+        monkeypatch.setattr(db_session, "run_in_executor", run_blocking)
+
+    async def send_requests() -> List[Tuple[int, float]]:
+        sent_at = time.perf_counter()
+        return await asyncio.gather(*[send_request(path, sent_at) for path in paths])
+
+    paths = ["/data_use/", "/health"] * (CONCURRENT_CLIENTS // 2)
+    responses = asyncio.run(send_requests())
+
+    assert all(status == 200 for status, _ in responses)
+    latencies: Dict[str, List[float]] = {path: [] for path in paths}
+    for path, (_, latency) in zip(paths, responses):
+        latencies[path].append(latency)
+    return latencies
+
+
+@pytest.mark.unit
+def test_slow_queries_do_not_block_other_requests(monkeypatch):
+    "Health checks respond while the slow queries are still running."
+    latencies = run_clients(monkeypatch, SLOW_QUERY_SECONDS)
+    assert max(latencies["/health"]) < max(latencies["/data_use/"])
+
+
+@pytest.mark.unit
+def test_blocking_queries_block_other_requests(monkeypatch):
+    "Run on the event loop, the slow queries hold up the health checks."
+    latencies = run_clients(monkeypatch, SLOW_QUERY_SECONDS, blocking=True)
+    assert max(latencies["/health"]) > min(latencies["/data_use/"])
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("slow_query_seconds", [SLOW_QUERY_SECONDS, 0.2])
+def test_health_latency_is_independent_of_slow_queries(monkeypatch, slow_query_seconds):
+    """
+    Health checks respond within the duration of a single slow query,
+    however long the queries take.
+    """
+    latencies = run_clients(monkeypatch, slow_query_seconds)
+    assert get_percentile(latencies["/health"], 99) < SLOW_QUERY_SECONDS
+
+
+@pytest.mark.integration
+def test_blocking_queries_add_up(monkeypatch):
+    """
+    Run one at a time on the event loop, the slow queries add up before
+    the last health check can respond.
+    """
+    latencies = run_clients(monkeypatch, SLOW_QUERY_SECONDS, blocking=True)
+    assert get_percentile(latencies["/health"], 99) > SLOW_QUERY_SECONDS * 10
@@ -1,8 +1,12 @@
 """Unit tests for the Commands module."""
+import json
+from unittest.mock import patch, MagicMock
+
 import pytest
 
 from fidesctl.core import apply
 import fideslang as models
+from fideslang.utils import get_resource_hash
 
 
 # Helpers
@@ -112,3 +116,89 @@ def test_execute_create_update_unchanged_empty():
         url="test", headers={"test": "test"}, resource_type="test"
     )
     assert True
+
+
+@pytest.mark.unit
+def test_execute_create_update_unchanged_chunks():
+    resources = [
+        models.DataCategory(fides_key=f"resource_{resource_number}")
+        for resource_number in range(5)
+    ]
+    upsert_mock = MagicMock()
+    with patch("fidesctl.core.apply.api.upsert", upsert_mock), patch(
+        "fidesctl.core.apply.handle_cli_response"
+    ):
+        apply.execute_create_update_unchanged(
+            url="http://localhost",
+            headers={},
+            resource_type="data_category",
+            create_list=resources[:3],
+            update_list=resources[3:],
+            chunk_size=2,
+        )
+    upserted_chunks = [
+        [
+            resource["fides_key"]
+            for resource in json.loads(call.kwargs["json_resources"])
+        ]
+        for call in upsert_mock.call_args_list
+    ]
+    assert upserted_chunks == [
+        ["resource_0", "resource_1"],
+        ["resource_2", "resource_3"],
+        ["resource_4"],
+    ]
+
+
+@pytest.mark.unit
+def test_sort_unchanged_by_hash():
+    resources = [
+        models.DataCategory(fides_key=f"resource_{resource_number}")
+        for resource_number in range(3)
+    ]
+    changed_resource = models.DataCategory(fides_key="resource_1", name="Changed")
+    server_resource_hashes = {
+        "resource_0": get_resource_hash(resources[0]),
+        "resource_1": get_resource_hash(changed_resource),
+    }
+
+    unchanged_list, compare_list = apply.sort_unchanged_by_hash(
+        resources, server_resource_hashes
+    )
+    assert unchanged_list == resources[:1]
+    assert compare_list == resources[1:]
+
+
+@pytest.mark.unit
+def test_sort_unchanged_by_hash_without_server_hashes():
+    resources = [models.DataCategory(fides_key="resource_0")]
+    assert apply.sort_unchanged_by_hash(resources, None) == ([], resources)
+
+
+@pytest.mark.unit
+def test_apply_only_fetches_resources_with_changed_hashes():
+    resources = [
+        models.DataCategory(fides_key=f"resource_{resource_number}")
+        for resource_number in range(3)
+    ]
+    server_resource_hashes = {
+        "resource_0": get_resource_hash(resources[0]),
+        "resource_1": "outdated_hash",
+    }
+    get_server_resources_mock = MagicMock(return_value={"data_category": []})
+    with patch(
+        "fidesctl.core.apply.get_server_resource_hashes_concurrently",
+        MagicMock(return_value={"data_category": server_resource_hashes}),
+    ), patch(
+        "fidesctl.core.apply.get_server_resources_concurrently",
+        get_server_resources_mock,
+    ):
+        apply.apply(
+            url="http://localhost",
+            taxonomy=models.Taxonomy(data_category=resources),
+            headers={},
+            dry=True,
+        )
+    assert get_server_resources_mock.call_args.kwargs["resource_keys"] == {
+        "data_category": ["resource_1"]
+    }
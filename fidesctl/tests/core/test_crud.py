@@ -0,0 +1,102 @@
+"""Unit tests for the generic CRUD endpoints of the API."""
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+
+from fidesapi import crud
+from fidesapi.main import app
+from fidesapi.sql_models import sql_model_map
+
+
+def compile_query(query) -> str:
+    "Compiles a query to Postgres SQL with its parameters inlined."
+    return str(
+        query.statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+@pytest.mark.unit
+def test_get_list_query_filters_and_pages():
+    query = crud.get_list_query(
+        Session(),
+        sql_model_map["data_category"],
+        filters={"parent_key": "user"},
+        fides_key_prefix="user.provided_",
+        after="user.provided.a",
+        limit=10,
+    )
+    sql = compile_query(query)
+    assert "data_categories.parent_key = 'user'" in sql
+    assert "LIKE 'user.provided/_' || '%%' ESCAPE '/'" in sql
+    assert "data_categories.fides_key > 'user.provided.a'" in sql
+    assert sql.endswith("ORDER BY data_categories.fides_key \n LIMIT 10")
+
+
+@pytest.mark.unit
+def test_get_list_query_projects_fields():
+    query = crud.get_list_query(
+        Session(), sql_model_map["dataset"], fields=["fides_key", "name"]
+    )
+    assert compile_query(query).startswith(
+        "SELECT datasets.fides_key, datasets.name \nFROM datasets"
+    )
+
+
+@pytest.mark.unit
+def test_ls_links_to_the_next_page(monkeypatch):
+    def list_policies(session, sql_model, **kwargs):
+        assert kwargs["limit"] == 2
+        assert kwargs["fields"] == ["fides_key", "name"]
+        return [
+            {"fides_key": "policy_1", "name": "Policy 1"},
+            {"fides_key": "policy_2", "name": "Policy 2"},
+        ]
+
+    monkeypatch.setattr(crud, "list_resource", list_policies)
+    response = TestClient(app).get(
+        "/policy/", params={"limit": 2, "fields": ["name", "fides_key"]}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"fides_key": "policy_1", "name": "Policy 1"},
+        {"fides_key": "policy_2", "name": "Policy 2"},
+    ]
+    assert response.links["next"]["url"] == (
+        "http://testserver/policy/?limit=2&fields=name&fields=fides_key&after=policy_2"
+    )
+
+
+@pytest.mark.unit
+def test_ls_rejects_unknown_fields():
+    response = TestClient(app).get(
+        "/data_subject/", params={"parent_key": "user", "fields": "name"}
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "data_subject has no field(s): parent_key"}
+
+
+@pytest.mark.unit
+def test_batch_routes_do_not_collide_with_fides_keys(monkeypatch):
+    monkeypatch.setattr(
+        crud,
+        "get_resource_hashes",
+        lambda session, sql_model: {"policy_1": "hash_1"},
+    )
+    monkeypatch.setattr(
+        crud,
+        "get_resource",
+        lambda session, sql_model, fides_key: {"fides_key": fides_key, "rules": []},
+    )
+    client = TestClient(app)
+
+    response = client.get("/policy/_batch/hashes")
+    assert response.status_code == 200
+    assert response.json() == {"policy_1": "hash_1"}
+
+    response = client.get("/policy/hashes")
+    assert response.status_code == 200
+    assert response.json()["fides_key"] == "hashes"
@@ -0,0 +1,56 @@
+"""Unit tests for the database session setup of the API."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from fidesapi import db_session
+from fidesctl.core.config import APISettings
+
+
+@pytest.mark.unit
+def test_get_engine_uses_pool_settings():
+    api_settings = APISettings(
+        database_pool_size=2,
+        database_max_overflow=3,
+        database_pool_pre_ping=True,
+        database_pool_recycle=300,
+    )
+    engine = db_session.get_engine(api_settings)
+    assert engine.pool.size() == 2
+    assert engine.pool._max_overflow == 3
+    assert engine.pool._pre_ping
+    assert engine.pool._recycle == 300
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "pool_size, max_overflow, expected_workers",
+    [
+        (5, 10, 15),
+        (1, 0, 1),
+        (1, -1, db_session.UNLIMITED_POOL_WORKERS),
+        (0, 10, db_session.UNLIMITED_POOL_WORKERS),
+    ],
+)
+def test_get_executor_workers(pool_size, max_overflow, expected_workers):
+    api_settings = APISettings(
+        database_pool_size=pool_size, database_max_overflow=max_overflow
+    )
+    assert db_session.get_executor_workers(api_settings) == expected_workers
+
+
+@pytest.mark.unit
+def test_get_session_closes_the_session_after_the_request(monkeypatch):
+    db_session.global_init(APISettings())
+    session = MagicMock()
+    monkeypatch.setattr(db_session, "create_session", lambda: session)
+
+    async def handle_request() -> None:
+        sessions = db_session.get_session()
+        assert await sessions.__anext__() is session
+        session.close.assert_not_called()
+        await sessions.aclose()
+
+    asyncio.run(handle_request())
+    session.close.assert_called_once()
@@ -1,9 +1,12 @@
 from unittest.mock import patch, MagicMock
+import json
 import pytest
+import requests_mock
+import yaml
 
-from typing import List
+from typing import Dict, List
 
-from fidesctl.core import evaluate, api as _api
+from fidesctl.core import evaluate, evaluate_compiled, api as _api
 
 from fideslang.models import (
     DataCategory,
@@ -12,6 +15,9 @@ from fideslang.models import (
     DataUse,
     Dataset,
     DatasetCollection,
+    DatasetField,
+    Evaluation,
+    EvaluationViolation,
     Policy,
     PrivacyRule,
     PrivacyDeclaration,
@@ -21,6 +27,7 @@ from fideslang.models import (
     ActionEnum,
     System,
 )
+from fideslang.parse import LazyTaxonomy
 
 
 # Helpers
@@ -108,6 +115,66 @@ def create_policy_rule_with_keys(
     )
 
 
+def validate_keys_exist_for_evaluation(
+    taxonomy: Taxonomy,
+    policy_rule: PolicyRule,
+    data_subjects: List[str],
+    data_categories: List[str],
+    data_qualifier: str,
+    data_use: str,
+) -> None:
+    """
+    Validates the keys of a taxonomy with a single policy rule and a single
+    privacy declaration.
+    """
+    taxonomy.policy = [Policy(fides_key="policy_1", rules=[policy_rule])]
+    taxonomy.system = [
+        System(
+            fides_key="system_1",
+            system_type="test",
+            privacy_declarations=[
+                PrivacyDeclaration(
+                    name="declaration_1",
+                    data_categories=data_categories,
+                    data_use=data_use,
+                    data_qualifier=data_qualifier,
+                    data_subjects=data_subjects,
+                )
+            ],
+        )
+    ]
+    evaluate.validate_taxonomy_keys_exist_for_evaluation(taxonomy)
+
+
+def compare_rule_to_declaration(
+    rule_types: List[str],
+    declaration_type_hierarchies: List[List[str]],
+    rule_inclusion: InclusionEnum,
+) -> bool:
+    """
+    Compiles the rule and the declaration hierarchies over the keys they use,
+    and compares them.
+    """
+    positions: Dict[str, int] = {}
+
+    def get_bits(fides_keys: List[str]) -> int:
+        return sum(
+            {
+                1 << positions.setdefault(fides_key, len(positions))
+                for fides_key in fides_keys
+            }
+        )
+
+    return evaluate_compiled.compare_compiled_rule_to_declaration(
+        compiled_privacy_rule=evaluate_compiled.CompiledPrivacyRule(
+            inclusion=rule_inclusion, bits=get_bits(rule_types)
+        ),
+        declaration_hierarchy_bits=[
+            get_bits(hierarchy) for hierarchy in declaration_type_hierarchies
+        ],
+    )
+
+
 @pytest.mark.integration
 def test_get_all_server_policies(test_config):
     result = evaluate.get_all_server_policies(
@@ -144,7 +211,6 @@ def test_populate_referenced_keys_recursively(test_config):
         ),
         url=test_config.cli.server_url,
         headers=test_config.user.request_headers,
-        last_keys=[],
     )
 
     populated_categories = [
@@ -260,7 +326,7 @@ def test_validate_policies_exist_with_policies():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_any_true():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1"],
         declaration_type_hierarchies=[["key_2"], ["key_1"]],
         rule_inclusion="ANY",
@@ -270,7 +336,7 @@ def test_compare_rule_to_declaration_any_true():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_any_true_hierarchical():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1_parent"],
         declaration_type_hierarchies=[["key_2"], ["key_1", "key_1_parent"]],
         rule_inclusion="ANY",
@@ -280,7 +346,7 @@ def test_compare_rule_to_declaration_any_true_hierarchical():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_any_false():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1"],
         declaration_type_hierarchies=[["key_2"], ["key_3"]],
         rule_inclusion="ANY",
@@ -290,7 +356,7 @@ def test_compare_rule_to_declaration_any_false():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_any_false_hierarchical():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1"],
         declaration_type_hierarchies=[["key_2", "key_2_parent"], ["key_3"]],
         rule_inclusion="ANY",
@@ -300,7 +366,7 @@ def test_compare_rule_to_declaration_any_false_hierarchical():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_all_true():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1", "key_3"],
         declaration_type_hierarchies=[["key_3"], ["key_1"]],
         rule_inclusion="ALL",
@@ -310,7 +376,7 @@ def test_compare_rule_to_declaration_all_true():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_all_true_hierarchical():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1_parent", "key_3_parent"],
         declaration_type_hierarchies=[
             ["key_3", "key_3_parent"],
@@ -323,7 +389,7 @@ def test_compare_rule_to_declaration_all_true_hierarchical():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_all_false():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1", "key_3"],
         declaration_type_hierarchies=[["key_2"], ["key_1"]],
         rule_inclusion="ALL",
@@ -333,7 +399,7 @@ def test_compare_rule_to_declaration_all_false():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_all_false_hierarchical():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1", "key_1_parent", "key_3"],
         declaration_type_hierarchies=[["key_2"], ["key_1" "key_1_parent"]],
         rule_inclusion="ALL",
@@ -343,7 +409,7 @@ def test_compare_rule_to_declaration_all_false_hierarchical():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_none_true():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1"],
         declaration_type_hierarchies=[["key_2"], ["key_3"]],
         rule_inclusion="NONE",
@@ -353,7 +419,7 @@ def test_compare_rule_to_declaration_none_true():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_none_true_hierarchical():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1"],
         declaration_type_hierarchies=[["key_2", "key_2_parent"], ["key_3"]],
         rule_inclusion="NONE",
@@ -363,7 +429,7 @@ def test_compare_rule_to_declaration_none_true_hierarchical():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_none_false():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1"],
         declaration_type_hierarchies=[["key_2"], ["key_3"], ["key_1"]],
         rule_inclusion="NONE",
@@ -373,7 +439,7 @@ def test_compare_rule_to_declaration_none_false():
 
 @pytest.mark.unit
 def test_compare_rule_to_declaration_none_false_hierarchical():
-    result = evaluate.compare_rule_to_declaration(
+    result = compare_rule_to_declaration(
         rule_types=["key_1_parent"],
         declaration_type_hierarchies=[["key_2"], ["key_3"], ["key_1", "key_1_parent"]],
         rule_inclusion="NONE",
@@ -382,38 +448,10 @@ def test_compare_rule_to_declaration_none_false_hierarchical():
 
 
 @pytest.mark.unit
-def test_get_dataset_by_fides_key_exists():
-    dataset_1 = Dataset(
-        fides_key="dataset_1", collections=[DatasetCollection(name="", fields=[])]
-    )
-    dataset_2 = Dataset(
-        fides_key="dataset_2", collections=[DatasetCollection(name="", fields=[])]
-    )
-    result = evaluate.get_dataset_by_fides_key(
-        taxonomy=Taxonomy(dataset=[dataset_1, dataset_2]), fides_key="dataset_1"
-    )
-    assert result == dataset_1
-
-
-@pytest.mark.unit
-def test_get_dataset_by_fides_key_does_not_exist():
-    dataset1 = Dataset(
-        fides_key="dataset_1", collections=[DatasetCollection(name="", fields=[])]
-    )
-    dataset_2 = Dataset(
-        fides_key="dataset_2", collections=[DatasetCollection(name="", fields=[])]
-    )
-    result = evaluate.get_dataset_by_fides_key(
-        taxonomy=Taxonomy(dataset=[dataset1, dataset_2]), fides_key="dataset_3"
-    )
-    assert not result
-
-
-@pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_pass(
+def test_validate_taxonomy_keys_exist_for_evaluation_declaration_pass(
     evaluation_key_validation_basic_taxonomy,
 ):
-    evaluate.validate_fides_keys_exist_for_evaluation(
+    validate_keys_exist_for_evaluation(
         taxonomy=evaluation_key_validation_basic_taxonomy,
         policy_rule=create_policy_rule_with_keys(
             data_categories=["data_category_1"],
@@ -429,11 +467,11 @@ def test_validate_fides_keys_exist_for_evaluation_pass(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_data_subject(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_data_subject(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_1"],
@@ -449,11 +487,11 @@ def test_validate_fides_keys_exist_for_evaluation_missing_data_subject(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_rule_data_subject(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_rule_data_subject(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_1"],
@@ -469,11 +507,11 @@ def test_validate_fides_keys_exist_for_evaluation_missing_rule_data_subject(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_data_categrory(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_data_categrory(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_1"],
@@ -489,11 +527,11 @@ def test_validate_fides_keys_exist_for_evaluation_missing_data_categrory(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_rule_data_categrory(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_rule_data_categrory(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_3"],
@@ -509,11 +547,11 @@ def test_validate_fides_keys_exist_for_evaluation_missing_rule_data_categrory(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_data_qualifier(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_data_qualifier(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_1"],
@@ -529,11 +567,11 @@ def test_validate_fides_keys_exist_for_evaluation_missing_data_qualifier(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_rule_data_qualifier(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_rule_data_qualifier(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_1"],
@@ -549,11 +587,11 @@ def test_validate_fides_keys_exist_for_evaluation_missing_rule_data_qualifier(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_data_use(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_data_use(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_1"],
@@ -569,11 +607,11 @@ def test_validate_fides_keys_exist_for_evaluation_missing_data_use(
 
 
 @pytest.mark.unit
-def test_validate_fides_keys_exist_for_evaluation_missing_rule_data_use(
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_rule_data_use(
     evaluation_key_validation_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.validate_fides_keys_exist_for_evaluation(
+        validate_keys_exist_for_evaluation(
             taxonomy=evaluation_key_validation_basic_taxonomy,
             policy_rule=create_policy_rule_with_keys(
                 data_categories=["data_category_1"],
@@ -628,11 +666,13 @@ def test_validate_supported_policy_rules_passes():
 
 
 @pytest.mark.unit
-def test_get_fides_key_parent_hierarchy_child(
+def test_get_indexed_fides_key_hierarchy_child(
     evaluation_hierarchical_key_basic_taxonomy,
 ):
-    result = evaluate.get_fides_key_parent_hierarchy(
-        taxonomy=evaluation_hierarchical_key_basic_taxonomy,
+    result = evaluate_compiled.get_indexed_fides_key_hierarchy(
+        taxonomy_index=evaluate_compiled.build_taxonomy_index(
+            evaluation_hierarchical_key_basic_taxonomy
+        ),
         fides_key="data_category.parent.child",
     )
     assert result == [
@@ -643,48 +683,562 @@ def test_get_fides_key_parent_hierarchy_child(
 
 
 @pytest.mark.unit
-def test_get_fides_key_parent_hierarchy_parent(
+def test_get_indexed_fides_key_hierarchy_parent(
     evaluation_hierarchical_key_basic_taxonomy,
 ):
-    result = evaluate.get_fides_key_parent_hierarchy(
-        taxonomy=evaluation_hierarchical_key_basic_taxonomy,
+    result = evaluate_compiled.get_indexed_fides_key_hierarchy(
+        taxonomy_index=evaluate_compiled.build_taxonomy_index(
+            evaluation_hierarchical_key_basic_taxonomy
+        ),
         fides_key="data_category.parent",
     )
     assert result == ["data_category.parent", "data_category"]
 
 
 @pytest.mark.unit
-def test_get_fides_key_parent_hierarchy_top_level(
+def test_get_indexed_fides_key_hierarchy_top_level(
     evaluation_hierarchical_key_basic_taxonomy,
 ):
-    result = evaluate.get_fides_key_parent_hierarchy(
-        taxonomy=evaluation_hierarchical_key_basic_taxonomy, fides_key="data_category"
+    result = evaluate_compiled.get_indexed_fides_key_hierarchy(
+        taxonomy_index=evaluate_compiled.build_taxonomy_index(
+            evaluation_hierarchical_key_basic_taxonomy
+        ),
+        fides_key="data_category",
     )
     assert result == ["data_category"]
 
 
 @pytest.mark.unit
-def test_get_fides_key_parent_hierarchy_missing_key(
+def test_get_indexed_fides_key_hierarchy_missing_key(
     evaluation_hierarchical_key_basic_taxonomy,
 ):
     with pytest.raises(SystemExit):
-        evaluate.get_fides_key_parent_hierarchy(
-            taxonomy=evaluation_hierarchical_key_basic_taxonomy,
+        evaluate_compiled.get_indexed_fides_key_hierarchy(
+            taxonomy_index=evaluate_compiled.build_taxonomy_index(
+                evaluation_hierarchical_key_basic_taxonomy
+            ),
             fides_key="data_category.invalid",
         )
 
 
 @pytest.mark.unit
-def test_get_fides_key_parent_hierarchy_missing_parent():
+def test_get_indexed_fides_key_hierarchy_missing_parent():
     with pytest.raises(SystemExit):
-        evaluate.get_fides_key_parent_hierarchy(
-            taxonomy=Taxonomy(
-                data_category=[
-                    DataCategory(
-                        fides_key="data_category.parent",
-                        parent_key="data_category",
-                    ),
-                ]
+        evaluate_compiled.get_indexed_fides_key_hierarchy(
+            taxonomy_index=evaluate_compiled.build_taxonomy_index(
+                Taxonomy(
+                    data_category=[
+                        DataCategory(
+                            fides_key="data_category.parent",
+                            parent_key="data_category",
+                        ),
+                    ]
+                )
             ),
             fides_key="data_category.parent",
         )
+
+
+@pytest.mark.unit
+def test_build_taxonomy_index(evaluation_hierarchical_key_basic_taxonomy):
+    taxonomy_index = evaluate_compiled.build_taxonomy_index(
+        evaluation_hierarchical_key_basic_taxonomy
+    )
+    child_entry = taxonomy_index["data_category.parent.child"]
+    assert child_entry.resource_type == "data_category"
+    assert child_entry.hierarchy == [
+        "data_category.parent.child",
+        "data_category.parent",
+        "data_category",
+    ]
+    assert child_entry.hierarchy_bits == sum(
+        1 << taxonomy_index[key].position for key in child_entry.hierarchy
+    )
+    assert taxonomy_index["data_category"].hierarchy == ["data_category"]
+
+
+@pytest.mark.unit
+def test_build_taxonomy_index_missing_parent():
+    taxonomy_index = evaluate_compiled.build_taxonomy_index(
+        Taxonomy(
+            data_category=[
+                DataCategory(
+                    fides_key="data_category.parent.child",
+                    parent_key="data_category.parent",
+                ),
+                DataCategory(
+                    fides_key="data_category.parent",
+                    parent_key="data_category",
+                ),
+            ]
+        )
+    )
+    assert "data_category" not in taxonomy_index
+    assert taxonomy_index["data_category.parent.child"].hierarchy == [
+        "data_category.parent.child",
+        "data_category.parent",
+        "data_category",
+    ]
+    with pytest.raises(SystemExit):
+        evaluate_compiled.get_indexed_fides_key_hierarchy(
+            taxonomy_index=taxonomy_index, fides_key="data_category.parent.child"
+        )
+
+
+@pytest.mark.unit
+def test_compile_policy_rule(evaluation_key_validation_basic_taxonomy):
+    taxonomy_index = evaluate_compiled.build_taxonomy_index(
+        evaluation_key_validation_basic_taxonomy
+    )
+    compiled_rule = evaluate_compiled.compile_policy_rule(
+        taxonomy_index=taxonomy_index,
+        policy_rule=create_policy_rule_with_keys(
+            data_categories=["data_category_1", "data_category_2", "missing_key"],
+            data_uses=["data_use_1"],
+            data_subjects=[],
+            data_qualifier="data_qualifier_1",
+        ),
+    )
+    assert compiled_rule.data_categories == (
+        InclusionEnum.ANY,
+        (1 << taxonomy_index["data_category_1"].position)
+        | (1 << taxonomy_index["data_category_2"].position),
+    )
+    assert compiled_rule.data_uses.bits == 1 << taxonomy_index["data_use_1"].position
+    assert compiled_rule.data_subjects.bits == 0
+    assert compiled_rule.data_qualifier_bits == (
+        1 << taxonomy_index["data_qualifier_1"].position
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "inclusion,declaration_hierarchy_bits,expected",
+    [
+        (InclusionEnum.ANY, [0b0100, 0b0011], True),
+        (InclusionEnum.ANY, [0b0100, 0b1000], False),
+        (InclusionEnum.ALL, [0b0101, 0b0010], True),
+        (InclusionEnum.ALL, [0b0100, 0b0010], False),
+        (InclusionEnum.NONE, [0b0100, 0b1000], True),
+        (InclusionEnum.NONE, [0b0100, 0b1001], False),
+    ],
+)
+def test_compare_compiled_rule_to_declaration(
+    inclusion, declaration_hierarchy_bits, expected
+):
+    result = evaluate_compiled.compare_compiled_rule_to_declaration(
+        compiled_privacy_rule=evaluate_compiled.CompiledPrivacyRule(
+            inclusion=inclusion, bits=0b0011
+        ),
+        declaration_hierarchy_bits=declaration_hierarchy_bits,
+    )
+    assert result == expected
+
+
+@pytest.fixture()
+def evaluation_dataset_taxonomy():
+    yield Taxonomy(
+        data_category=[
+            DataCategory(fides_key="data_category"),
+            DataCategory(
+                fides_key="data_category.parent",
+                parent_key="data_category",
+            ),
+            DataCategory(fides_key="data_category_1"),
+        ],
+        data_qualifier=[DataQualifier(fides_key="data_qualifier_1")],
+        data_subject=[DataSubject(fides_key="data_subject_1")],
+        data_use=[DataUse(fides_key="data_use_1")],
+        dataset=[
+            Dataset(
+                fides_key="dataset_1",
+                data_categories=["data_category_1"],
+                data_qualifier="data_qualifier_1",
+                collections=[
+                    DatasetCollection(
+                        name="collection_1",
+                        data_categories=["data_category.parent", "data_category_1"],
+                        data_qualifier="data_qualifier_1",
+                        fields=[
+                            DatasetField(
+                                name="field_1",
+                                data_categories=["data_category.parent"],
+                                data_qualifier="data_qualifier_1",
+                            ),
+                            DatasetField(
+                                name="field_2", data_qualifier="data_qualifier_1"
+                            ),
+                        ],
+                    )
+                ],
+            )
+        ],
+    )
+
+
+@pytest.mark.unit
+def test_compile_dataset(evaluation_dataset_taxonomy):
+    taxonomy_index = evaluate_compiled.build_taxonomy_index(evaluation_dataset_taxonomy)
+    compiled_dataset = evaluate_compiled.compile_dataset(
+        taxonomy_index=taxonomy_index, dataset=evaluation_dataset_taxonomy.dataset[0]
+    )
+    assert compiled_dataset.target_types == [
+        "Dataset",
+        "DatasetCollection",
+        "DatasetField",
+    ]
+    assert compiled_dataset.target_paths == [
+        ("dataset_1",),
+        ("dataset_1", "collection_1"),
+        ("dataset_1", "collection_1", "field_1"),
+    ]
+    assert list(compiled_dataset.category_offsets) == [0, 1, 3]
+    assert compiled_dataset.category_matrix.shape == (4, 3)
+    assert compiled_dataset.qualifier_matrix.shape == (3, 1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "inclusion,expected_targets",
+    [
+        (
+            InclusionEnum.ANY,
+            ["DatasetCollection (collection_1)", "DatasetField (field_1)"],
+        ),
+        (InclusionEnum.ALL, ["DatasetField (field_1)"]),
+        (InclusionEnum.NONE, ["Dataset (dataset_1)"]),
+    ],
+)
+def test_evaluate_dataset_reference(
+    evaluation_dataset_taxonomy, inclusion, expected_targets
+):
+    taxonomy_index = evaluate_compiled.build_taxonomy_index(evaluation_dataset_taxonomy)
+    policy_rule = create_policy_rule_with_keys(
+        data_categories=["data_category"],
+        data_uses=["data_use_1"],
+        data_subjects=["data_subject_1"],
+        data_qualifier="data_qualifier_1",
+    )
+    policy_rule.data_categories.inclusion = inclusion
+    result = evaluate_compiled.evaluate_dataset_reference(
+        taxonomy_index=taxonomy_index,
+        policy=Policy(fides_key="policy_1", rules=[policy_rule]),
+        system=System(
+            fides_key="system_1", system_type="test", privacy_declarations=[]
+        ),
+        policy_rule=policy_rule,
+        compiled_policy_rule=evaluate_compiled.compile_policy_rule(
+            taxonomy_index=taxonomy_index, policy_rule=policy_rule
+        ),
+        privacy_declaration=PrivacyDeclaration(
+            name="declaration_1",
+            data_categories=[],
+            data_use="data_use_1",
+            data_subjects=["data_subject_1"],
+        ),
+        compiled_dataset=evaluate_compiled.compile_dataset(
+            taxonomy_index=taxonomy_index,
+            dataset=evaluation_dataset_taxonomy.dataset[0],
+        ),
+    )
+    assert [violation.render() for violation in result] == [
+        "Declaration (declaration_1) of System (system_1) failed Rule (None) from Policy (policy_1) for {}".format(
+            target
+        )
+        for target in expected_targets
+    ]
+
+
+@pytest.mark.unit
+def test_validate_taxonomy_keys_exist_for_evaluation_pass(
+    evaluation_dataset_taxonomy,
+):
+    evaluation_dataset_taxonomy.policy = [
+        Policy(
+            fides_key="policy_1",
+            rules=[
+                create_policy_rule_with_keys(
+                    data_categories=["data_category"],
+                    data_uses=["data_use_1"],
+                    data_subjects=["data_subject_1"],
+                    data_qualifier="data_qualifier_1",
+                )
+            ],
+        )
+    ]
+    evaluation_dataset_taxonomy.system = [
+        System(
+            fides_key="system_1",
+            system_type="test",
+            privacy_declarations=[
+                PrivacyDeclaration(
+                    name="declaration_1",
+                    data_categories=["data_category_1"],
+                    data_use="data_use_1",
+                    data_qualifier="data_qualifier_1",
+                    data_subjects=["data_subject_1"],
+                    dataset_references=["dataset_1"],
+                )
+            ],
+        )
+    ]
+    evaluate.validate_taxonomy_keys_exist_for_evaluation(evaluation_dataset_taxonomy)
+
+
+@pytest.mark.unit
+def test_validate_taxonomy_keys_exist_for_evaluation_missing_dataset_keys(
+    evaluation_dataset_taxonomy,
+):
+    evaluation_dataset_taxonomy.dataset[0].collections[0].fields[0].data_categories = [
+        "data_category_3"
+    ]
+    evaluation_dataset_taxonomy.system = [
+        System(
+            fides_key="system_1",
+            system_type="test",
+            privacy_declarations=[
+                PrivacyDeclaration(
+                    name="declaration_1",
+                    data_categories=["data_category_1"],
+                    data_use="data_use_1",
+                    data_qualifier="data_qualifier_1",
+                    data_subjects=["data_subject_1"],
+                    dataset_references=["dataset_1"],
+                )
+            ],
+        )
+    ]
+    with pytest.raises(SystemExit):
+        evaluate.validate_taxonomy_keys_exist_for_evaluation(
+            evaluation_dataset_taxonomy
+        )
+
+
+@pytest.mark.unit
+def test_validate_taxonomy_keys_exist_for_evaluation_ignores_unreferenced_datasets(
+    evaluation_dataset_taxonomy,
+):
+    evaluation_dataset_taxonomy.dataset[0].collections[0].fields[0].data_categories = [
+        "data_category_3"
+    ]
+    evaluate.validate_taxonomy_keys_exist_for_evaluation(evaluation_dataset_taxonomy)
+
+
+@pytest.fixture()
+def evaluation_systems_taxonomy(evaluation_dataset_taxonomy):
+    evaluation_dataset_taxonomy.policy = [
+        Policy(
+            fides_key="policy_1",
+            rules=[
+                create_policy_rule_with_keys(
+                    data_categories=["data_category"],
+                    data_uses=["data_use_1"],
+                    data_subjects=["data_subject_1"],
+                    data_qualifier="data_qualifier_1",
+                )
+            ],
+        )
+    ]
+    evaluation_dataset_taxonomy.system = [
+        System(
+            fides_key=f"system_{system_number}",
+            system_type="test",
+            privacy_declarations=[
+                PrivacyDeclaration(
+                    name="declaration_1",
+                    data_categories=["data_category.parent"],
+                    data_use="data_use_1",
+                    data_qualifier="data_qualifier_1",
+                    data_subjects=["data_subject_1"],
+                    dataset_references=["dataset_1"],
+                )
+            ],
+        )
+        for system_number in range(5)
+    ]
+    yield evaluation_dataset_taxonomy
+
+
+@pytest.mark.unit
+def test_execute_evaluation_parallel_matches_sequential(evaluation_systems_taxonomy):
+    sequential_evaluation = evaluate.execute_evaluation(evaluation_systems_taxonomy)
+    parallel_evaluation = evaluate.execute_evaluation(
+        evaluation_systems_taxonomy, jobs=2
+    )
+    assert len(sequential_evaluation.violations) == 15
+    assert parallel_evaluation.violations == sequential_evaluation.violations
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_execute_evaluation_cache_hits(
+    evaluation_systems_taxonomy, tmp_path, capsys, jobs
+):
+    first_evaluation = evaluate.execute_evaluation(
+        evaluation_systems_taxonomy, jobs=jobs, cache_dir=str(tmp_path)
+    )
+    assert "0 hits, 10 misses" in capsys.readouterr().err
+
+    evaluation_systems_taxonomy.system[0].privacy_declarations[0].name = "renamed"
+    second_evaluation = evaluate.execute_evaluation(
+        evaluation_systems_taxonomy, jobs=jobs, cache_dir=str(tmp_path)
+    )
+    assert "8 hits, 2 misses" in capsys.readouterr().err
+    assert (
+        second_evaluation.violations
+        == evaluate.execute_evaluation(evaluation_systems_taxonomy).violations
+    )
+    assert second_evaluation.violations[3:] == first_evaluation.violations[3:]
+
+
+@pytest.mark.unit
+def test_execute_evaluation_cache_invalidated_by_ancestry(
+    evaluation_systems_taxonomy, tmp_path, capsys
+):
+    evaluate.execute_evaluation(evaluation_systems_taxonomy, cache_dir=str(tmp_path))
+    capsys.readouterr()
+
+    evaluation_systems_taxonomy.data_category[2].parent_key = "data_category"
+    cached_evaluation = evaluate.execute_evaluation(
+        evaluation_systems_taxonomy, cache_dir=str(tmp_path)
+    )
+    assert "0 hits, 10 misses" in capsys.readouterr().err
+    assert len(cached_evaluation.violations) == 20
+    assert (
+        cached_evaluation.violations
+        == evaluate.execute_evaluation(evaluation_systems_taxonomy).violations
+    )
+
+
+@pytest.mark.unit
+def test_iter_evaluation_violations(evaluation_systems_taxonomy):
+    violations = list(evaluate.iter_evaluation_violations(evaluation_systems_taxonomy))
+    assert violations[:3] == [
+        EvaluationViolation(
+            policy="policy_1",
+            rule=None,
+            system="system_0",
+            declaration="declaration_1",
+        ),
+        EvaluationViolation(
+            policy="policy_1",
+            rule=None,
+            system="system_0",
+            declaration="declaration_1",
+            target_type="DatasetCollection",
+            target_path=("dataset_1", "collection_1"),
+        ),
+        EvaluationViolation(
+            policy="policy_1",
+            rule=None,
+            system="system_0",
+            declaration="declaration_1",
+            target_type="DatasetField",
+            target_path=("dataset_1", "collection_1", "field_1"),
+        ),
+    ]
+    assert (
+        violations
+        == evaluate.execute_evaluation(evaluation_systems_taxonomy).violations
+    )
+    assert violations[2].render() == (
+        "Declaration (declaration_1) of System (system_0) failed Rule (None) "
+        "from Policy (policy_1) for DatasetField (field_1)"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_generate_evaluation_chunks(evaluation_systems_taxonomy, chunk_size):
+    evaluation = Evaluation(
+        fides_key="evaluation_1", status="PASS", violations=[], message="message"
+    )
+    chunks = list(
+        evaluate.generate_evaluation_chunks(
+            evaluation=evaluation,
+            violations=evaluate.iter_evaluation_violations(evaluation_systems_taxonomy),
+            chunk_size=chunk_size,
+        )
+    )
+    streamed_evaluation = Evaluation.parse_raw(b"".join(chunks))
+    assert streamed_evaluation.status == evaluation.status == "FAIL"
+    assert streamed_evaluation.message == "message"
+    assert (
+        streamed_evaluation.violations
+        == evaluate.execute_evaluation(evaluation_systems_taxonomy).violations
+    )
+
+
+@pytest.mark.unit
+def test_generate_evaluation_chunks_pass():
+    evaluation = Evaluation(fides_key="evaluation_1", status="FAIL", violations=[])
+    chunks = evaluate.generate_evaluation_chunks(evaluation=evaluation, violations=[])
+    assert Evaluation.parse_raw(b"".join(chunks)) == Evaluation(
+        fides_key="evaluation_1", status="PASS", violations=[]
+    )
+    assert evaluation.status == "PASS"
+
+
+def evaluate_manifest(
+    taxonomy: Taxonomy, manifest_path: str
+) -> evaluate.EvaluationSummary:
+    """
+    Writes the taxonomy to a manifest and evaluates it against
+    a server that has no resources.
+    """
+    with open(manifest_path, "w") as manifest_file:
+        yaml.dump(json.loads(taxonomy.json(exclude_none=True)), manifest_file)
+    with requests_mock.Mocker() as mocker:
+        mocker.post(requests_mock.ANY, json=[])
+        return evaluate.evaluate(
+            url="http://localhost",
+            manifests_dir=manifest_path,
+            fides_key="policy_1",
+            headers={},
+            message="",
+            dry=True,
+        )
+
+
+@pytest.mark.unit
+def test_evaluate_returns_summary(evaluation_systems_taxonomy, tmp_path):
+    evaluation_systems_taxonomy.system = []
+    summary = evaluate_manifest(evaluation_systems_taxonomy, f"{tmp_path}/taxonomy.yml")
+    assert summary.status == "PASS"
+    assert summary.fides_key
+
+
+@pytest.mark.unit
+def test_evaluate_fails(evaluation_systems_taxonomy, tmp_path):
+    with pytest.raises(SystemExit):
+        evaluate_manifest(evaluation_systems_taxonomy, f"{tmp_path}/taxonomy.yml")
+
+
+@pytest.mark.unit
+def test_evaluate_echoes_only_violations_to_stdout(
+    evaluation_systems_taxonomy, tmp_path, capsys
+):
+    with pytest.raises(SystemExit):
+        evaluate_manifest(evaluation_systems_taxonomy, f"{tmp_path}/taxonomy.yml")
+    captured = capsys.readouterr()
+    violations = [json.loads(line) for line in captured.out.splitlines()]
+    assert violations
+    assert all(violation["policy"] == "policy_1" for violation in violations)
+    assert "Evaluation failed!" in captured.err
+
+
+@pytest.mark.unit
+def test_evaluate_local_taxonomy(evaluation_systems_taxonomy, tmp_path):
+    evaluation_systems_taxonomy.system = []
+    with requests_mock.Mocker() as mocker:
+        mocker.post(requests_mock.ANY, json=[])
+        summary = evaluate.evaluate(
+            url="http://localhost",
+            manifests_dir=f"{tmp_path}/missing",
+            fides_key="policy_1",
+            headers={},
+            message="",
+            dry=True,
+            local_taxonomy=LazyTaxonomy.from_taxonomy(evaluation_systems_taxonomy),
+        )
+    assert summary.status == "PASS"
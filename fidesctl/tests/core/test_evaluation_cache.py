@@ -0,0 +1,60 @@
+import pytest
+
+from fidesctl.core.evaluation_cache import EvaluationCache
+from fideslang.models import DataCategory
+
+
+@pytest.mark.unit
+def test_evaluation_cache_key_changes_with_content():
+    evaluation_cache = EvaluationCache("", "version_1", {})
+    data_category = DataCategory(fides_key="data_category")
+    cache_key = evaluation_cache.get_key("policy_1", data_category)
+
+    assert cache_key == evaluation_cache.get_key(
+        "policy_1", DataCategory(fides_key="data_category")
+    )
+    assert cache_key != evaluation_cache.get_key(
+        "policy_1", DataCategory(fides_key="data_category", name="changed")
+    )
+    assert cache_key != EvaluationCache("", "version_2", {}).get_key(
+        "policy_1", data_category
+    )
+
+
+@pytest.mark.unit
+def test_evaluation_cache_save_and_load(tmp_path):
+    evaluation_cache = EvaluationCache.load(str(tmp_path), "version_1")
+    assert evaluation_cache.get("used") is None
+    evaluation_cache.add(
+        "used", [["policy_1", "rule_1", "system_1", "declaration_1", None, None]]
+    )
+    evaluation_cache.add(
+        "unused", [["policy_1", "rule_1", "system_2", "declaration_1", None, None]]
+    )
+    evaluation_cache.save()
+
+    loaded_cache = EvaluationCache.load(str(tmp_path), "version_1")
+    assert loaded_cache.entries == {
+        "used": [["policy_1", "rule_1", "system_1", "declaration_1", None, None]]
+    }
+    assert loaded_cache.get("used") == [
+        ["policy_1", "rule_1", "system_1", "declaration_1", None, None]
+    ]
+    assert (loaded_cache.hits, loaded_cache.misses) == (1, 0)
+
+
+@pytest.mark.unit
+def test_evaluation_cache_apply_update():
+    evaluation_cache = EvaluationCache("", "version_1", {})
+    worker_cache = EvaluationCache("", "version_1", {})
+    worker_cache.get("key")
+    worker_cache.add(
+        "key", [["policy_1", "rule_1", "system_1", "declaration_1", None, None]]
+    )
+
+    evaluation_cache.apply_update(worker_cache.pop_update())
+    assert evaluation_cache.entries == {
+        "key": [["policy_1", "rule_1", "system_1", "declaration_1", None, None]]
+    }
+    assert evaluation_cache.used_keys == {"key"}
+    assert (evaluation_cache.misses, worker_cache.misses) == (1, 0)
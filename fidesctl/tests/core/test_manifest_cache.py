@@ -0,0 +1,82 @@
+import os
+
+import pytest
+import yaml
+
+from fidesctl.core import parse as _parse
+from fidesctl.core.manifest_cache import CACHE_FILE_NAME, ManifestCache
+
+
+@pytest.fixture()
+def cached_manifest_dir(tmp_path):
+    manifest_dir = tmp_path / "manifests"
+    manifest_dir.mkdir()
+    for fides_key in ["data_category_1", "data_category_2"]:
+        with open(manifest_dir / f"{fides_key}.yml", "w") as manifest_file:
+            yaml.dump({"data_category": [{"fides_key": fides_key}]}, manifest_file)
+    yield str(manifest_dir)
+
+
+@pytest.mark.unit
+def test_manifest_cache_hits_unchanged_files(cached_manifest_dir, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    taxonomy = _parse.parse(cached_manifest_dir, cache_dir=cache_dir)
+    cached_taxonomy = _parse.parse(cached_manifest_dir, cache_dir=cache_dir)
+
+    assert cached_taxonomy == taxonomy == _parse.parse(cached_manifest_dir)
+    manifest_cache = ManifestCache.load(cache_dir)
+    assert sorted(manifest_cache.entries) == [
+        os.path.join(cached_manifest_dir, "data_category_1.yml"),
+        os.path.join(cached_manifest_dir, "data_category_2.yml"),
+    ]
+
+
+@pytest.mark.unit
+def test_manifest_cache_misses_changed_files(cached_manifest_dir, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    file_path = os.path.join(cached_manifest_dir, "data_category_1.yml")
+    _parse.parse(cached_manifest_dir, cache_dir=cache_dir)
+
+    with open(file_path, "w") as manifest_file:
+        yaml.dump({"data_category": [{"fides_key": "changed_1"}]}, manifest_file)
+    manifest_cache = ManifestCache.load(cache_dir)
+    assert manifest_cache.get(file_path)[0] is None
+    assert (manifest_cache.hits, manifest_cache.misses) == (0, 1)
+
+    taxonomy = _parse.parse(cached_manifest_dir, cache_dir=cache_dir)
+    assert sorted(category.fides_key for category in taxonomy.data_category) == [
+        "changed_1",
+        "data_category_2",
+    ]
+
+
+@pytest.mark.unit
+def test_manifest_cache_hits_touched_files(cached_manifest_dir, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    file_path = os.path.join(cached_manifest_dir, "data_category_1.yml")
+    _parse.parse(cached_manifest_dir, cache_dir=cache_dir)
+
+    file_stat = os.stat(file_path)
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
+    manifest_cache = ManifestCache.load(cache_dir)
+    cached_resources, file_entry = manifest_cache.get(file_path)
+
+    assert cached_resources["data_category"][0].fides_key == "data_category_1"
+    assert file_entry.mtime_ns == file_stat.st_mtime_ns + 10**9
+    assert (manifest_cache.hits, manifest_cache.misses) == (1, 0)
+
+
+@pytest.mark.unit
+def test_manifest_cache_ignores_stale_pickles(cached_manifest_dir, tmp_path, capsys):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    # A pickle of a class that no longer exists fails with an AttributeError
+    with open(cache_dir / CACHE_FILE_NAME, "wb") as cache_file:
+        cache_file.write(b"cfidesctl.core.manifest_cache\nRemovedClass\n.")
+
+    manifest_cache = ManifestCache.load(str(cache_dir))
+    assert manifest_cache.entries == {}
+    assert "Ignoring the manifest cache" in capsys.readouterr().err
+
+    taxonomy = _parse.parse(cached_manifest_dir, cache_dir=str(cache_dir))
+    assert taxonomy == _parse.parse(cached_manifest_dir)
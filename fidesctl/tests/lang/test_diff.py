@@ -0,0 +1,98 @@
+import pytest
+
+from fideslang.diff import ResourceChange, diff_resources
+from fideslang.models import Dataset, Policy, PolicyRule, PrivacyRule, System
+
+
+def get_dataset(collections):
+    return Dataset(fides_key="test_dataset", collections=collections)
+
+
+@pytest.fixture()
+def dataset():
+    yield get_dataset(
+        [
+            {
+                "name": "users",
+                "fields": [
+                    {"name": "email", "data_categories": ["user.provided"]},
+                    {"name": "name"},
+                ],
+            },
+            {"name": "orders", "fields": [{"name": "total"}]},
+        ]
+    )
+
+
+@pytest.mark.unit
+def test_diff_resources_equal(dataset):
+    assert diff_resources(dataset, dataset.copy(deep=True)) == []
+
+
+@pytest.mark.unit
+def test_diff_resources_matches_items_by_name(dataset):
+    new_dataset = get_dataset(
+        [
+            {
+                "name": "users",
+                "fields": [
+                    {"name": "phone"},
+                    {"name": "email", "data_categories": ["user.derived"]},
+                ],
+            },
+        ]
+    )
+    assert diff_resources(dataset, new_dataset) == [
+        ResourceChange("collections[orders]", "removed"),
+        ResourceChange(
+            "collections[users].fields[email].data_categories",
+            "changed",
+            ["user.provided"],
+            ["user.derived"],
+        ),
+        ResourceChange("collections[users].fields[name]", "removed"),
+        ResourceChange("collections[users].fields[phone]", "added"),
+    ]
+
+
+@pytest.mark.unit
+def test_diff_resources_reordered(dataset):
+    new_dataset = dataset.copy(deep=True)
+    new_dataset.collections.reverse()
+    assert diff_resources(dataset, new_dataset) == [
+        ResourceChange("collections", "reordered")
+    ]
+
+
+@pytest.mark.unit
+def test_diff_resources_matches_unnamed_items_by_position():
+    rule = PolicyRule(
+        fides_key="test_rule",
+        data_categories=PrivacyRule(inclusion="ANY", values=["user"]),
+        data_uses=PrivacyRule(inclusion="ANY", values=["provide"]),
+        data_subjects=PrivacyRule(inclusion="ANY", values=["customer"]),
+        action="REJECT",
+    )
+    old_policy = Policy(fides_key="test_policy", rules=[rule])
+    new_policy = Policy(
+        fides_key="test_policy",
+        rules=[rule.copy(update={"action": "ACCEPT"}), rule],
+    )
+    assert [change.render() for change in diff_resources(old_policy, new_policy)] == [
+        'rules[0].action: "REJECT" -> "ACCEPT"',
+        "rules[1]: added",
+    ]
+
+
+@pytest.mark.unit
+def test_diff_resources_compares_scalar_lists_whole():
+    system = System(
+        fides_key="test_system",
+        system_type="SYSTEM",
+        privacy_declarations=[],
+        system_dependencies=["a", "b"],
+    )
+    new_system = system.copy(update={"system_dependencies": ["b"]})
+    assert [change.render() for change in diff_resources(system, new_system)] == [
+        'system_dependencies: ["a", "b"] -> ["b"]'
+    ]
@@ -0,0 +1,68 @@
+import pytest
+
+from fideslang.models import DataCategory, Dataset, Organization, Taxonomy
+from fideslang.utils import IndexedTaxonomy, get_resource_by_fides_key
+
+
+@pytest.fixture()
+def indexed_taxonomy_resources():
+    yield Taxonomy(
+        data_category=[
+            DataCategory(fides_key="key_1"),
+            DataCategory(fides_key="key_1.key_2", parent_key="key_1"),
+        ],
+        dataset=[Dataset(fides_key="key_1", collections=[])],
+    )
+
+
+@pytest.mark.unit
+def test_indexed_taxonomy_get(indexed_taxonomy_resources):
+    indexed_taxonomy = IndexedTaxonomy(indexed_taxonomy_resources)
+    assert (
+        indexed_taxonomy.get("data_category", "key_1.key_2")
+        is indexed_taxonomy_resources.data_category[1]
+    )
+    assert indexed_taxonomy.get("dataset", "key_1.key_2") is None
+    assert indexed_taxonomy.resource_types["key_1"] == ["data_category", "dataset"]
+
+
+@pytest.mark.unit
+def test_indexed_taxonomy_get_resource_by_fides_key(indexed_taxonomy_resources):
+    indexed_taxonomy = IndexedTaxonomy(indexed_taxonomy_resources)
+    for fides_key in ["key_1", "key_1.key_2", "key_3"]:
+        assert indexed_taxonomy.get_resource_by_fides_key(
+            fides_key
+        ) == get_resource_by_fides_key(indexed_taxonomy_resources, fides_key)
+
+
+@pytest.mark.unit
+def test_indexed_taxonomy_add_resources(indexed_taxonomy_resources):
+    indexed_taxonomy = IndexedTaxonomy(indexed_taxonomy_resources)
+    organization = Organization(fides_key="organization_1")
+    indexed_taxonomy.add_resources("organization", [organization])
+
+    assert indexed_taxonomy_resources.organization == [organization]
+    assert indexed_taxonomy.get("organization", "organization_1") is organization
+    assert indexed_taxonomy.resource_types["organization_1"] == ["organization"]
+
+
+@pytest.mark.unit
+def test_indexed_taxonomy_add_resources_skips_duplicates(indexed_taxonomy_resources):
+    indexed_taxonomy = IndexedTaxonomy(indexed_taxonomy_resources)
+    first_category = indexed_taxonomy_resources.data_category[0]
+    duplicate_category = DataCategory(fides_key="key_1", name="Duplicate")
+    new_category = DataCategory(fides_key="key_3")
+
+    added_resources = indexed_taxonomy.add_resources(
+        "data_category", [duplicate_category, new_category, new_category]
+    )
+
+    assert added_resources == [new_category]
+    assert [
+        category.fides_key for category in indexed_taxonomy_resources.data_category
+    ] == ["key_1", "key_1.key_2", "key_3"]
+    assert indexed_taxonomy.get("data_category", "key_1") is first_category
+    assert get_resource_by_fides_key(indexed_taxonomy_resources, "key_1") == {
+        "data_category": first_category,
+        "dataset": indexed_taxonomy_resources.dataset[0],
+    }
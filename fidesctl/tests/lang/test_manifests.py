@@ -155,3 +155,85 @@ def test_ingest_manifests(ingestion_manifest_directory):
             "fides_key": "another_system",
         },
     ]
+
+
+@pytest.mark.unit
+def test_ingest_manifests_parallel(populated_nested_manifest_dir):
+    with open(f"{populated_nested_manifest_dir}/extra.yaml", "w") as manifest_file:
+        yaml.dump({"system": [{"fides_key": "extra_system"}]}, manifest_file)
+    with open(f"{populated_nested_manifest_dir}/notes.txt", "w") as notes_file:
+        notes_file.write("system: []")
+
+    sequential_result = manifests.ingest_manifests(populated_nested_manifest_dir)
+    parallel_result = manifests.ingest_manifests(populated_nested_manifest_dir, jobs=2)
+
+    assert parallel_result == sequential_result
+    assert len(parallel_result["system"]) == 3
+    assert parallel_result["system"][-1] == {"fides_key": "extra_system"}
+
+
+@pytest.mark.unit
+def test_iter_manifest_resources(populated_manifest_dir):
+    for file_name in ["manifest_1.yml", "manifest_2.yml"]:
+        file_path = f"{populated_manifest_dir}/{file_name}"
+        manifest = manifests.load_yaml_into_dict(file_path)
+        expected_resources = [
+            (resource_type, resource)
+            for resource_type, resource_list in manifest.items()
+            for resource in resource_list
+        ]
+        assert list(manifests.iter_manifest_resources(file_path)) == (
+            expected_resources
+        )
+
+
+@pytest.mark.unit
+def test_iter_manifest_resources_parse_collection(tmp_path):
+    file_path = f"{tmp_path}/dataset.yml"
+    with open(file_path, "w") as manifest_file:
+        manifest_file.write(
+            "dataset:\n"
+            "- collections:\n"
+            "  - name: collection_1\n"
+            "  - name: collection_2\n"
+            "  fides_key: dataset_1\n"
+            "  description: after the collections\n"
+            "- fides_key: dataset_2\n"
+            "  collections: []\n"
+        )
+
+    parsed_collections = []
+
+    def parse_collection(collection):
+        parsed_collections.append(collection["name"])
+        return collection["name"]
+
+    datasets = manifests.iter_manifest_resources(
+        file_path, parse_collection=parse_collection
+    )
+    assert next(datasets) == (
+        "dataset",
+        {
+            "collections": ["collection_1", "collection_2"],
+            "fides_key": "dataset_1",
+            "description": "after the collections",
+        },
+    )
+    assert parsed_collections == ["collection_1", "collection_2"]
+    assert list(datasets) == [
+        ("dataset", {"fides_key": "dataset_2", "collections": []})
+    ]
+
+
+@pytest.mark.unit
+def test_write_manifest_resources(tmp_path):
+    test_resources = [{"foo": "bar", "bar": ["baz"]}, {"foo": "baz"}]
+    for resources in [test_resources, []]:
+        manifests.write_manifest(f"{tmp_path}/expected.yml", resources, "test")
+        manifests.write_manifest_resources(
+            f"{tmp_path}/actual.yml", iter(resources), "test"
+        )
+
+        with open(f"{tmp_path}/expected.yml", "r") as expected_manifest:
+            with open(f"{tmp_path}/actual.yml", "r") as actual_manifest:
+                assert actual_manifest.read() == expected_manifest.read()
@@ -1,9 +1,14 @@
+import json
+
 import pytest
+from fastapi.openapi.models import Schema as OpenAPISchema
 from pydantic import ValidationError
 
 from fideslang.models import (
     DataCategory,
     DataUse,
+    Evaluation,
+    EvaluationViolation,
     FidesModel,
     Policy,
     PolicyRule,
@@ -256,3 +261,91 @@ def test_circular_dependency_system():
             system_dependencies=["test_system"],
         )
     assert True
+
+
+@pytest.mark.unit
+def test_evaluation_violations_round_trip():
+    evaluation = Evaluation(
+        fides_key="test_evaluation",
+        status="FAIL",
+        violations=[
+            EvaluationViolation(
+                policy="test_policy",
+                rule="test_rule",
+                system="test_system",
+                declaration="declaration-name",
+            ),
+            EvaluationViolation(
+                policy="test_policy",
+                rule="test_rule",
+                system="test_system",
+                declaration="declaration-name",
+                target_type="DatasetField",
+                target_path=("test_dataset", "test_collection", "test_field"),
+            ),
+        ],
+    )
+    assert Evaluation.parse_raw(evaluation.json()) == evaluation
+    assert [violation.render() for violation in evaluation.violations] == [
+        "Declaration (declaration-name) of System (test_system) failed Rule (test_rule) from Policy (test_policy)",
+        "Declaration (declaration-name) of System (test_system) failed Rule (test_rule) from Policy (test_policy) for DatasetField (test_field)",
+    ]
+
+
+@pytest.mark.unit
+def test_evaluation_violations_serialized_as_objects():
+    evaluation = Evaluation(
+        fides_key="test_evaluation",
+        status="FAIL",
+        violations=[
+            {
+                "policy": "test_policy",
+                "rule": "test_rule",
+                "system": "test_system",
+                "declaration": "declaration-name",
+            }
+        ],
+    )
+    assert evaluation.violations == [
+        EvaluationViolation(
+            policy="test_policy",
+            rule="test_rule",
+            system="test_system",
+            declaration="declaration-name",
+        )
+    ]
+    assert evaluation.dict()["violations"] == [
+        {
+            "policy": "test_policy",
+            "rule": "test_rule",
+            "system": "test_system",
+            "declaration": "declaration-name",
+            "target_type": None,
+            "target_path": (),
+        }
+    ]
+    assert json.loads(evaluation.json())["violations"] == [
+        {
+            "policy": "test_policy",
+            "rule": "test_rule",
+            "system": "test_system",
+            "declaration": "declaration-name",
+            "target_type": None,
+            "target_path": [],
+        }
+    ]
+
+
+@pytest.mark.unit
+def test_evaluation_schema_is_valid_openapi():
+    violations_schema = OpenAPISchema.parse_obj(Evaluation.schema()).properties[
+        "violations"
+    ]
+    assert violations_schema.items.type == "object"
+    assert list(violations_schema.items.properties) == list(EvaluationViolation._fields)
+    assert violations_schema.items.required == [
+        "policy",
+        "rule",
+        "system",
+        "declaration",
+    ]
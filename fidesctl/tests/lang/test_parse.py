@@ -2,7 +2,7 @@ from fideslang import validation
 import pytest
 
 import fideslang as models
-from fideslang import parse, validation
+from fideslang import manifests, parse, validation
 
 
 @pytest.mark.unit
@@ -82,3 +82,74 @@ def test_load_manifests_into_taxonomy():
         ]
     )
     assert parse.load_manifests_into_taxonomy(manifest_dict) == expected_taxonomy
+
+
+@pytest.mark.unit
+def test_lazy_taxonomy_only_parses_used_resources():
+    lazy_taxonomy = parse.LazyTaxonomy(
+        {
+            "data_category": [
+                {"fides_key": "data_category_1"},
+                {"name": "missing a fides_key"},
+            ],
+            "data_use": [{"fides_key": "data_use_1"}],
+        }
+    )
+    data_category = lazy_taxonomy.get_resource("data_category", "data_category_1")
+
+    assert data_category == models.DataCategory(fides_key="data_category_1")
+    assert lazy_taxonomy.get_resource("data_category", "data_category_1") is (
+        data_category
+    )
+    assert lazy_taxonomy.get_resource("data_category", "data_category_2") is None
+    assert lazy_taxonomy.get_resources("data_use") == [
+        models.DataUse(fides_key="data_use_1")
+    ]
+    assert lazy_taxonomy.get_resources("system") == []
+    with pytest.raises(SystemExit):
+        lazy_taxonomy.get_resources("data_category")
+
+
+@pytest.mark.unit
+def test_lazy_taxonomy_from_taxonomy():
+    taxonomy = models.Taxonomy(
+        data_category=[models.DataCategory(fides_key="data_category_1")]
+    )
+    lazy_taxonomy = parse.LazyTaxonomy.from_taxonomy(taxonomy)
+    assert lazy_taxonomy.get_resource("data_category", "data_category_1") is (
+        taxonomy.data_category[0]
+    )
+    assert lazy_taxonomy.get_resources("system") == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "file_path",
+    ["tests/data/failing_dataset_taxonomy.yml", "demo_resources/demo_dataset.yml"],
+)
+def test_parse_manifest_file(file_path):
+    expected_result = parse.parse_manifest(manifests.load_yaml_into_dict(file_path))
+    assert parse.parse_manifest_file(file_path) == expected_result
+
+
+@pytest.mark.unit
+def test_parse_manifest_file_keys_after_collections(tmp_path):
+    file_path = f"{tmp_path}/dataset.yml"
+    with open(file_path, "w") as manifest_file:
+        manifest_file.write(
+            "dataset:\n"
+            "- collections:\n"
+            "  - name: users\n"
+            "    fields:\n"
+            "    - name: email\n"
+            "  fides_key: test_dataset\n"
+            "  description: after the collections\n"
+            "  data_categories:\n"
+            "  - user.provided\n"
+            "  meta:\n"
+            "    owner: data\n"
+        )
+
+    expected_result = parse.parse_manifest(manifests.load_yaml_into_dict(file_path))
+    assert parse.parse_manifest_file(file_path) == expected_result
+    assert expected_result["dataset"][0].description == "after the collections"
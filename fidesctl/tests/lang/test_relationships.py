@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from fideslang import relationships
+from fideslang.parse import LazyTaxonomy
 
 from fideslang.models import (
     DataCategory,
@@ -111,6 +114,81 @@ def test_get_referenced_missing_privacy_declaration_keys():
     assert sorted(referenced_keys) == sorted(set(expected_referenced_key))
 
 
+@pytest.mark.unit
+def test_get_reference_extraction_plan():
+    plan = relationships.get_reference_extraction_plan(System)
+    assert plan == relationships.ReferenceExtractionPlan(
+        key_fields=("fides_key", "organization_fides_key"),
+        key_list_fields=("system_dependencies",),
+        nested_fields=(),
+        nested_list_fields=("privacy_declarations",),
+    )
+    assert relationships.get_reference_extraction_plan(System) is plan
+
+
+@pytest.mark.unit
+def test_find_referenced_fides_keys_by_type():
+    test_system = System(
+        fides_key="system_1",
+        system_type="system_type_1",
+        system_dependencies=["system_2"],
+        privacy_declarations=[
+            PrivacyDeclaration(
+                name="privacy_declaration_1",
+                data_categories=["data_category_1"],
+                data_use="data_use_1",
+                data_qualifier="data_qualifier_1",
+                data_subjects=["data_subject_1"],
+                dataset_references=["dataset_1"],
+            )
+        ],
+    )
+    expected_referenced_keys = {
+        "system": {"system_1", "system_2"},
+        "organization": {"default_organization"},
+        "data_category": {"data_category_1"},
+        "data_use": {"data_use_1"},
+        "data_qualifier": {"data_qualifier_1"},
+        "data_subject": {"data_subject_1"},
+        "dataset": {"dataset_1"},
+    }
+    referenced_keys = relationships.find_referenced_fides_keys_by_type(
+        test_system, "system"
+    )
+    assert referenced_keys == expected_referenced_keys
+
+
+@pytest.mark.unit
+def test_get_referenced_missing_keys_by_type():
+    taxonomy = Taxonomy(
+        data_category=[
+            DataCategory(
+                name="test_dc",
+                fides_key="key_1.test_dc",
+                description="test description",
+                parent_key="key_1",
+            ),
+        ],
+        system=[
+            System.construct(
+                name="test_system",
+                fides_key="test_system",
+                description="test description",
+                system_dependencies=["key_4", "key_3"],
+                system_type="test",
+                privacy_declarations=None,
+            )
+        ],
+    )
+    expected_referenced_keys = {
+        "data_category": ["key_1"],
+        "organization": ["default_organization"],
+        "system": ["key_3", "key_4"],
+    }
+    referenced_keys = relationships.get_referenced_missing_keys_by_type(taxonomy)
+    assert referenced_keys == expected_referenced_keys
+
+
 @pytest.mark.unit
 def test_get_referenced_missing_policy_keys():
     taxonomy = Taxonomy(
@@ -189,6 +267,117 @@ def test_get_referenced_missing_dataset_keys():
     assert sorted(referenced_keys) == sorted(set(expected_referenced_key))
 
 
+@pytest.mark.unit
+def test_hydrate_referenced_resources_worklist():
+    server_categories = {
+        "key_1.key_2.key_3": DataCategory(
+            fides_key="key_1.key_2.key_3", parent_key="key_1.key_2"
+        ),
+        "key_1.key_2": DataCategory(fides_key="key_1.key_2", parent_key="key_1"),
+        "key_1": DataCategory(fides_key="key_1"),
+    }
+    requested_keys = []
+
+    def get_server_resources_concurrently(url, resource_keys, headers):
+        requested_keys.append(resource_keys)
+        return {
+            resource_type: [
+                server_categories[fides_key]
+                for fides_key in fides_keys
+                if fides_key in server_categories
+            ]
+            for resource_type, fides_keys in resource_keys.items()
+        }
+
+    dehydrated_taxonomy = Taxonomy(
+        system=[
+            System(
+                fides_key="system_1",
+                system_type="system_type_1",
+                privacy_declarations=[
+                    PrivacyDeclaration(
+                        name="privacy_declaration_1",
+                        data_categories=["key_1.key_2.key_3"],
+                        data_use="data_use_1",
+                        data_subjects=["data_subject_1"],
+                    )
+                ],
+            )
+        ]
+    )
+    with patch.object(
+        relationships,
+        "get_server_resources_concurrently",
+        get_server_resources_concurrently,
+    ):
+        hydrated_taxonomy = relationships.hydrate_referenced_resources(
+            url="http://localhost:8080",
+            headers={},
+            dehydrated_taxonomy=dehydrated_taxonomy,
+        )
+
+    assert requested_keys == [
+        {
+            "data_category": ["key_1.key_2.key_3"],
+            "data_qualifier": [
+                "aggregated.anonymized.unlinked_pseudonymized.pseudonymized.identified"
+            ],
+            "data_subject": ["data_subject_1"],
+            "data_use": ["data_use_1"],
+            "organization": ["default_organization"],
+        },
+        {"data_category": ["key_1.key_2"]},
+        {"data_category": ["key_1"]},
+    ]
+    assert [category.fides_key for category in hydrated_taxonomy.data_category] == [
+        "key_1.key_2.key_3",
+        "key_1.key_2",
+        "key_1",
+    ]
+
+
+@pytest.mark.unit
+def test_hydrate_referenced_resources_from_local_taxonomy():
+    requested_keys = []
+
+    def get_server_resources_concurrently(url, resource_keys, headers):
+        requested_keys.append(resource_keys)
+        return {resource_type: [] for resource_type in resource_keys}
+
+    local_taxonomy = LazyTaxonomy(
+        {
+            "data_category": [
+                {"fides_key": "key_1"},
+                {"fides_key": "key_1.key_2", "parent_key": "key_1"},
+            ],
+            "data_use": [{"name": "unreferenced and invalid"}],
+        }
+    )
+    dehydrated_taxonomy = Taxonomy(
+        data_category=[
+            DataCategory(fides_key="key_1.key_2.key_3", parent_key="key_1.key_2")
+        ]
+    )
+    with patch.object(
+        relationships,
+        "get_server_resources_concurrently",
+        get_server_resources_concurrently,
+    ):
+        hydrated_taxonomy = relationships.hydrate_referenced_resources(
+            url="http://localhost:8080",
+            headers={},
+            dehydrated_taxonomy=dehydrated_taxonomy,
+            local_taxonomy=local_taxonomy,
+        )
+
+    assert requested_keys == [{"organization": ["default_organization"]}]
+    assert [category.fides_key for category in hydrated_taxonomy.data_category] == [
+        "key_1.key_2.key_3",
+        "key_1.key_2",
+        "key_1",
+    ]
+
+
 @pytest.mark.integration
 def test_hydrate_missing_resources(test_config):
     dehydrated_taxonomy = Taxonomy(
@@ -216,8 +405,10 @@ def test_hydrate_missing_resources(test_config):
         headers=test_config.user.request_headers,
         dehydrated_taxonomy=dehydrated_taxonomy,
         missing_resource_keys={
-            "user.provided.identifiable.credentials",
-            "user.provided",
+            "data_category": [
+                "user.provided.identifiable.credentials",
+                "user.provided",
+            ]
         },
     )
     assert len(actual_hydrated_taxonomy.data_category) == 3